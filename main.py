@@ -1,10 +1,34 @@
 """Main entry point for the game"""
-from src.game import Game
+import argparse
+import asyncio
+from src.config import SWARM_SIZE
+from src.game import WEB, Game
 
 def main():
-    game = Game()
+    parser = argparse.ArgumentParser(description="PAC-MAN - Retro Futuristic Edition")
+    parser.add_argument("--turbo", type=int, default=1,
+                        help="simulation ticks per tick of real time (fast-forward)")
+    parser.add_argument("--render-skip", action="store_true",
+                        help="simulate as fast as possible and only draw about once a second")
+    parser.add_argument("--profile", action="store_true",
+                        help="start with the frame profiler overlay on (F3 toggles it)")
+    parser.add_argument("--swarm", type=int, default=SWARM_SIZE, metavar="N",
+                        help="swarm mode: play against N ghosts instead of four")
+    parser.add_argument("--autopilot", action="store_true",
+                        help="let the lookahead bot play (Tab toggles it)")
+    parser.add_argument("--async", dest="use_async", action="store_true",
+                        help="use the browser build's asyncio loop (always on under pygbag)")
+    args = parser.parse_args()
+
+    game = Game(turbo=args.turbo, render_skip=args.render_skip, swarm=args.swarm,
+                autopilot=args.autopilot)
+    if args.profile:
+        game.set_profiling(True)
     try:
-        game.run()
+        if WEB or args.use_async:
+            asyncio.run(game.run_async())
+        else:
+            game.run()
     finally:
         game.quit()
 
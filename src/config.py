@@ -3,7 +3,35 @@
 # Screen settings
 SCREEN_WIDTH = 800
 SCREEN_HEIGHT = 900
-FPS = 60
+FPS = 60  # display frame cap; gameplay runs on the fixed simulation tick below
+DIRTY_RECT_RENDERING = True  # Redraw only the screen regions that changed while playing
+
+# Simulation timing
+SIM_TICK_RATE = 60  # fixed simulation ticks per second, independent of display FPS
+SIM_DT = 1.0 / SIM_TICK_RATE
+MAX_FRAME_TIME = 0.25  # seconds of real time simulated at most per frame (avoids spiral of death)
+TURBO_SPEEDS = (1, 2, 4, 8, 16)  # fast-forward multipliers, cycled with F
+RENDER_INTERPOLATION = True  # Draw entities between their last two tick positions
+RENDER_SKIP_INTERVAL = 1000  # milliseconds between frames drawn in render-skip mode
+
+# Adaptive quality: effects step down while frames run over budget, back up with headroom
+QUALITY_GOVERNOR = True
+FRAME_BUDGET = 1.0 / FPS  # seconds of update + render work per frame
+QUALITY_DEGRADE_LOAD = 0.9  # fraction of the budget in use that steps quality down
+QUALITY_RESTORE_LOAD = 0.6  # fraction of the budget in use that steps it back up
+QUALITY_HOLD_FRAMES = 30  # frames a quality level is kept before the next step
+QUALITY_PARTICLE_CAP = 2  # particles per effect burst once emission is capped
+QUALITY_HUD_INTERVAL = 6  # frames between HUD redraws at reduced quality
+QUALITY_RENDER_SKIP = 2  # frames per rendered frame at the lowest quality
+
+# Profiling
+PROFILER_ENABLED = False  # Time subsystems every frame from startup (F3 toggles it in game)
+PROFILER_FRAMES = 600  # frames kept in the profiler's ring buffer
+PROFILER_REFRESH = 30  # frames between overlay updates
+
+# Replays
+REPLAY_KEYFRAME_INTERVAL = SIM_TICK_RATE * 10  # ticks between full-state keyframes
+REPLAY_DIR = None  # directory to save each finished game's replay to (None: don't save)
 
 # Colors (Retro-Futuristic palette)
 BLACK = (10, 10, 15)
@@ -20,6 +48,12 @@ GRAY = (128, 128, 128)
 TILE_SIZE = 25
 MAZE_WIDTH = 28  # Classic Pac-Man dimensions
 MAZE_HEIGHT = 31
+MAZE_CACHE_SIZE = 16  # generated mazes (layout, navigation, wall chunks) kept by seed
+MAZE_GROWTH = 2  # tiles added to each side of the generated maze per level
+MAZE_MAX_SIZE = (256, 255)  # largest generated maze (width, height)
+MAZE_CHUNK_TILES = 16  # mazes are drawn in square chunks of this many tiles
+MAZE_CHUNK_CACHE = 32  # rendered chunks kept per maze (and wall chunks per layout)
+VIEWPORT = (0, 100, SCREEN_WIDTH, SCREEN_HEIGHT - 100)  # screen area the maze is shown in
 
 # Player settings
 PLAYER_SPEED = 2.5
@@ -29,8 +63,16 @@ PLAYER_RADIUS = 10
 GHOST_SPEED = 2.0
 GHOST_FRIGHTENED_SPEED = 1.5
 GHOST_RADIUS = 10
+SWARM_SIZE = 0  # swarm mode: this many array-driven ghosts replace the four (0 = off)
+
+# Autopilot (lookahead bot for soak tests and attract mode, toggled with Tab)
+AUTOPILOT_BUDGET_MS = 2.0  # search time per rendered frame
+AUTOPILOT_STEP_TICKS = 10  # ticks a searched move holds its direction (about one tile)
 
 # Game mechanics
 POWER_PELLET_DURATION = 8000  # milliseconds
 INVINCIBILITY_FLASH_SPEED = 100  # milliseconds
 LEVEL_CLEAR_DELAY = 2000  # milliseconds
+
+# Effects
+MAX_PARTICLES = 2048  # hard cap on live particles; emits beyond it are dropped
@@ -2,9 +2,10 @@
 import pygame
 import random
 from src.config import *
+from src.levels.navigation import DIRECTION_BITS, MASK_DIRECTIONS, UNREACHABLE
 
 class Ghost:
-    def __init__(self, x, y, color, name, maze):
+    def __init__(self, x, y, color, name, maze, rng=None):
         self.x = x
         self.y = y
         self.start_x = x
@@ -20,6 +21,7 @@ class Ghost:
         self.target = (0, 0)
         self.mode_timer = 0
         self.mode_duration = 7000  # Switch modes every 7 seconds
+        self.rng = rng or random  # random.Random instance for reproducible runs
 
     def update(self, dt, player):
         """Update ghost behavior"""
@@ -69,47 +71,42 @@ class Ghost:
             self.choose_direction()
 
         # Wrap around edges
-        self.x = self.x % (MAZE_WIDTH * TILE_SIZE)
+        self.x = self.x % self.maze.pixel_width
 
     def can_move(self, direction):
         """Check if movement is valid"""
-        if direction == (0, 0):
-            return False
-
-        next_x = self.x + direction[0] * (self.radius + 2)
-        next_y = self.y + direction[1] * (self.radius + 2)
-
-        grid_x = int(next_x / TILE_SIZE)
-        grid_y = int(next_y / TILE_SIZE)
-
-        return self.maze.is_walkable(grid_x, grid_y)
+        return self.maze.nav.can_move(self.x, self.y, direction, self.radius + 2)
 
     def choose_direction(self):
         """Choose next direction"""
-        directions = [(0, -1), (0, 1), (-1, 0), (1, 0)]  # up, down, left, right
-        valid_dirs = [d for d in directions if self.can_move(d) and d != self.reverse_direction()]
-
-        if not valid_dirs:
-            # If no valid direction except reverse, allow reverse
-            valid_dirs = [d for d in directions if self.can_move(d)]
+        open_dirs = self.maze.nav.open_directions(self.x, self.y, self.radius + 2)
+        reverse = DIRECTION_BITS.get(self.reverse_direction(), 0)
+        # If no valid direction except reverse, allow reverse
+        valid_dirs = MASK_DIRECTIONS[open_dirs & ~reverse] or MASK_DIRECTIONS[open_dirs]
 
         if valid_dirs:
             if self.state == "frightened":
-                self.direction = random.choice(valid_dirs)
+                self.direction = self.rng.choice(valid_dirs)
             else:
-                # Choose direction closest to target
-                best_dir = valid_dirs[0]
-                best_dist = float('inf')
+                # Choose the direction with the shortest path to the target
+                nav = self.maze.nav
+                field = self.maze.distance_field(self.target)
+                tile = int(self.y // TILE_SIZE) * nav.width + int(self.x // TILE_SIZE)
+                best_dir = None
+                best_dist = UNREACHABLE
 
                 for d in valid_dirs:
-                    next_x = self.x + d[0] * TILE_SIZE
-                    next_y = self.y + d[1] * TILE_SIZE
-                    dist = ((next_x - self.target[0])**2 + (next_y - self.target[1])**2)**0.5
-
+                    dist = field[nav.neighbor_index(tile, d)]
                     if dist < best_dist:
                         best_dist = dist
                         best_dir = d
 
+                if best_dir is None:
+                    # No path from here (e.g. boxed in): head straight for the target
+                    best_dir = min(valid_dirs, key=lambda d:
+                                   (self.x + d[0] * TILE_SIZE - self.target[0]) ** 2 +
+                                   (self.y + d[1] * TILE_SIZE - self.target[1]) ** 2)
+
                 self.direction = best_dir
 
     def reverse_direction(self):
@@ -134,7 +131,7 @@ class Ghost:
         self.mode_timer = 0
 
     def render(self, screen, offset_x=0, offset_y=0):
-        """Render the ghost"""
+        """Render the ghost and return the screen rect it covers"""
         px = offset_x + int(self.x)
         py = offset_y + int(self.y)
 
@@ -151,7 +148,7 @@ class Ghost:
             color = GRAY
 
         # Draw ghost body
-        pygame.draw.circle(screen, color, (px, py), self.radius)
+        rect = pygame.draw.circle(screen, color, (px, py), self.radius)
 
         # Draw eyes (unless eaten)
         if self.state != "eaten":
@@ -161,3 +158,5 @@ class Ghost:
                              (px - eye_offset, py - 2), eye_size)
             pygame.draw.circle(screen, WHITE if self.state != "frightened" else BLACK,
                              (px + eye_offset, py - 2), eye_size)
+
+        return rect
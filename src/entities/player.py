@@ -1,6 +1,7 @@
 """Pac-Man player entity"""
 import pygame
 from src.config import *
+from src.levels.navigation import DIRECTION_BITS
 
 class Player:
     def __init__(self, x, y, maze):
@@ -16,6 +17,13 @@ class Player:
         self.powered_up = False
         self.power_timer = 0
 
+        # Power-up item effects (applied and removed by PowerUpManager)
+        self.powerup_type = None
+        self.powerup_timer = 0
+        self.original_speed = PLAYER_SPEED
+        self.has_shield = False
+        self.freeze_active = False
+
     def handle_input(self):
         """Handle keyboard input"""
         keys = pygame.key.get_pressed()
@@ -32,16 +40,17 @@ class Player:
     def update(self, dt):
         """Update player position"""
         # Try to change direction
-        if self.can_move(self.next_direction):
+        open_dirs = self.maze.nav.open_directions(self.x, self.y, self.radius + 2)
+        if open_dirs & DIRECTION_BITS.get(self.next_direction, 0):
             self.direction = self.next_direction
 
         # Move in current direction
-        if self.can_move(self.direction):
+        if open_dirs & DIRECTION_BITS.get(self.direction, 0):
             self.x += self.direction[0] * self.speed
             self.y += self.direction[1] * self.speed
 
         # Wrap around edges
-        self.x = self.x % (MAZE_WIDTH * TILE_SIZE)
+        self.x = self.x % self.maze.pixel_width
 
         # Check for pellet collection
         self.check_pellet_collision()
@@ -54,18 +63,7 @@ class Player:
 
     def can_move(self, direction):
         """Check if movement in direction is valid"""
-        if direction == (0, 0):
-            return False
-
-        # Calculate next position
-        next_x = self.x + direction[0] * (self.radius + 2)
-        next_y = self.y + direction[1] * (self.radius + 2)
-
-        # Convert to grid coordinates
-        grid_x = int(next_x / TILE_SIZE)
-        grid_y = int(next_y / TILE_SIZE)
-
-        return self.maze.is_walkable(grid_x, grid_y)
+        return self.maze.nav.can_move(self.x, self.y, direction, self.radius + 2)
 
     def check_pellet_collision(self):
         """Check and handle pellet collisions"""
@@ -82,13 +80,13 @@ class Player:
             self.power_timer = POWER_PELLET_DURATION
 
     def render(self, screen, offset_x=0, offset_y=0):
-        """Render the player"""
+        """Render the player and return the screen rect it covers"""
         px = offset_x + int(self.x)
         py = offset_y + int(self.y)
 
         # Draw Pac-Man as a circle
         color = NEON_YELLOW if not self.powered_up else NEON_GREEN
-        pygame.draw.circle(screen, color, (px, py), self.radius)
+        rect = pygame.draw.circle(screen, color, (px, py), self.radius)
 
         # Draw mouth (simple animation)
         if self.direction != (0, 0):
@@ -103,3 +101,5 @@ class Player:
                 start_angle = 270 + mouth_angle
             elif self.direction == (0, 1):  # Down
                 start_angle = 90 + mouth_angle
+
+        return rect
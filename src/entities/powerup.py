@@ -2,21 +2,28 @@
 import pygame
 import random
 from src.config import *
+from src.ui.fonts import render_text
+from src.utils.spatial_hash import SpatialHash
+
+POWERUP_RADIUS = 10  # collection radius added to the player's
 
 class PowerUp:
-    def __init__(self, x, y, powerup_type):
+    def __init__(self, x, y, powerup_type, clock=None):
         self.x = x
         self.y = y
         self.type = powerup_type  # "speed", "shield", "freeze"
         self.duration = 5000  # milliseconds
         self.collected = False
-        self.spawn_time = pygame.time.get_ticks()
+        self.clock = clock or pygame.time.get_ticks  # returns milliseconds
+        self.spawn_time = self.clock()
         self.lifetime = 10000  # disappears after 10 seconds
 
     def check_collision(self, player):
         """Check if player collected power-up"""
-        dist = ((self.x - player.x)**2 + (self.y - player.y)**2)**0.5
-        return dist < (player.radius + 10)
+        dx = self.x - player.x
+        dy = self.y - player.y
+        reach = player.radius + POWERUP_RADIUS
+        return dx * dx + dy * dy < reach * reach
 
     def apply_effect(self, player):
         """Apply power-up effect to player"""
@@ -36,12 +43,12 @@ class PowerUp:
 
     def is_expired(self):
         """Check if power-up has expired"""
-        return pygame.time.get_ticks() - self.spawn_time > self.lifetime
+        return self.clock() - self.spawn_time > self.lifetime
 
-    def render(self, screen, offset_x=0, offset_y=0):
-        """Render power-up"""
+    def render(self, screen, offset_x=0, offset_y=0, pulse=True):
+        """Render power-up and return the screen rect it covers"""
         if self.collected:
-            return
+            return None
 
         px = offset_x + int(self.x)
         py = offset_y + int(self.y)
@@ -57,22 +64,27 @@ class PowerUp:
             color = NEON_PURPLE
             symbol = "F"
 
-        # Draw power-up with pulsing effect
-        pulse = abs(pygame.time.get_ticks() % 1000 - 500) / 500  # 0 to 1 and back
-        size = int(12 + pulse * 3)
+        # Draw power-up with pulsing effect (or at a fixed size, at reduced quality)
+        if pulse:
+            size = int(12 + abs(self.clock() % 1000 - 500) / 500 * 3)  # 12 to 15 and back
+        else:
+            size = 13
 
-        pygame.draw.circle(screen, color, (px, py), size)
+        rect = pygame.draw.circle(screen, color, (px, py), size)
         pygame.draw.circle(screen, WHITE, (px, py), size, 2)
 
         # Draw symbol
-        font = pygame.font.Font(None, 24)
-        text = font.render(symbol, True, BLACK)
+        text = render_text(24, symbol, BLACK)
         text_rect = text.get_rect(center=(px, py))
         screen.blit(text, text_rect)
+        return rect
 
 class PowerUpManager:
-    def __init__(self):
+    def __init__(self, clock=None, rng=None):
+        self.clock = clock
+        self.rng = rng or random  # random.Random instance for reproducible runs
         self.powerups = []
+        self.grid = SpatialHash()  # power-ups bucketed by tile for pickup checks
         self.spawn_timer = 0
         self.spawn_interval = 15000  # Spawn every 15 seconds
 
@@ -86,12 +98,15 @@ class PowerUpManager:
             self.spawn_timer = 0
 
         # Update existing power-ups
-        for powerup in self.powerups[:]:
-            if powerup.is_expired():
-                self.powerups.remove(powerup)
-            elif powerup.check_collision(player):
-                powerup.apply_effect(player)
-                self.powerups.remove(powerup)
+        if self.powerups:
+            for powerup in self.powerups[:]:
+                if powerup.is_expired():
+                    self.remove_powerup(powerup)
+
+            for powerup in self.grid.query(player.x, player.y, player.radius + POWERUP_RADIUS):
+                if powerup.check_collision(player):
+                    powerup.apply_effect(player)
+                    self.remove_powerup(powerup)
 
         # Update player power-up effects
         if hasattr(player, 'powerup_timer') and hasattr(player, 'powerup_type') and player.powerup_type:
@@ -109,21 +124,23 @@ class PowerUpManager:
     def spawn_random_powerup(self, maze):
         """Spawn a random power-up in valid location"""
         powerup_types = ["speed", "shield", "freeze"]
-        powerup_type = random.choice(powerup_types)
-
-        # Find valid spawn location
-        attempts = 0
-        while attempts < 50:  # Limit attempts to avoid infinite loop
-            x = random.randint(2, MAZE_WIDTH - 2) * TILE_SIZE + TILE_SIZE // 2
-            y = random.randint(2, MAZE_HEIGHT - 2) * TILE_SIZE + TILE_SIZE // 2
-
-            grid_x = int(x / TILE_SIZE)
-            grid_y = int(y / TILE_SIZE)
-
-            if maze.is_walkable(grid_x, grid_y):
-                self.powerups.append(PowerUp(x, y, powerup_type))
-                break
-            attempts += 1
+        powerup_type = self.rng.choice(powerup_types)
+
+        # Pick a walkable tile away from the outer border
+        spawn_tiles = [(x, y) for x, y in maze.nav.walkable_tiles
+                       if 2 <= x <= maze.width - 2 and 2 <= y <= maze.height - 2]
+        if spawn_tiles:
+            grid_x, grid_y = self.rng.choice(spawn_tiles)
+            x = grid_x * TILE_SIZE + TILE_SIZE // 2
+            y = grid_y * TILE_SIZE + TILE_SIZE // 2
+            powerup = PowerUp(x, y, powerup_type, self.clock)
+            self.powerups.append(powerup)
+            self.grid.insert(powerup)
+
+    def remove_powerup(self, powerup):
+        """Take a power-up off the board"""
+        self.powerups.remove(powerup)
+        self.grid.remove(powerup)
 
     def remove_powerup_effect(self, player, ghosts):
         """Remove power-up effect from player"""
@@ -144,7 +161,11 @@ class PowerUpManager:
 
             player.powerup_type = None
 
-    def render(self, screen, offset_x=0, offset_y=0):
-        """Render all power-ups"""
+    def render(self, screen, offset_x=0, offset_y=0, pulse=True):
+        """Render all power-ups and return the screen rects they cover"""
+        rects = []
         for powerup in self.powerups:
-            powerup.render(screen, offset_x, offset_y)
+            rect = powerup.render(screen, offset_x, offset_y, pulse)
+            if rect:
+                rects.append(rect)
+        return rects
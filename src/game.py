@@ -1,72 +1,274 @@
 """Main game class and loop"""
+import asyncio
+import os
 import pygame
+import random
 import sys
+import time
 from src.config import *
-from src.levels.maze import Maze
-from src.entities.player import Player
-from src.entities.ghost_ai import Blinky, Pinky, Inky, Clyde
-from src.utils.collision import check_ghost_collision
-from src.ui.hud import HUD
+from src.ui.camera import Camera
 from src.ui.menus import MenuManager
-from src.ui.particles import ParticleSystem
-from src.levels.level_manager import LevelManager
-from src.entities.powerup import PowerUpManager
+from src.ui.fonts import render_text
+
+WEB = sys.platform == "emscripten"  # running in the browser (pygbag build)
 
 class Game:
-    def __init__(self):
-        pygame.init()
+    def __init__(self, turbo=1, render_skip=False, swarm=SWARM_SIZE, autopilot=False):
+        # Only the modules the game uses (no audio, joystick or camera); the
+        # game world, HUD and effects are built on first use so the start
+        # menu reaches the screen as soon as the window exists
+        pygame.display.init()
+        pygame.font.init()
         self.screen = pygame.display.set_mode((SCREEN_WIDTH, SCREEN_HEIGHT))
         pygame.display.set_caption("PAC-MAN - Retro Futuristic Edition")
         self.clock = pygame.time.Clock()
         self.running = True
-        self.dt = 0
-
-        # Calculate maze offset to center it
-        maze_pixel_width = MAZE_WIDTH * TILE_SIZE
-        maze_pixel_height = MAZE_HEIGHT * TILE_SIZE
-        self.offset_x = (SCREEN_WIDTH - maze_pixel_width) // 2
-        self.offset_y = (SCREEN_HEIGHT - maze_pixel_height) // 2 + 50  # Extra space for HUD
-
-        # Initialize game objects
-        self.maze = Maze()
-
-        # Spawn player in center-bottom area
-        player_start_x = 14 * TILE_SIZE  # Center of maze
-        player_start_y = 23 * TILE_SIZE  # Bottom area
-        self.player = Player(player_start_x, player_start_y, self.maze)
-
-        # Spawn ghosts in ghost house (center area)
-        ghost_house_y = 14 * TILE_SIZE
-        self.ghosts = [
-            Blinky(13 * TILE_SIZE, ghost_house_y, self.maze),
-            Pinky(14 * TILE_SIZE, ghost_house_y, self.maze),
-            Inky(15 * TILE_SIZE, ghost_house_y, self.maze),
-            Clyde(16 * TILE_SIZE, ghost_house_y, self.maze)
-        ]
-
-        # UI Components
-        self.hud = HUD(SCREEN_WIDTH, SCREEN_HEIGHT)
-        self.menu_manager = MenuManager(SCREEN_WIDTH, SCREEN_HEIGHT)
-        self.particles = ParticleSystem()
 
-        # Game systems
-        self.level_manager = LevelManager()
-        self.powerup_manager = PowerUpManager()
+        # Fixed-timestep loop: real time accumulates and is spent in SIM_DT ticks
+        self.accumulator = 0.0
+        self.alpha = 1.0  # fraction of a tick elapsed since the last one, for interpolation
+        self.turbo = turbo  # simulation ticks per tick of real time
+        self.render_skip = render_skip  # unattended runs: simulate flat out, draw rarely
+        self.last_render = 0
+        self.prev_positions = {}
+        self.particle_time = 0.0  # real seconds of particle motion not yet drawn
+
+        # Maze offset on screen: centred in the viewport, or scrolling with the player
+        self.camera = Camera(VIEWPORT)
+        self.offset_x = self.offset_y = 0
+        self.maze_view = self.camera.view
+
+        # Game world (maze, player, ghosts, power-ups, levels), seeded so it can be replayed
+        self.seed = random.getrandbits(63)
+        self.swarm_size = swarm  # swarm mode: ghosts in the GhostSwarm (0 = the classic four)
+        self._sim = None
+        self.recorder = None
+        self.prev_swarm = None  # swarm positions at the previous tick, for interpolation
+        self._swarm_renderer = None
+
+        # UI Components (menu fonts load when the menu is first drawn)
+        self.menu_manager = MenuManager(SCREEN_WIDTH, SCREEN_HEIGHT)
+        self._hud = None
+        self._particles = None
 
         # Game state
         self.state = "menu"  # menu, playing, paused, game_over
         self.combo = 1
-        self.death_timer = 0
-        self.respawn_delay = 2000  # 2 seconds
-        self.level_complete_timer = 0
+
+        # Dirty-rect rendering: only regions touched last frame or this frame are redrawn
+        self.dirty_rendering = DIRTY_RECT_RENDERING
+        self.needs_full_redraw = True
+        self.rendered_maze = None
+        self.prev_rects = []
+
+        # Frame profiler (None while off, so instrumented code only pays a None check)
+        self.profiler = None
+        self.profiler_overlay = None
+        if PROFILER_ENABLED:
+            self.set_profiling(True)
+
+        # Adaptive quality: effects step down while frames run over budget (None: always full)
+        self.governor = None
+        if QUALITY_GOVERNOR:
+            from src.utils.governor import FrameGovernor
+            self.governor = FrameGovernor()
+        self.hud_rects = []  # HUD's screen rects, left on screen until it is next redrawn
+
+        # Next level's maze, built a slice per frame so the level change is a cache hit
+        self.prefetch = None  # prepare_next_maze() generator, None once done
+        self.prefetch_seed = None  # the next_seed it builds for
+
+        # Lookahead bot steering the player (None while off)
+        self.autopilot = None
+        if autopilot:
+            self.set_autopilot(True)
+
+    @property
+    def sim(self):
+        """Headless game world, created (with its input recorder) on first use"""
+        if self._sim is None:
+            self.load_world()
+        return self._sim
+
+    @property
+    def hud(self):
+        """Heads-up display, created on first use"""
+        if self._hud is None:
+            from src.ui.hud import HUD
+            self._hud = HUD(SCREEN_WIDTH, SCREEN_HEIGHT)
+        return self._hud
+
+    @property
+    def particles(self):
+        """Particle pool, created on first use"""
+        if self._particles is None:
+            from src.ui.particles import ParticleSystem
+            self._particles = ParticleSystem()
+        return self._particles
+
+    @property
+    def swarm_renderer(self):
+        """Sprite batcher for swarm mode, created on first use"""
+        if self._swarm_renderer is None:
+            from src.ui.swarm_renderer import SwarmRenderer
+            self._swarm_renderer = SwarmRenderer()
+        return self._swarm_renderer
+
+    @property
+    def quality(self):
+        """Name of the current quality level (see FrameGovernor)"""
+        return self.governor.name if self.governor else "full"
+
+    @property
+    def maze(self):
+        """Current level's maze"""
+        return self.sim.maze
+
+    @property
+    def player(self):
+        """The player entity"""
+        return self.sim.player
+
+    @property
+    def ghosts(self):
+        """Active ghosts"""
+        return self.sim.ghosts
+
+    @property
+    def level_manager(self):
+        """Level progression"""
+        return self.sim.level_manager
+
+    @property
+    def powerup_manager(self):
+        """Power-up system"""
+        return self.sim.powerup_manager
 
     def run(self):
-        """Main game loop"""
+        """Main game loop: fixed simulation ticks, one render per frame"""
+        while self.running:
+            self.handle_events()
+            if self.unattended:
+                frame_time = self.clock.tick()
+            else:
+                frame_time = self.clock.tick(FPS)
+            self.frame(frame_time / 1000.0)
+
+    async def run_async(self):
+        """Main game loop for the browser build: run(), but awaiting every frame
+
+        The browser only stays responsive if the game hands control back
+        each frame, so instead of clock.tick(FPS) blocking until the next
+        frame is due, the loop awaits it. In the browser pygbag resumes the
+        loop on the next display refresh; elsewhere (desktop, tests) it
+        sleeps until 1/FPS after the last frame. The game world, HUD fonts
+        and first maze chunks are built in the idle time after the first
+        frames instead of on the frame that needs them.
+        """
+        preload = self.preload()
+        due = time.perf_counter()
         while self.running:
             self.handle_events()
+            self.frame(self.clock.tick() / 1000.0)
+            if preload is not None:
+                try:
+                    next(preload)
+                except StopIteration:
+                    preload = None
+
+            interval = 0.0 if self.unattended else 1.0 / FPS
+            due = max(due + interval, time.perf_counter())
+            await self.wait_frame(due)
+
+    async def wait_frame(self, due):
+        """Yield to the event loop until due (a time.perf_counter() time)"""
+        if WEB:
+            await asyncio.sleep(0)  # the browser paces frames to its refresh rate
+        else:
+            await asyncio.sleep(max(0.0, due - time.perf_counter()))
+
+    def preload(self):
+        """Build what the first game needs, one piece per next() (a generator)"""
+        if self._sim is None:
+            self.load_world()
+            yield
+        # The lazy properties build their object on first access
+        hud = self.hud
+        for font in ("font_large", "font_medium", "font_small"):
+            getattr(hud, font)
+            yield
+        self.particles
+        yield
+        if self.swarm_size:
+            self.swarm_renderer
+            yield
+        maze = self.maze
+        for cy in range(-(-maze.height // MAZE_CHUNK_TILES)):
+            for cx in range(-(-maze.width // MAZE_CHUNK_TILES)):
+                maze.get_chunk(cx, cy)
+                yield
+
+    @property
+    def unattended(self):
+        """Render-skip mode with a game on: simulate flat out, no frame cap"""
+        return self.render_skip and self.state == "playing"
+
+    def frame(self, frame_time):
+        """One frame: the ticks frame_time (seconds) covers, then a render
+
+        The governor is told what the update and the render cost; at its
+        lowest quality level it skips rendering some frames, but the ticks
+        always run.
+        """
+        profiler = self.profiler
+        if profiler:
+            profiler.begin_frame()
+        if self.state == "playing":
+            self.particle_time += frame_time
+        if self.unattended:
+            self.run_unattended()
+        else:
+            governor = self.governor
+            start = time.perf_counter()
+            self.advance(frame_time)
+            self.think()
+            updated = time.perf_counter()
+            drawn = not governor or governor.render_due() or self.state != "playing"
+            if drawn:
+                self.render()
+            if governor:
+                governor.record(updated - start, time.perf_counter() - updated if drawn else None)
+            self.prefetch_maze()
+        if profiler:
+            profiler.end_frame()
+
+    def advance(self, frame_time):
+        """Run as many fixed ticks as frame_time (scaled by turbo) covers"""
+        if self.state != "playing":
+            self.accumulator = 0.0
+            self.alpha = 1.0
+            return
+
+        self.accumulator += min(frame_time, MAX_FRAME_TIME) * self.turbo
+        while self.accumulator >= SIM_DT and self.state == "playing":
+            self.update()
+            self.accumulator -= SIM_DT
+        self.alpha = min(self.accumulator / SIM_DT, 1.0)
+
+    def run_unattended(self):
+        """Render-skip mode: tick without a frame cap, draw every RENDER_SKIP_INTERVAL"""
+        for _ in range(SIM_TICK_RATE * self.turbo):
+            if self.state != "playing":
+                break
             self.update()
+        self.think()
+        self.prefetch_maze()
+
+        now = pygame.time.get_ticks()
+        if now - self.last_render >= RENDER_SKIP_INTERVAL or self.state != "playing":
+            self.alpha = 1.0
             self.render()
-            self.dt = self.clock.tick(FPS) / 1000.0
+            self.last_render = now
 
     def handle_events(self):
         """Handle input events"""
@@ -88,6 +290,21 @@ class Game:
                     elif self.state == "game_over":
                         self.restart_game()
 
+                elif event.key == pygame.K_f:
+                    # Cycle fast-forward speed
+                    speeds = TURBO_SPEEDS
+                    index = speeds.index(self.turbo) + 1 if self.turbo in speeds else 0
+                    self.turbo = speeds[index % len(speeds)]
+
+                elif event.key == pygame.K_TAB:
+                    self.set_autopilot(self.autopilot is None)
+
+                elif event.key == pygame.K_F3:
+                    self.set_profiling(self.profiler is None)
+
+                elif event.key == pygame.K_F4 and self.profiler:
+                    self.export_profile()
+
                 elif event.key == pygame.K_p:
                     if self.state == "playing":
                         self.state = "paused"
@@ -96,210 +313,321 @@ class Game:
 
     def start_game(self):
         """Start a new game"""
+        if self._sim is None:
+            self.load_world()
         self.state = "playing"
 
     def restart_game(self):
         """Restart game after game over"""
-        # Reset everything
-        self.maze = Maze()
-        player_start_x = 14 * TILE_SIZE
-        player_start_y = 23 * TILE_SIZE
-        self.player = Player(player_start_x, player_start_y, self.maze)
-
-        ghost_house_y = 14 * TILE_SIZE
-        self.ghosts = [
-            Blinky(13 * TILE_SIZE, ghost_house_y, self.maze),
-            Pinky(14 * TILE_SIZE, ghost_house_y, self.maze),
-            Inky(15 * TILE_SIZE, ghost_house_y, self.maze),
-            Clyde(16 * TILE_SIZE, ghost_house_y, self.maze)
-        ]
-
-        self.level_manager.reset()
-        self.powerup_manager = PowerUpManager()
+        self.seed = random.getrandbits(63)
+        self.load_world()
         self.combo = 1
-        self.death_timer = 0
-        self.level_complete_timer = 0
-        self.particles = ParticleSystem()
+        self._particles = None
         self.state = "playing"
 
+    def load_world(self):
+        """Build the game world (or reset it) and a fresh input recorder for self.seed"""
+        from src.sim.simulation import Simulation
+        from src.sim.replay import InputRecorder
+        if self._sim is None:
+            self._sim = Simulation(dt=SIM_DT, seed=self.seed, swarm=self.swarm_size)
+            self._sim.profiler = self.profiler
+        else:
+            self._sim.reset(self.seed)
+        self.recorder = InputRecorder(self.seed, swarm=self.swarm_size)
+
     def update(self):
-        """Update game state"""
+        """Advance the game by one fixed simulation tick"""
         # Only update game when playing
         if self.state != "playing":
             return
 
-        # Update particles
-        self.particles.update()
+        # Remember where everything was for render interpolation
+        self.prev_positions = {entity: (entity.x, entity.y)
+                               for entity in [self.player] + self.ghosts}
+        swarm = self.sim.swarm
+        self.prev_swarm = (swarm.x.copy(), swarm.y.copy()) if swarm is not None else None
 
-        # Handle death timer
-        if self.death_timer > 0:
-            self.death_timer -= self.dt * 1000
-            if self.death_timer <= 0:
-                self.respawn_player()
-            return
-
-        # Track previous score for particle effects
-        prev_score = self.player.score
-
-        self.player.handle_input()
-        self.player.update(self.dt)
-
-        # Emit particles on score change
-        if self.player.score > prev_score:
-            self.particles.emit(
-                self.offset_x + self.player.x,
-                self.offset_y + self.player.y,
-                NEON_YELLOW if not self.player.powered_up else NEON_GREEN,
-                count=3
-            )
-
-        # Update power-ups
-        self.powerup_manager.update(self.dt, self.maze, self.player, self.ghosts)
-
-        # Update ghosts
-        for ghost in self.ghosts:
-            ghost.update(self.dt, self.player)
-
-        # Check if player collected power pellet
-        if self.player.powered_up:
-            for ghost in self.ghosts:
-                if ghost.state not in ["frightened", "eaten"]:
-                    ghost.set_frightened(self.player.power_timer)
-
-        # Check ghost collisions
-        collision_ghost = check_ghost_collision(self.player, self.ghosts)
-        if collision_ghost:
-            # Check if player has shield
-            if hasattr(self.player, 'has_shield') and self.player.has_shield:
-                # Shield protects player
-                self.player.has_shield = False
-                self.powerup_manager.remove_powerup_effect(self.player, self.ghosts)
-                # Emit shield break particles
-                self.particles.emit(
-                    self.offset_x + self.player.x,
-                    self.offset_y + self.player.y,
-                    NEON_BLUE,
-                    count=15
-                )
+        if self.sim.death_timer <= 0:
+            if self.autopilot:
+                self.player.next_direction = self.autopilot.direction(self.sim)
             else:
-                # Player takes damage
-                self.player.lives -= 1
-                if self.player.lives > 0:
-                    self.death_timer = self.respawn_delay
-                    # Emit death particles
+                self.player.handle_input()
+        self.recorder.record(self.sim, self.player.next_direction)
+        self.sim.step()
+
+        self.emit_event_particles()
+
+        if self.sim.game_over:
+            self.state = "game_over"
+            self.recorder.finish(self.sim)
+            if REPLAY_DIR:
+                self.save_replay(REPLAY_DIR)
+
+    def emit_event_particles(self):
+        """Turn simulation events from the last tick into particle effects"""
+        events = self.sim.events
+        if not events:
+            return
+        self.particles.emit_cap = self.governor.particle_cap() if self.governor else None
+        for event in events:
+            kind = event[0]
+            x = self.offset_x + event[1]
+            y = self.offset_y + event[2]
+            if kind == "score":
+                color = NEON_YELLOW if not self.player.powered_up else NEON_GREEN
+                self.particles.emit(x, y, color, count=3)
+            elif kind == "shield_break":
+                self.particles.emit(x, y, NEON_BLUE, count=15)
+            elif kind == "death" and not self.sim.game_over:
+                self.particles.emit(x, y, NEON_PINK, count=10)
+            elif kind == "level_complete":
+                # Emit celebration particles
+                for i in range(20):
                     self.particles.emit(
-                        self.offset_x + self.player.x,
-                        self.offset_y + self.player.y,
-                        NEON_PINK,
-                        count=10
+                        x + (i - 10) * 20,
+                        y,
+                        NEON_GREEN if i % 2 == 0 else NEON_YELLOW,
+                        count=5
                     )
-                else:
-                    self.state = "game_over"
-
-        # Check level completion
-        pellets_remaining = sum(row.count(1) + row.count(2) for row in self.maze.layout)
-        if pellets_remaining == 0:
-            self.level_complete()
-
-    def level_complete(self):
-        """Handle level completion"""
-        # Award bonus points
-        self.player.score += 1000
-
-        # Advance level
-        self.level_manager.next_level()
-
-        # Create new maze
-        self.maze = Maze()
-
-        # Reset player position
-        player_start_x = 14 * TILE_SIZE
-        player_start_y = 23 * TILE_SIZE
-        self.player.x = player_start_x
-        self.player.y = player_start_y
-        self.player.direction = (0, 0)
-        self.player.next_direction = (0, 0)
-        self.player.powered_up = False
-        self.player.power_timer = 0
-
-        # Reset ghosts with increased difficulty
-        ghost_house_y = 14 * TILE_SIZE
-        self.ghosts = [
-            Blinky(13 * TILE_SIZE, ghost_house_y, self.maze),
-            Pinky(14 * TILE_SIZE, ghost_house_y, self.maze),
-            Inky(15 * TILE_SIZE, ghost_house_y, self.maze),
-            Clyde(16 * TILE_SIZE, ghost_house_y, self.maze)
-        ]
-        self.level_manager.adjust_ghost_difficulty(self.ghosts)
-
-        # Reset power-ups
-        self.powerup_manager = PowerUpManager()
-
-        # Emit celebration particles
-        for i in range(20):
-            self.particles.emit(
-                self.offset_x + self.player.x + (i - 10) * 20,
-                self.offset_y + self.player.y,
-                NEON_GREEN if i % 2 == 0 else NEON_YELLOW,
-                count=5
-            )
-
-    def respawn_player(self):
-        """Respawn player after death"""
-        player_start_x = 14 * TILE_SIZE
-        player_start_y = 23 * TILE_SIZE
-        self.player.x = player_start_x
-        self.player.y = player_start_y
-        self.player.direction = (0, 0)
-        self.player.next_direction = (0, 0)
-        self.player.powered_up = False
-        self.player.power_timer = 0
-
-        # Reset ghosts
-        for ghost in self.ghosts:
-            ghost.reset_position()
 
     def render(self):
         """Render game"""
         if self.state == "menu":
             self.menu_manager.render_start_menu(self.screen)
+            pygame.display.flip()
+            self.needs_full_redraw = True
         elif self.state == "game_over":
             self.menu_manager.render_game_over(self.screen, self.player.score, self.level_manager.get_current_level())
+            pygame.display.flip()
+            self.needs_full_redraw = True
         else:
             # Render game (playing or paused)
-            self.screen.fill(BLACK)
-
-            # Render maze
-            self.maze.render(self.screen, self.offset_x, self.offset_y)
-
-            # Render power-ups
-            self.powerup_manager.render(self.screen, self.offset_x, self.offset_y)
-
-            # Render ghosts
-            for ghost in self.ghosts:
-                ghost.render(self.screen, self.offset_x, self.offset_y)
-
-            # Render player
-            self.player.render(self.screen, self.offset_x, self.offset_y)
-
-            # Render particles
-            self.particles.render(self.screen)
-
-            # Render HUD
-            self.hud.render(self.screen, self.player, self.level_manager.get_current_level(), self.combo)
-
-            # Render power-up indicator if active
-            if hasattr(self.player, 'powerup_type') and self.player.powerup_type:
-                font = pygame.font.Font(None, 24)
-                powerup_name = self.player.powerup_type.upper()
-                text = font.render(f"POWERUP: {powerup_name}", True, NEON_GREEN)
-                self.screen.blit(text, (SCREEN_WIDTH // 2 - 80, 850))
+            profiler = self.profiler
+            if profiler:
+                profiler.mark()
+
+            # Particles are presentation: they move with real time, once per
+            # drawn frame, however many ticks the frame ran
+            if self.particle_time:
+                self.particles.update(min(self.particle_time, MAX_FRAME_TIME))
+                self.particle_time = 0.0
+                if profiler:
+                    profiler.lap("particles")
+            scrolled = self.camera.follow(self.maze, *self.interpolated_position(self.player))
+            self.offset_x, self.offset_y = self.camera.offset_x, self.camera.offset_y
+            # Screen area the maze covers (its chunks are opaque)
+            self.maze_view = self.camera.view.clip(
+                self.offset_x, self.offset_y, self.maze.pixel_width, self.maze.pixel_height)
+            # A swarm moves too many sprites for dirty rects to pay off
+            full = (not self.dirty_rendering or self.state == "paused" or scrolled or
+                    self.needs_full_redraw or self.maze is not self.rendered_maze or
+                    self.sim.swarm is not None)
+
+            if full:
+                self.screen.fill(BLACK)
+                self.maze.render(self.screen, self.offset_x, self.offset_y, area=self.maze_view)
+                restored = []
+            else:
+                # Last frame's sprites and any pellets eaten since then
+                restored = self.prev_rects
+                for rect in self.maze.update_surface():
+                    restored.append(rect.move(self.offset_x, self.offset_y))
+
+            # At reduced quality the HUD stays on screen between redraws, unless
+            # a sprite was drawn over it
+            governor = self.governor
+            hud = (full or not governor or governor.hud_due() or
+                   any(rect.collidelist(self.hud_rects) >= 0 for rect in restored))
+            if not full:
+                if hud:
+                    restored += self.hud_rects
+                for rect in restored:
+                    self.restore_background(rect)
+            if profiler:
+                profiler.lap("maze render")
+
+            rects = self.render_world()
+            if hud:
+                self.hud_rects = self.render_hud()
+                if profiler:
+                    profiler.lap("HUD")
+            if profiler:
+                # Profiler readout (not charged to any scope)
+                rects.append(self.profiler_overlay.render(self.screen, profiler))
 
             # Render pause overlay if paused
             if self.state == "paused":
                 self.menu_manager.render_pause_menu(self.screen)
 
-        pygame.display.flip()
+            if profiler:
+                # One fill + blit per restored rect (or for the whole maze), one draw per sprite rect
+                profiler.count_draws(2 * max(1, len(restored)) + len(rects) +
+                                     (len(self.hud_rects) if hud else 0))
+                profiler.mark()
+            if full:
+                pygame.display.flip()
+                # Keep redrawing fully while the pause overlay is up
+                self.needs_full_redraw = self.state == "paused"
+            else:
+                pygame.display.update(restored + rects + (self.hud_rects if hud else []))
+            if profiler:
+                profiler.lap("flip")
+            self.prev_rects = rects
+            self.rendered_maze = self.maze
+
+    def render_world(self):
+        """Draw power-ups, ghosts, player and particles; return their rects"""
+        rects = []
+        profiler = self.profiler
+        self.screen.set_clip(self.camera.view)  # world sprites stay inside the viewport
+
+        # Render power-ups
+        pulse = not self.governor or self.governor.animate_powerups()
+        rects.extend(self.powerup_manager.render(self.screen, self.offset_x, self.offset_y, pulse))
+
+        # Render ghosts
+        for ghost in self.ghosts:
+            rects.append(ghost.render(self.screen, *self.interpolated_offset(ghost)))
+        swarm = self.sim.swarm
+        if swarm is not None:
+            prev = self.prev_swarm if RENDER_INTERPOLATION else None
+            drawn = self.swarm_renderer.render(self.screen, swarm, self.camera.view,
+                                               self.offset_x, self.offset_y, prev, self.alpha)
+            if profiler:
+                profiler.count_draws(drawn)
+
+        # Render player
+        rects.append(self.player.render(self.screen, *self.interpolated_offset(self.player)))
+        if profiler:
+            profiler.lap("entities")
+
+        # Render particles
+        rects.extend(self.particles.render(self.screen))
+        if profiler:
+            profiler.lap("particles")
+        self.screen.set_clip(None)
+        return rects
+
+    def render_hud(self):
+        """Draw the HUD and the mode indicators; return their rects"""
+        rects = self.hud.render(self.screen, self.player, self.level_manager.get_current_level(), self.combo)
+
+        # Render power-up indicator if active
+        if hasattr(self.player, 'powerup_type') and self.player.powerup_type:
+            powerup_name = self.player.powerup_type.upper()
+            text = render_text(24, f"POWERUP: {powerup_name}", NEON_GREEN)
+            rects.append(self.screen.blit(text, (SCREEN_WIDTH // 2 - 80, 850)))
+
+        # Render autopilot indicator: search depth and speed
+        if self.autopilot:
+            stats = self.autopilot.stats()
+            text = render_text(24, f"AUTO d{stats['depth']} {stats['nodes_per_second'] / 1000:.1f}k n/s",
+                               NEON_BLUE)
+            rects.append(self.screen.blit(text, (20, 850)))
+
+        # Render fast-forward indicator
+        if self.turbo != 1:
+            text = render_text(24, f">> x{self.turbo}", NEON_ORANGE)
+            rects.append(self.screen.blit(text, (SCREEN_WIDTH - 100, 850)))
+        return rects
+
+    def interpolated_position(self, entity):
+        """Entity's maze position between its previous and current tick position"""
+        prev = self.prev_positions.get(entity)
+        if not RENDER_INTERPOLATION or prev is None or self.alpha >= 1.0:
+            return entity.x, entity.y
+
+        dx = entity.x - prev[0]
+        dy = entity.y - prev[1]
+        if abs(dx) > TILE_SIZE or abs(dy) > TILE_SIZE:
+            # Tunnel wrap or respawn: jump instead of sliding across the maze
+            return entity.x, entity.y
+
+        back = 1.0 - self.alpha
+        return entity.x - dx * back, entity.y - dy * back
+
+    def interpolated_offset(self, entity):
+        """Draw offset placing entity between its previous and current tick position"""
+        x, y = self.interpolated_position(entity)
+        return (self.offset_x + int(x) - int(entity.x),
+                self.offset_y + int(y) - int(entity.y))
+
+    def snapshot(self):
+        """Compact immutable record of the game world (see GameState)"""
+        return self.sim.snapshot()
+
+    def restore(self, state):
+        """Return the game world to a snapshot() record"""
+        self.sim.restore(state)
+        self.prev_positions = {}
+        self.prev_swarm = None
+        self.needs_full_redraw = True
+
+    def set_profiling(self, enabled):
+        """Switch the frame profiler and its overlay on or off"""
+        self.profiler = None
+        if enabled:
+            from src.utils.profiler import FrameProfiler
+            from src.ui.profiler_overlay import ProfilerOverlay
+            self.profiler = FrameProfiler()
+            self.profiler_overlay = ProfilerOverlay()
+        if self._sim is not None:
+            self._sim.profiler = self.profiler
+
+    def set_autopilot(self, enabled):
+        """Hand the player's controls to the lookahead bot, or take them back"""
+        self.autopilot = None
+        if enabled:
+            from src.sim.autopilot import Autopilot
+            self.autopilot = Autopilot()
+
+    def think(self):
+        """Give the autopilot its per-frame search budget while a game is on"""
+        if self.autopilot and self.state == "playing":
+            if self.profiler:
+                self.profiler.mark()
+            self.autopilot.think()
+            if self.profiler:
+                self.profiler.lap("autopilot")
+
+    def prefetch_maze(self):
+        """Do a slice of the work of building the next level's maze"""
+        levels = self.sim.level_manager
+        if levels.next_seed != self.prefetch_seed:
+            self.prefetch_seed = levels.next_seed
+            self.prefetch = levels.prepare_next_maze()
+        if self.prefetch is None:
+            return
+        if self.profiler:
+            self.profiler.mark()
+        try:
+            next(self.prefetch)
+        except StopIteration:
+            self.prefetch = None
+        if self.profiler:
+            self.profiler.lap("prefetch")
+
+    def export_profile(self, basename=None):
+        """Write the profiler's buffered frames as JSON and CSV; return the paths"""
+        basename = basename or f"profile-{time.strftime('%Y%m%d-%H%M%S')}"
+        paths = basename + ".json", basename + ".csv"
+        self.profiler.export_json(paths[0])
+        self.profiler.export_csv(paths[1])
+        return paths
+
+    def save_replay(self, directory):
+        """Write the current game's recording to directory and return its path"""
+        os.makedirs(directory, exist_ok=True)
+        path = os.path.join(directory, f"{time.strftime('%Y%m%d-%H%M%S')}-{self.seed}.pmr")
+        self.recorder.save(path)
+        return path
+
+    def restore_background(self, rect):
+        """Repaint the static background (black + maze) inside rect"""
+        if not self.maze_view.contains(rect):
+            self.screen.fill(BLACK, rect)
+        self.maze.render(self.screen, self.offset_x, self.offset_y, area=self.maze_view.clip(rect))
 
     def quit(self):
         """Clean up and quit"""
@@ -0,0 +1,203 @@
+"""Seeded procedural maze generation"""
+import random
+from src.config import *
+
+# Corridors run along a lattice of lane columns and rows, at most
+# MAX_LANE_GAP tiles apart and never fewer than three, which leaves walls
+# two or more tiles thick between parallel corridors. Only the left half
+# is generated; the right half is its mirror image.
+MAX_LANE_GAP = 5
+MIN_SIZE = (28, 31)  # smallest maze with room for the ghost house and side tunnels
+
+# Ghost house, with its door on top, as in the classic maze. Its left edge
+# sits 4 tiles left of the centre line and its top 2 rows above the tunnel.
+GHOST_HOUSE_ROWS = (
+    (0, 0, 0, 4, 4, 0, 0, 0),
+    (0, 4, 4, 4, 4, 4, 4, 0),
+    (0, 4, 4, 4, 4, 4, 4, 0),
+    (0, 4, 4, 4, 4, 4, 4, 0),
+    (0, 0, 0, 0, 0, 0, 0, 0),
+)
+EXTRA_CORRIDORS = (0.2, 0.5)  # share of the remaining lattice opened up as loops
+
+
+def lanes(start, end):
+    """Evenly spaced lane positions from start to end inclusive"""
+    count = -(-(end - start) // MAX_LANE_GAP)
+    return [start + round(i * (end - start) / count) for i in range(count + 1)]
+
+
+class MazePlan:
+    """Lane lattice and fixed landmarks of a generated maze of one size
+
+    Nodes are (x, y) lane crossings in the left half. Edges are
+    (node, node) pairs; a node paired with itself is the corridor crossing
+    the centre line to its own mirror image, and "T" is the tunnel mouth
+    at the screen edge (it wraps to the other side).
+    """
+
+    def __init__(self, width, height):
+        if width % 2 or width < MIN_SIZE[0] or height < MIN_SIZE[1]:
+            raise ValueError(f"maze size must be even width >= {MIN_SIZE[0]}, "
+                             f"height >= {MIN_SIZE[1]} (got {width}x{height})")
+        self.width = width
+        self.height = height
+        self.half = half = width // 2
+        center = half - 2  # last lane column; meets its mirror across the centre
+        ring_x = half - 5  # column of the corridor ring around the ghost house
+        self.tunnel_row = tunnel = height // 2 - 1
+        self.house_left = half - 4
+        self.house_top = tunnel - 2
+
+        columns = lanes(1, ring_x) + [center]
+        rows = lanes(1, tunnel - 3) + [tunnel] + lanes(tunnel + 3, height - 2)
+        self.player_row = rows[rows.index(tunnel) + 2]  # first lane below the ring
+
+        # Column 1 stays closed beside the tunnel (side blocks); the house
+        # takes the centre lane's crossing with the tunnel row
+        excluded = {(1, tunnel - 3), (1, tunnel), (1, tunnel + 3), (center, tunnel)}
+        self.nodes = [(x, y) for y in rows for x in columns if (x, y) not in excluded]
+        node_set = set(self.nodes)
+
+        # Ring, tunnel and the corridor through the player start: always open
+        ring = [((ring_x, tunnel - 3), (center, tunnel - 3)), ((center, tunnel - 3),) * 2,
+                ((ring_x, tunnel + 3), (center, tunnel + 3)), ((center, tunnel + 3),) * 2,
+                ((ring_x, tunnel - 3), (ring_x, tunnel)), ((ring_x, tunnel), (ring_x, tunnel + 3))]
+        tunnel_lanes = columns[1:columns.index(ring_x) + 1]
+        ring += [((tunnel_lanes[0], tunnel), "T")]
+        ring += [((a, tunnel), (b, tunnel)) for a, b in zip(tunnel_lanes, tunnel_lanes[1:])]
+        self.empty_edges = set(ring)  # never carry pellets
+        self.fixed_edges = self.empty_edges | {((center, self.player_row),) * 2}
+
+        edges = set(self.fixed_edges)
+        for x, y in self.nodes:
+            i, j = columns.index(x), rows.index(y)
+            for neighbor in ((columns[i + 1], y) if i + 1 < len(columns) else None,
+                             (x, rows[j + 1]) if j + 1 < len(rows) else None):
+                if neighbor in node_set:
+                    edges.add(((x, y), neighbor))
+            if x == center:
+                edges.add(((x, y), (x, y)))
+        self.edges = sorted(edges, key=str)
+
+        # Power pellets go on a random corridor tile near each corner
+        self.power_regions = ((1, 1, columns[1], rows[1]),
+                              (1, rows[-2], columns[1], height - 2))  # inclusive
+
+    def corridor_tiles(self, edge):
+        """Left-half tiles covered by an edge's corridor"""
+        a, b = edge
+        if b == "T":
+            return [(x, a[1]) for x in range(0, a[0] + 1)]
+        if a == b:
+            return [(x, a[1]) for x in range(a[0], self.half)]
+        (x0, y0), (x1, y1) = a, b
+        if y0 == y1:
+            return [(x, y0) for x in range(min(x0, x1), max(x0, x1) + 1)]
+        return [(x0, y) for y in range(min(y0, y1), max(y0, y1) + 1)]
+
+
+def degrees(edges):
+    """Corridors meeting at each node of the mirrored maze
+
+    A centre crossing adds one corridor at its node; the tunnel mouth is
+    not a node (it continues on the other side of the screen).
+    """
+    degree = {}
+    for edge in edges:
+        for node in ends(edge):
+            degree[node] = degree.get(node, 0) + 1
+    return degree
+
+
+def ends(edge):
+    """Lattice nodes an edge touches"""
+    a, b = edge
+    return (a,) if a == b or b == "T" else (a, b)
+
+
+def generate_layout(seed, width=MAZE_WIDTH, height=MAZE_HEIGHT):
+    """Mirror-symmetric maze layout (rows of tile codes, as in CLASSIC_MAZE_LAYOUT)
+
+    A random spanning tree of the lane lattice makes every open tile
+    reachable from every other; junctions left with a single way out get
+    a second one, so no corridor is a dead end, and a random share of the
+    remaining lattice is opened up as loops. The ghost house, the ring
+    around it, the side tunnel and the player's start corridor are always
+    present.
+    """
+    steps = build_layout(seed, width, height)
+    while True:
+        try:
+            next(steps)
+        except StopIteration as done:
+            return done.value
+
+
+def build_layout(seed, width=MAZE_WIDTH, height=MAZE_HEIGHT):
+    """generate_layout() in a few slices: a generator that yields between
+    its stages and returns the layout (so `layout = yield from ...`)"""
+    plan = MazePlan(width, height)
+    rng = random.Random(seed)
+    yield
+
+    # Spanning tree over the fixed corridors plus shuffled optional ones
+    parent = {node: node for node in plan.nodes}
+
+    def find(node):
+        while parent[node] != node:
+            parent[node] = parent[parent[node]]
+            node = parent[node]
+        return node
+
+    for edge in plan.fixed_edges:
+        nodes = ends(edge)
+        parent[find(nodes[0])] = find(nodes[-1])
+    edges = set(plan.fixed_edges)
+    unused = []
+    optional = [edge for edge in plan.edges if edge not in plan.fixed_edges]
+    rng.shuffle(optional)
+    for edge in optional:
+        a, b = edge
+        root_a, root_b = find(a), find(b)
+        if root_a != root_b:
+            parent[root_a] = root_b
+            edges.add(edge)
+        else:
+            unused.append(edge)
+
+    yield
+
+    # No dead ends: every junction gets at least two corridors
+    degree = degrees(edges)
+    loops = rng.uniform(*EXTRA_CORRIDORS)
+    for edge in unused:
+        if any(degree[node] < 2 for node in ends(edge)) or rng.random() < loops:
+            edges.add(edge)
+            for node in ends(edge):
+                degree[node] += 1
+
+    yield
+
+    # Carve the left half: pellets along corridors, empty ring and tunnel
+    half = plan.half
+    layout = [[0] * width for _ in range(height)]
+    for edge in sorted(edges, key=str):
+        tile = 3 if edge in plan.empty_edges else 1
+        for x, y in plan.corridor_tiles(edge):
+            if layout[y][x] != 3:
+                layout[y][x] = tile
+    layout[plan.player_row][half - 1] = 3
+
+    # Power pellets
+    for x0, y0, x1, y1 in plan.power_regions:
+        spots = [(x, y) for y in range(y0, y1 + 1) for x in range(x0, x1 + 1) if layout[y][x] == 1]
+        x, y = rng.choice(spots)
+        layout[y][x] = 2
+
+    # Mirror, then drop in the ghost house
+    for row in layout:
+        row[half:] = row[half - 1::-1]
+    for dy, house_row in enumerate(GHOST_HOUSE_ROWS):
+        layout[plan.house_top + dy][plan.house_left:plan.house_left + len(house_row)] = house_row
+    return layout
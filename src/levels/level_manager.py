@@ -1,11 +1,13 @@
 """Level progression and management"""
 from src.config import *
-from src.levels.maze import Maze
+from src.levels.maze import Maze, prepare_generated_maze
 
 class LevelManager:
     def __init__(self):
         self.current_level = 1
         self.difficulty_multiplier = 1.0
+        self.maze_seed = None  # None for the classic maze
+        self.next_seed = None  # the next level's maze seed, drawn when this level starts
 
     def get_current_level(self):
         """Get current level number"""
@@ -15,13 +17,34 @@ class LevelManager:
         """Get current difficulty multiplier"""
         return self.difficulty_multiplier
 
-    def next_level(self):
-        """Advance to next level"""
+    def next_level(self, seed):
+        """Advance to next level, played on the maze generated from seed"""
         self.current_level += 1
         # Increase difficulty by 10% each level
         self.difficulty_multiplier = 1.0 + (self.current_level - 1) * 0.1
+        self.maze_seed = seed
         return self.current_level
 
+    def maze_size(self, level=None):
+        """(width, height) in tiles of a level's generated maze (default: the current one)
+
+        Generated mazes start at the classic size and grow by MAZE_GROWTH
+        tiles a side every level, up to MAZE_MAX_SIZE.
+        """
+        level = self.current_level if level is None else level
+        growth = max(0, level - 2) * MAZE_GROWTH
+        return (min(MAZE_WIDTH + growth, MAZE_MAX_SIZE[0]),
+                min(MAZE_HEIGHT + growth, MAZE_MAX_SIZE[1]))
+
+    def create_maze(self):
+        """Fresh maze for the current level (classic on level 1)"""
+        return Maze(seed=self.maze_seed, size=self.maze_size())
+
+    def prepare_next_maze(self):
+        """Build the next level's maze into the cache in slices (a generator;
+        see prepare_generated_maze)"""
+        return prepare_generated_maze(self.next_seed, *self.maze_size(self.current_level + 1))
+
     def adjust_ghost_difficulty(self, ghosts):
         """Adjust ghost behavior for current level"""
         for ghost in ghosts:
@@ -34,3 +57,5 @@ class LevelManager:
         """Reset to level 1"""
         self.current_level = 1
         self.difficulty_multiplier = 1.0
+        self.maze_seed = None
+        self.next_seed = None
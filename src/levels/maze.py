@@ -1,6 +1,20 @@
 """Maze generation and management"""
+import weakref
+from collections import OrderedDict
 import pygame
 from src.config import *
+from src.levels.generator import build_layout, generate_layout
+from src.levels.navigation import NavGraph, UNREACHABLE
+
+# Pre-rendered wall chunks per wall layout (keyed by its NavGraph): LRU of
+# (chunk x, chunk y) -> surface
+_wall_chunks = weakref.WeakKeyDictionary()
+
+# Generated mazes by (seed, width, height): (packed layout, NavGraph), least recently used first
+_generated = OrderedDict()
+
+CHUNK_PIXELS = MAZE_CHUNK_TILES * TILE_SIZE
+CHUNK_RECT = pygame.Rect(0, 0, CHUNK_PIXELS, CHUNK_PIXELS)
 
 # Classic Pac-Man maze layout (0=wall, 1=pellet, 2=power pellet, 3=empty, 4=ghost house)
 CLASSIC_MAZE_LAYOUT = [
@@ -37,22 +51,259 @@ CLASSIC_MAZE_LAYOUT = [
     [0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0],
 ]
 
+def _bit_table(code):
+    """Table for bytes.translate: tile code to the digit 1, any other tile to 0"""
+    return bytes(49 if i == code else 48 for i in range(256))
+
+
+_WALL_BITS, _PELLET_BITS, _POWER_BITS = _bit_table(0), _bit_table(1), _bit_table(2)
+
+
+def pack_layout(layout):
+    """Pack a list-of-rows layout into (tiles, width, wall, pellet, power bitboards)
+
+    tiles is a flat row-major bytes; bit y * width + x of each bitboard is
+    set when that tile is a wall, pellet or power pellet.
+    """
+    width = len(layout[0])
+    tiles = bytes(tile for row in layout for tile in row)
+    # One binary digit per tile, highest tile first, parsed in linear time
+    walls = int(tiles.translate(_WALL_BITS)[::-1], 2)
+    pellets = int(tiles.translate(_PELLET_BITS)[::-1], 2)
+    powers = int(tiles.translate(_POWER_BITS)[::-1], 2)
+    return tiles, width, walls, pellets, powers
+
+
+CLASSIC_MAZE = pack_layout(CLASSIC_MAZE_LAYOUT)
+
+
+def generated_maze(seed, width=MAZE_WIDTH, height=MAZE_HEIGHT):
+    """Packed layout and navigation table of the generated maze for seed
+
+    Recent mazes are kept in an LRU of MAZE_CACHE_SIZE entries. An entry
+    holds everything derived from the layout: tiles and bitboards (walkable
+    mask, pellet counts), the NavGraph, and through it the pre-rendered
+    wall chunks, so returning to a cached maze costs a dict lookup.
+    """
+    key = (seed, width, height)
+    entry = _generated.get(key)
+    if entry is not None:
+        _generated.move_to_end(key)
+        return entry
+
+    layout = generate_layout(seed, width, height)
+    return _store_generated(key, pack_layout(layout), NavGraph(layout))
+
+
+def prepare_generated_maze(seed, width=MAZE_WIDTH, height=MAZE_HEIGHT):
+    """Build the generated maze for seed into the cache ahead of time
+
+    A generator: each next() does a slice of the work (a few milliseconds
+    at the largest size), so the next level's maze can be built
+    between frames and generated_maze() then finds it cached. Unlike
+    generated_maze() it also builds the NavGraph's lazy tables.
+    """
+    key = (seed, width, height)
+    if key in _generated:
+        return
+    layout = yield from build_layout(seed, width, height)
+    yield
+    packed = pack_layout(layout)
+    yield
+    nav = NavGraph.__new__(NavGraph)
+    yield from nav.build(layout)
+    yield from nav.build_zone_table()
+    yield from nav.build_anchors()
+    if key not in _generated:
+        _store_generated(key, packed, nav)
+
+
+def _store_generated(key, packed, nav):
+    entry = _generated[key] = packed, nav
+    if len(_generated) > MAZE_CACHE_SIZE:
+        _generated.popitem(last=False)
+    return entry
+
+
+def iter_bits(bits):
+    """Indices of the set bits of a bitboard, lowest first"""
+    while bits:
+        low = bits & -bits
+        yield low.bit_length() - 1
+        bits ^= low
+
+
 class Maze:
-    def __init__(self):
-        self.layout = [row[:] for row in CLASSIC_MAZE_LAYOUT]
-        self.pellet_count = self.count_pellets()
+    def __init__(self, layout=None, seed=None, size=(MAZE_WIDTH, MAZE_HEIGHT)):
+        """Classic maze, the given layout, or the generated maze of size for seed"""
+        self.seed = seed
+        if seed is not None:
+            packed, nav = generated_maze(seed, *size)
+        else:
+            packed, nav = CLASSIC_MAZE if layout is None else pack_layout(layout), None
+
+        # Flat tile bytes plus bitboards; see pack_layout
+        tiles, self.width, self.wall_bits, self.pellet_bits, self.power_bits = packed
+        self.tiles = bytearray(tiles)
+        self.height = len(self.tiles) // self.width
+        self.pixel_width = self.width * TILE_SIZE
+        self.pixel_height = self.height * TILE_SIZE
+        self.pellet_count = self.pellets_remaining  # total at the start of the level
+
+        # Walls never change while a level is played, so the table is shared per layout
+        self.nav = nav or NavGraph.for_layout(self.layout, key=(self.width, self.wall_bits))
+        self.player_start, self.ghost_starts = self.find_spawns()
+
+        # Render chunks are built when first drawn; eaten pellets are patched lazily
+        self.chunks = OrderedDict()
+        self.eaten_tiles = []
+
+    @property
+    def layout(self):
+        """Tile rows, read-only: a tuple of bytes rows, so writing to it raises
+        (use eat_pellet() and the other accessors to change the maze)"""
+        w = self.width
+        tiles = bytes(self.tiles)
+        return tuple(tiles[y * w:(y + 1) * w] for y in range(self.height))
+
+    def copy(self):
+        """Independent maze with the same tiles (shares the navigation table)"""
+        maze = Maze.__new__(Maze)
+        maze.__dict__.update(self.__dict__)
+        maze.tiles = bytearray(self.tiles)
+        maze.chunks = OrderedDict()
+        maze.eaten_tiles = []
+        return maze
+
+    def find_spawns(self):
+        """Pixel positions of the player start and the four ghost starts
+
+        The player starts on the lowest row where the two tiles either side
+        of the centre line are both empty; the ghosts line up across the
+        middle row of the ghost house.
+        """
+        w, tiles = self.width, self.tiles
+        half = w // 2
+        player = next(((half * TILE_SIZE, y * TILE_SIZE) for y in range(self.height - 1, -1, -1)
+                       if tiles[y * w + half - 1] == 3 and tiles[y * w + half] == 3), None)
+
+        first, last = tiles.find(4), tiles.rfind(4)
+        if first < 0:
+            # No ghost house: everyone starts on the walkable tile nearest the middle
+            center = self.nav.anchor(half, self.height // 2)
+            position = (center % w * TILE_SIZE, center // w * TILE_SIZE)
+            return player or position, [position] * 4
+        top, bottom = first // w, last // w
+        columns = [i % w for y in range(top, bottom + 1)
+                   for i in range(y * w, (y + 1) * w) if tiles[i] == 4]
+        middle = (min(columns) + max(columns) + 1) // 2
+        row = (top + bottom + 1) // 2
+        ghosts = [(x * TILE_SIZE, row * TILE_SIZE) for x in range(middle - 1, middle + 3)]
+        return player or ghosts[1], ghosts
+
+    def snapshot(self):
+        """Immutable record of the pellets: the (pellet, power) bitboards
+
+        The bitboards are immutable ints that eat_pellet replaces rather
+        than mutates, so a snapshot shares them with the maze at no cost
+        and the maze effectively copies on write.
+        """
+        return self.pellet_bits, self.power_bits
+
+    def restore(self, snapshot):
+        """Return to a state recorded by snapshot() on a maze with the same walls
+
+        Only tiles whose pellet differs from the snapshot are rewritten.
+        """
+        pellets, powers = snapshot
+        changed = (self.pellet_bits ^ pellets) | (self.power_bits ^ powers)
+        if not changed:
+            return
+        tiles = self.tiles
+        for i in iter_bits(changed):
+            tiles[i] = 1 if pellets >> i & 1 else 2 if powers >> i & 1 else 3
+        if self.chunks:
+            if changed & (pellets | powers):
+                self.chunks.clear()  # pellets came back: redraw them all
+                self.eaten_tiles = []
+            else:
+                self.eaten_tiles.extend((i % self.width, i // self.width)
+                                        for i in iter_bits(changed))
+        self.pellet_bits = pellets
+        self.power_bits = powers
+
+    def as_array(self):
+        """Tiles as a (height, width) NumPy uint8 view of the maze's own buffer"""
+        import numpy as np
+        return np.frombuffer(self.tiles, dtype=np.uint8).reshape(self.height, self.width)
 
     def count_pellets(self):
         """Count total pellets in maze"""
-        count = 0
-        for row in self.layout:
-            count += row.count(1) + row.count(2)
-        return count
+        return self.tiles.count(1) + self.tiles.count(2)
+
+    @property
+    def pellets_remaining(self):
+        """Regular and power pellets still in the maze"""
+        return (self.pellet_bits | self.power_bits).bit_count()
+
+    @property
+    def power_pellets_remaining(self):
+        """Power pellets still in the maze"""
+        return self.power_bits.bit_count()
+
+    def is_cleared(self):
+        """True once every pellet has been eaten"""
+        return not (self.pellet_bits or self.power_bits)
+
+    def progress(self):
+        """Fraction of the level's pellets eaten so far (0.0 - 1.0)"""
+        if self.pellet_count == 0:
+            return 1.0
+        return 1.0 - self.pellets_remaining / self.pellet_count
+
+    def walkable_mask(self):
+        """Bitboard of every non-wall tile"""
+        return ~self.wall_bits & ((1 << len(self.tiles)) - 1)
+
+    def region_mask(self, x0, y0, x1, y1):
+        """Bitboard of the tiles in the rectangle [x0, x1) x [y0, y1)"""
+        x0, x1 = max(x0, 0), min(x1, self.width)
+        y0, y1 = max(y0, 0), min(y1, self.height)
+        if x0 >= x1 or y0 >= y1:
+            return 0
+        row = ((1 << (x1 - x0)) - 1) << x0
+        mask = 0
+        for y in range(y0, y1):
+            mask |= row << (y * self.width)
+        return mask
+
+    def pellets_in_region(self, x0, y0, x1, y1):
+        """Number of remaining pellets in the rectangle [x0, x1) x [y0, y1)"""
+        return ((self.pellet_bits | self.power_bits) & self.region_mask(x0, y0, x1, y1)).bit_count()
+
+    def pellet_positions(self, power=None):
+        """Grid positions of remaining pellets (power=True/False to filter)"""
+        bits = {None: self.pellet_bits | self.power_bits,
+                True: self.power_bits, False: self.pellet_bits}[power]
+        return [(i % self.width, i // self.width) for i in iter_bits(bits)]
+
+    def nearest_pellet(self, x, y, power=False):
+        """Remaining pellet with the shortest maze path from grid (x, y)
+
+        Returns the pellet's grid position, or None if none are reachable.
+        With power=True only power pellets are considered.
+        """
+        bits = self.power_bits if power else self.pellet_bits | self.power_bits
+        field = self.nav.distance_field(self.nav.anchor(x, y))
+        best = min(iter_bits(bits), key=field.__getitem__, default=None)
+        if best is None or field[best] == UNREACHABLE:
+            return None
+        return best % self.width, best // self.width
 
     def get_tile(self, x, y):
         """Get tile type at grid position"""
-        if 0 <= y < len(self.layout) and 0 <= x < len(self.layout[0]):
-            return self.layout[y][x]
+        if 0 <= y < self.height and 0 <= x < self.width:
+            return self.tiles[y * self.width + x]
         return 0  # Wall by default
 
     def is_walkable(self, x, y):
@@ -60,28 +311,119 @@ class Maze:
         tile = self.get_tile(x, y)
         return tile != 0  # Everything except walls
 
+    def distance_field(self, target):
+        """Maze distances (indexed y * width + x) to pixel position target
+
+        Targets in walls or outside the maze snap to the nearest walkable
+        tile. Fields are computed lazily and shared by every maze with the
+        same walls.
+        """
+        tile = self.nav.anchor(int(target[0] // TILE_SIZE), int(target[1] // TILE_SIZE))
+        return self.nav.distance_field(tile)
+
     def eat_pellet(self, x, y):
         """Eat pellet at position"""
-        if 0 <= y < len(self.layout) and 0 <= x < len(self.layout[0]):
-            tile = self.layout[y][x]
-            if tile in [1, 2]:  # Regular or power pellet
-                self.layout[y][x] = 3  # Empty
+        if 0 <= y < self.height and 0 <= x < self.width:
+            i = y * self.width + x
+            tile = self.tiles[i]
+            if tile == 1 or tile == 2:  # Regular or power pellet
+                self.tiles[i] = 3  # Empty
+                if tile == 1:
+                    self.pellet_bits &= ~(1 << i)
+                else:
+                    self.power_bits &= ~(1 << i)
+                if self.chunks:
+                    self.eaten_tiles.append((x, y))
                 return tile
         return None
 
-    def render(self, screen, offset_x=0, offset_y=0):
-        """Render the maze"""
-        for y, row in enumerate(self.layout):
-            for x, tile in enumerate(row):
-                px = offset_x + x * TILE_SIZE
-                py = offset_y + y * TILE_SIZE
-
-                if tile == 0:  # Wall
-                    pygame.draw.rect(screen, NEON_BLUE,
-                                   (px, py, TILE_SIZE, TILE_SIZE), 2)
-                elif tile == 1:  # Pellet
-                    pygame.draw.circle(screen, WHITE,
-                                     (px + TILE_SIZE//2, py + TILE_SIZE//2), 2)
-                elif tile == 2:  # Power pellet
-                    pygame.draw.circle(screen, NEON_YELLOW,
-                                     (px + TILE_SIZE//2, py + TILE_SIZE//2), 5)
+    def render(self, screen, offset_x=0, offset_y=0, area=None):
+        """Draw the part of the maze inside area (default: the screen's clip rect)
+
+        The maze is cut into square chunks of MAZE_CHUNK_TILES tiles that
+        are rendered on first use and cached; only the chunks overlapping
+        the visible area are blitted, so the cost follows the size of the
+        view rather than of the maze. area is also how the background under
+        moving sprites is restored. Returns the screen rect drawn.
+        """
+        self.update_surface()
+        view = screen.get_clip() if area is None else pygame.Rect(area)
+        view = view.clip((offset_x, offset_y, self.pixel_width, self.pixel_height))
+        if not view:
+            return view
+
+        # The part of view in maze pixels, cut along chunk boundaries
+        source = view.move(-offset_x, -offset_y)
+        for cy in range(source.top // CHUNK_PIXELS, (source.bottom - 1) // CHUNK_PIXELS + 1):
+            for cx in range(source.left // CHUNK_PIXELS, (source.right - 1) // CHUNK_PIXELS + 1):
+                x, y = cx * CHUNK_PIXELS, cy * CHUNK_PIXELS
+                part = source.move(-x, -y).clip(CHUNK_RECT)
+                screen.blit(self.get_chunk(cx, cy),
+                            (offset_x + x + part.x, offset_y + y + part.y), part)
+        return view
+
+    def update_surface(self):
+        """Clear pellets eaten since the last call from the cached chunks
+
+        Returns the rects (in maze pixels) of the eaten tiles.
+        """
+        changed = []
+        for x, y in self.eaten_tiles:
+            rect = pygame.Rect(x * TILE_SIZE, y * TILE_SIZE, TILE_SIZE, TILE_SIZE)
+            chunk = self.chunks.get((x // MAZE_CHUNK_TILES, y // MAZE_CHUNK_TILES))
+            if chunk is not None:
+                # Pellet tiles never contain wall pixels, so clearing them is enough
+                chunk.fill(BLACK, rect.move(-(x // MAZE_CHUNK_TILES) * CHUNK_PIXELS,
+                                            -(y // MAZE_CHUNK_TILES) * CHUNK_PIXELS))
+            changed.append(rect)
+        self.eaten_tiles.clear()
+        return changed
+
+    def get_chunk(self, cx, cy):
+        """Chunk (cx, cy): a copy of its wall chunk with the remaining pellets drawn on"""
+        key = (cx, cy)
+        chunk = self.chunks.get(key)
+        if chunk is not None:
+            self.chunks.move_to_end(key)
+            return chunk
+
+        chunk = self.get_wall_chunk(cx, cy).copy()
+        x0, y0 = cx * MAZE_CHUNK_TILES, cy * MAZE_CHUNK_TILES
+        mask = self.region_mask(x0, y0, x0 + MAZE_CHUNK_TILES, y0 + MAZE_CHUNK_TILES)
+        for color, radius, bits in ((WHITE, 2, self.pellet_bits), (NEON_YELLOW, 5, self.power_bits)):
+            for i in iter_bits(bits & mask):
+                x, y = i % self.width - x0, i // self.width - y0
+                center = (x * TILE_SIZE + TILE_SIZE // 2, y * TILE_SIZE + TILE_SIZE // 2)
+                pygame.draw.circle(chunk, color, center, radius)
+
+        self.chunks[key] = chunk
+        if len(self.chunks) > MAZE_CHUNK_CACHE:
+            self.chunks.popitem(last=False)
+        return chunk
+
+    def get_wall_chunk(self, cx, cy):
+        """Walls of chunk (cx, cy) on a background-coloured surface, shared per layout"""
+        layer = _wall_chunks.get(self.nav)
+        if layer is None:
+            layer = _wall_chunks[self.nav] = OrderedDict()
+        key = (cx, cy)
+        surface = layer.get(key)
+        if surface is not None:
+            layer.move_to_end(key)
+            return surface
+
+        surface = pygame.Surface((CHUNK_PIXELS, CHUNK_PIXELS))
+        if pygame.display.get_surface() is not None:
+            surface = surface.convert()
+        surface.fill(BLACK)
+        x0, y0 = cx * MAZE_CHUNK_TILES, cy * MAZE_CHUNK_TILES
+        mask = self.region_mask(x0, y0, x0 + MAZE_CHUNK_TILES, y0 + MAZE_CHUNK_TILES)
+        for i in iter_bits(self.wall_bits & mask):
+            x, y = i % self.width - x0, i // self.width - y0
+            pygame.draw.rect(surface, NEON_BLUE,
+                             (x * TILE_SIZE, y * TILE_SIZE, TILE_SIZE, TILE_SIZE), 2)
+
+        layer[key] = surface
+        if len(layer) > MAZE_CHUNK_CACHE:
+            layer.popitem(last=False)
+        return surface
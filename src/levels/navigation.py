@@ -0,0 +1,257 @@
+"""Precomputed maze navigation table"""
+from collections import OrderedDict
+from src.config import *
+
+# Direction bits, listed in the order ghosts consider them: up, down, left, right
+UP, DOWN, LEFT, RIGHT = 1, 2, 4, 8
+DIRECTIONS = ((0, -1), (0, 1), (-1, 0), (1, 0))
+DIRECTION_BITS = {(0, -1): UP, (0, 1): DOWN, (-1, 0): LEFT, (1, 0): RIGHT}
+
+# Bitmask -> tuple of directions it contains (in DIRECTIONS order)
+MASK_DIRECTIONS = tuple(
+    tuple(d for d in DIRECTIONS if mask & DIRECTION_BITS[d]) for mask in range(16)
+)
+
+# Distance of tiles that cannot reach a distance field's target
+UNREACHABLE = 0xFFFF
+
+_graph_cache = {}
+_GRAPH_CACHE_SIZE = 32
+DISTANCE_CACHE_SIZE = 512  # fields kept per layout (enough for every classic-maze tile)
+DISTANCE_CACHE_TILES = 1 << 19  # bigger mazes keep fewer fields: at most this many entries in all
+SLICE_TILES = 1 << 11  # tiles handled between yields when a graph is built in slices
+
+
+class NavGraph:
+    """Walkability, open directions and tunnel links for one maze layout.
+
+    Player and Ghost movement checks probe `reach` pixels ahead of the
+    entity's center. Whether a probe leaves the current tile depends only
+    on the entity's tile and on which part of that tile it stands in, so
+    for each (tile, zone) the set of passable directions is precomputed as
+    a bitmask and movement checks become a single table lookup.
+    """
+
+    def __init__(self, layout):
+        for _ in self.build(layout):
+            pass
+
+    def build(self, layout):
+        """Work out the tables for layout (a generator: each next() does about
+        SLICE_TILES tiles of work, so a big maze can be built in slices)"""
+        self.height = len(layout)
+        self.width = len(layout[0])
+        w, h = self.width, self.height
+        rows_per_slice = max(1, SLICE_TILES // w)
+
+        # Rows whose two edge tiles are open wrap around horizontally
+        self.wrap = {}
+        for y, row in enumerate(layout):
+            if row[0] != 0 and row[w - 1] != 0:
+                self.wrap[y * w] = y * w + w - 1
+                self.wrap[y * w + w - 1] = y * w
+
+        # Walkable flags with a one-tile border; tunnel rows copy the far edge
+        self.stride = w + 2
+        self.walkable = bytearray(self.stride * (h + 2))
+        for y, row in enumerate(layout):
+            base = (y + 1) * self.stride + 1
+            for x, tile in enumerate(row):
+                self.walkable[base + x] = tile != 0
+            if y * w in self.wrap:
+                self.walkable[base - 1] = 1
+                self.walkable[base + w] = 1
+            if y % rows_per_slice == 0:
+                yield
+
+        # Per-tile open neighbours and intersection flags
+        self.open_dirs = bytearray(w * h)
+        self.intersection = bytearray(w * h)
+        self.walkable_tiles = []
+        for y in range(h):
+            for x in range(w):
+                if not self.is_walkable(x, y):
+                    continue
+                self.walkable_tiles.append((x, y))
+                mask = 0
+                for d in DIRECTIONS:
+                    if self.is_walkable(x + d[0], y + d[1]):
+                        mask |= DIRECTION_BITS[d]
+                self.open_dirs[y * w + x] = mask
+                self.intersection[y * w + x] = len(MASK_DIRECTIONS[mask]) >= 3
+            if y % rows_per_slice == 0:
+                yield
+
+        # Neighbour tile indices of open directions, for graph searches
+        self.adjacency = []
+        for start in range(0, w * h, SLICE_TILES):
+            self.adjacency += [
+                tuple(self.neighbor_index(i, d) for d in MASK_DIRECTIONS[self.open_dirs[i]])
+                for i in range(start, min(start + SLICE_TILES, w * h))
+            ]
+            yield
+
+        self._zone_table = None
+        self._anchors = None
+        self._fields = OrderedDict()
+        self.field_limit = max(4, min(DISTANCE_CACHE_SIZE, DISTANCE_CACHE_TILES // (w * h)))
+
+    @classmethod
+    def for_layout(cls, layout, key=None):
+        """Shared graph for a layout, built only when its walls are new
+
+        key identifies the wall layout; callers that already have a compact
+        description of the walls (e.g. Maze's wall bitboard) can pass it to
+        skip hashing the whole layout.
+        """
+        if key is None:
+            key = (len(layout[0]), bytes(tile != 0 for row in layout for tile in row))
+        graph = _graph_cache.get(key)
+        if graph is None:
+            if len(_graph_cache) >= _GRAPH_CACHE_SIZE:
+                _graph_cache.pop(next(iter(_graph_cache)))
+            graph = _graph_cache[key] = cls(layout)
+        return graph
+
+    def is_walkable(self, x, y):
+        """Check a grid position, following tunnel links one tile past the edge"""
+        if -1 <= x <= self.width and -1 <= y <= self.height:
+            return self.walkable[(y + 1) * self.stride + x + 1] == 1
+        return False
+
+    def neighbor(self, x, y, direction):
+        """Grid position one step away, wrapped through tunnels"""
+        return (x + direction[0]) % self.width, y + direction[1]
+
+    def neighbor_index(self, index, direction):
+        """Tile index one step away from tile index, wrapped through tunnels"""
+        x = (index % self.width + direction[0]) % self.width
+        y = min(max(index // self.width + direction[1], 0), self.height - 1)
+        return y * self.width + x
+
+    def exits(self, x, y):
+        """Open directions out of a tile"""
+        return MASK_DIRECTIONS[self.open_dirs[y * self.width + x]]
+
+    def is_intersection(self, x, y):
+        """True for tiles with three or more exits"""
+        return self.intersection[y * self.width + x] == 1
+
+    def zone_table(self):
+        """Open-direction masks indexed by tile * 16 + zone
+
+        The probe distance only decides which zone a position falls in, so
+        one table serves every reach.
+        """
+        if self._zone_table is None:
+            for _ in self.build_zone_table():
+                pass
+        return self._zone_table
+
+    def build_zone_table(self):
+        """Work out zone_table() in slices (a generator, like build())"""
+        rows_per_slice = max(1, SLICE_TILES // self.width)
+        table = bytearray(self.width * self.height * 16)
+        # A tile's 16 entries depend only on which of it and its neighbours
+        # are walkable, so each of the 32 combinations is worked out once
+        patterns = {}
+        for y in range(self.height):
+            for x in range(self.width):
+                here = self.is_walkable(x, y)
+                # Zone bits: probe crosses the left, right, top, bottom tile edge
+                crossed = (self.is_walkable(x - 1, y), self.is_walkable(x + 1, y),
+                           self.is_walkable(x, y - 1), self.is_walkable(x, y + 1))
+                key = (here,) + crossed
+                pattern = patterns.get(key)
+                if pattern is None:
+                    pattern = patterns[key] = bytes(
+                        (UP if up else 0) | (DOWN if down else 0) |
+                        (LEFT if left else 0) | (RIGHT if right else 0)
+                        for left, right, up, down in (
+                            [crossed[i] if zone & (1 << i) else here for i in range(4)]
+                            for zone in range(16)))
+                base = (y * self.width + x) * 16
+                table[base:base + 16] = pattern
+            if y % rows_per_slice == 0:
+                yield
+        self._zone_table = table
+
+    def open_directions(self, x, y, reach):
+        """Bitmask of directions an entity at pixel (x, y) can move in"""
+        gx = int(x // TILE_SIZE)
+        gy = int(y // TILE_SIZE)
+        fx = x - gx * TILE_SIZE
+        fy = y - gy * TILE_SIZE
+        zone = ((fx < reach) | ((fx + reach >= TILE_SIZE) << 1) |
+                ((fy < reach) << 2) | ((fy + reach >= TILE_SIZE) << 3))
+        table = self._zone_table or self.zone_table()
+        return table[(gy * self.width + gx) * 16 + zone]
+
+    def can_move(self, x, y, direction, reach):
+        """Check if an entity at pixel (x, y) can move in direction"""
+        bit = DIRECTION_BITS.get(direction)
+        return bit is not None and self.open_directions(x, y, reach) & bit != 0
+
+    def anchor(self, x, y):
+        """Index of the walkable tile nearest to grid position (x, y)
+
+        Ghost targets such as the scatter corners or a spot four tiles
+        ahead of the player often fall inside walls or outside the maze.
+        """
+        if self._anchors is None:
+            for _ in self.build_anchors():
+                pass
+        x = min(max(x, 0), self.width - 1)
+        y = min(max(y, 0), self.height - 1)
+        return self._anchors[y * self.width + x]
+
+    def build_anchors(self):
+        """Nearest walkable tile of every tile for anchor(), by multi-source BFS
+        from every walkable tile (a generator, like build())"""
+        w, h = self.width, self.height
+        anchors = [-1] * (w * h)
+        frontier = [y * w + x for x, y in self.walkable_tiles]
+        for i in frontier:
+            anchors[i] = i
+        visited = 0
+        while frontier:
+            next_frontier = []
+            for i in frontier:
+                x, y = i % w, i // w
+                for nx, ny in ((x, y - 1), (x, y + 1), (x - 1, y), (x + 1, y)):
+                    if 0 <= nx < w and 0 <= ny < h and anchors[ny * w + nx] == -1:
+                        anchors[ny * w + nx] = anchors[i]
+                        next_frontier.append(ny * w + nx)
+                visited += 1
+                if visited == SLICE_TILES:
+                    visited = 0
+                    yield
+            frontier = next_frontier
+        self._anchors = anchors
+
+    def distance_field(self, target):
+        """Maze distance from every tile to tile index target (LRU cached)"""
+        field = self._fields.get(target)
+        if field is not None:
+            self._fields.move_to_end(target)
+            return field
+
+        field = [UNREACHABLE] * (self.width * self.height)
+        field[target] = 0
+        frontier = [target]
+        adjacency = self.adjacency
+        dist = 0
+        while frontier:
+            dist += 1
+            next_frontier = []
+            for i in frontier:
+                for j in adjacency[i]:
+                    if field[j] == UNREACHABLE:
+                        field[j] = dist
+                        next_frontier.append(j)
+            frontier = next_frontier
+
+        self._fields[target] = field
+        if len(self._fields) > self.field_limit:
+            self._fields.popitem(last=False)
+        return field
@@ -0,0 +1,210 @@
+"""Time-budgeted lookahead bot that steers the player"""
+import time
+from src.config import *
+from src.sim.simulation import ACTIONS, Simulation
+from src.sim.state import PLAYER_NEXT_DIRECTION
+
+MOVES = (1, 2, 3, 4)  # ACTIONS indices the search branches on: up, down, left, right
+LIFE_VALUE = 5000  # score a life is worth to the evaluation
+DANGER_RADIUS = 4  # tiles of maze distance at which a hunting ghost starts to count
+DANGER_COST = 300  # per tile a hunting ghost is inside DANGER_RADIUS
+PELLET_PULL = 2  # per tile of maze distance to the nearest pellet
+
+
+def outcome(state):
+    """Player record of state without the turn still buffered
+
+    Within a move the player's record decides everything else (ghosts
+    chase it, pellets are eaten by it) and the buffered turn is replaced
+    by the next move, so moves with the same outcome share a future.
+    """
+    player = state.player
+    return player[:PLAYER_NEXT_DIRECTION.start] + player[PLAYER_NEXT_DIRECTION.stop:]
+
+
+class Node:
+    """A game state in the search tree"""
+
+    __slots__ = ("state", "tick", "value", "terminal", "children", "untried", "height")
+
+    def __init__(self, state, tick, value, terminal):
+        self.state = state  # GameState (from Simulation.snapshot)
+        self.tick = tick
+        self.value = value  # evaluation, or the best child's value once searched
+        self.terminal = terminal  # a life is lost here, or on every line below
+        self.children = []  # (move, Node)
+        self.untried = list(MOVES)
+        self.height = 0  # moves searched below this node
+
+
+class Autopilot:
+    """Picks the player's direction by searching ahead on a forward model.
+
+    The model is a private Simulation restored from snapshots, so the
+    search plays by exactly the rules of the live game: Player.update, the
+    ghost AI, power-ups and check_ghost_collision. A move holds one
+    direction for step_ticks ticks; the game is deterministic, so the
+    state a move reaches in the model is the state the live game reaches.
+
+    think() deepens the search one move at a time under a time budget,
+    stopping before the next expansion would overrun it; an interrupted
+    iteration resumes where it stopped on the next call. The move being
+    played is committed and the search works in the subtree it leads to,
+    which becomes the root when the live game gets there, so the work of
+    earlier frames carries over. Only think() expands nodes: when the
+    game reaches a state the search has no moves from, the current move
+    is kept for another step and think() searches on from where it leads.
+    """
+
+    def __init__(self, budget_ms=AUTOPILOT_BUDGET_MS, step_ticks=AUTOPILOT_STEP_TICKS):
+        self.budget = budget_ms / 1000
+        self.step_ticks = step_ticks
+        self.model = Simulation()
+        self.root = None  # where the move being played started
+        self.move = 0  # ACTIONS index being played
+        self.next = None  # node the move leads to, where the search works
+        self.expand_cost = 0.0  # recent worst seconds per expansion (decays as the search goes on)
+
+        # Statistics
+        self.nodes = 0  # nodes expanded
+        self.search_time = 0.0  # seconds spent expanding
+        self.depth = 0  # moves searched beyond the one being played
+
+    def direction(self, sim):
+        """Direction for the tick sim is about to play; call before every tick"""
+        root = self.root
+        if root is None or not root.tick <= sim.tick < root.tick + self.step_ticks:
+            self.decide(sim)
+        return ACTIONS[self.move]
+
+    def decide(self, sim):
+        """Move the root to sim's state and commit to the best move from it"""
+        state = sim.snapshot()
+        node = self.next
+        if node is None or node.tick != sim.tick or node.state != state:
+            # First move, or the game went off plan (a restore, a new game)
+            self.model.restore(state)
+            node = self.evaluate(state)
+        self.root = node
+        if node.children:
+            self.move, self.next = max(node.children, key=lambda child: child[1].value)
+            self.depth = self.next.height
+        else:
+            # Nothing searched from here: keep the move, think() expands it
+            self.next = None
+            self.depth = 0
+
+    def think(self, budget=None):
+        """Search below the committed move for up to budget seconds (default:
+        the autopilot's budget); returns the number of nodes expanded"""
+        node = self.next
+        nodes = self.nodes
+        deadline = time.perf_counter() + (self.budget if budget is None else budget)
+        if node is None:
+            root = self.root
+            if root is None or root.terminal:
+                return 0
+            if time.perf_counter() + self.expand_cost <= deadline:
+                node = self.next = self.expand(root, self.move)
+        while node is not None and self.deepen(node, self.depth + 1, deadline):
+            self.depth += 1
+        if self.nodes == nodes:
+            self.expand_cost *= 0.9  # let a one-off slow expansion wear off
+        return self.nodes - nodes
+
+    def deepen(self, node, depth, deadline):
+        """Search node's subtree depth moves deep. Returns None if the deadline
+        cut it short, else whether any line survives to that depth."""
+        if node.terminal:
+            return False
+        if node.height >= depth:
+            return True
+        while node.untried:
+            if time.perf_counter() + self.expand_cost > deadline:
+                return None
+            self.expand(node, node.untried[0])
+
+        alive = False
+        for _, child in node.children:
+            result = self.deepen(child, depth - 1, deadline)
+            if result is None:
+                return None
+            alive = alive or result
+        node.value = max(child.value for _, child in node.children)
+        if alive:
+            node.height = depth
+        else:
+            node.terminal = True
+        return alive
+
+    def expand(self, node, move):
+        """Play move from node on the model and add the result as a child;
+        returns the child, or None if another move already leads there"""
+        start = time.perf_counter()
+        if move in node.untried:
+            node.untried.remove(move)
+        model = self.model
+        model.restore(node.state)
+        for _ in range(self.step_ticks):
+            model.step(move)
+            if model.death_timer > 0 or model.game_over:
+                break
+        child = self.evaluate(model.snapshot())
+        key = outcome(child.state)
+        if all(outcome(other.state) != key for _, other in node.children):
+            node.children.append((move, child))
+            node.value = max(other.value for _, other in node.children)
+        else:
+            child = None
+
+        elapsed = time.perf_counter() - start
+        self.expand_cost = max(elapsed, self.expand_cost * 0.98)
+        self.nodes += 1
+        self.search_time += elapsed
+        return child
+
+    def evaluate(self, state):
+        """Leaf node for state, which the model must hold: score and lives,
+        less the distance to food and the danger from nearby hunting ghosts"""
+        model = self.model
+        player = model.player
+        value = player.score + player.lives * LIFE_VALUE
+        terminal = model.death_timer > 0 or model.game_over
+        if not terminal:
+            maze = model.maze
+            field = maze.distance_field((player.x, player.y))
+            for ghost in model.ghosts:
+                if ghost.state in ("scatter", "chase"):
+                    dist = field[maze.nav.anchor(int(ghost.x // TILE_SIZE), int(ghost.y // TILE_SIZE))]
+                    if dist < DANGER_RADIUS:
+                        value -= (DANGER_RADIUS - dist) * DANGER_COST
+            if model.swarm is not None:
+                value -= self.swarm_danger(model.swarm, player)
+
+            pellet = maze.nearest_pellet(int(player.x // TILE_SIZE), int(player.y // TILE_SIZE))
+            if pellet is not None:
+                value -= field[pellet[1] * maze.width + pellet[0]] * PELLET_PULL
+        return Node(state, model.tick, value, terminal)
+
+    @staticmethod
+    def swarm_danger(swarm, player):
+        """Danger term for the hunting ghosts of a GhostSwarm"""
+        import numpy as np
+        from src.sim.ghost_arrays import FRIGHTENED
+        maze = swarm.maze
+        field = swarm.distance_field(maze.nav.anchor(int(player.x // TILE_SIZE), int(player.y // TILE_SIZE)))
+        hunting = swarm.state < FRIGHTENED
+        tiles = ((swarm.y[hunting] / TILE_SIZE).astype(np.int64) * maze.width +
+                 (swarm.x[hunting] / TILE_SIZE).astype(np.int64))
+        dist = field[tiles]
+        return int((DANGER_RADIUS - dist[dist < DANGER_RADIUS]).sum()) * DANGER_COST
+
+    def stats(self):
+        """Search statistics: nodes expanded, nodes per second of search, and the
+        depth searched (in moves and in ticks) beyond the move being played"""
+        return {
+            "nodes": self.nodes,
+            "nodes_per_second": self.nodes / self.search_time if self.search_time else 0.0,
+            "depth": self.depth,
+            "lookahead_ticks": (self.depth + 1) * self.step_ticks,
+        }
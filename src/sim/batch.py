@@ -0,0 +1,377 @@
+"""NumPy-vectorized engine that advances N headless games in lockstep"""
+import numpy as np
+from src.config import *
+from src.levels.maze import CLASSIC_MAZE_LAYOUT
+from src.levels.navigation import NavGraph
+from src.sim.ghost_arrays import (SCATTER, CHASE, FRIGHTENED, EATEN, CLYDE, DIRS_X, DIRS_Y,
+                                  pick_directions, tiles_ahead, valid_directions)
+from src.sim.simulation import ACTIONS, PLAYER_START, GHOST_HOUSE_Y, RESPAWN_DELAY
+
+GHOST_START_X = np.array([13, 14, 15, 16], dtype=np.float64) * TILE_SIZE
+
+ACTION_DX = np.array([a[0] for a in ACTIONS], dtype=np.int8)
+ACTION_DY = np.array([a[1] for a in ACTIONS], dtype=np.int8)
+
+
+class BatchSimulation:
+    """N independent games stored as (N, ...) arrays and stepped together.
+
+    Each step() runs the same rules as Simulation.step (Player.update,
+    Ghost.update/move/choose_direction, the power pellet check and
+    check_ghost_collision) as a handful of vectorized passes over all
+    games. Power-ups are not simulated. Frightened ghosts draw their
+    random turns from a per-batch numpy Generator, so runs are
+    reproducible for a given seed but do not match Simulation tick for tick.
+
+    Only the first level is played. It is the classic maze in both
+    engines, but from level 2 on Simulation plays generated mazes of
+    growing size, which the batch's shared distance table cannot follow.
+    So a game that clears the level is awarded the bonus and then
+    truncated: it stops stepping, with its truncated flag set, until it
+    is reset.
+    """
+
+    def __init__(self, num_games, dt=SIM_DT, seed=None):
+        self.n = num_games
+        self.dt = dt
+        self.rng = np.random.default_rng(seed)
+
+        layout = np.array(CLASSIC_MAZE_LAYOUT, dtype=np.uint8)
+        self.height, self.width = layout.shape
+        self.initial_pellets = layout
+        self.total_pellets = int(np.count_nonzero((layout == 1) | (layout == 2)))
+
+        # NavGraph's walkable table is padded by one tile (tunnel rows wrap)
+        nav = NavGraph.for_layout(CLASSIC_MAZE_LAYOUT)
+        self.stride = nav.stride
+        self.walkable = np.frombuffer(bytes(nav.walkable), dtype=np.uint8).astype(bool)
+        self.world_width = self.width * TILE_SIZE
+
+        # Maze distance from every tile to every target tile (targets snap
+        # to their nearest walkable tile, as in Maze.distance_field)
+        w = self.width
+        self.distances = np.array(
+            [nav.distance_field(nav.anchor(i % w, i // w)) for i in range(w * self.height)],
+            dtype=np.int32)
+
+        n = num_games
+        self.pellets = np.empty((n, self.height, self.width), dtype=np.uint8)
+        self.pellets_remaining = np.empty(n, dtype=np.int32)
+
+        self.player_x = np.empty(n)
+        self.player_y = np.empty(n)
+        self.player_dir = np.zeros((n, 2), dtype=np.int8)
+        self.player_next_dir = np.zeros((n, 2), dtype=np.int8)
+        self.powered_up = np.zeros(n, dtype=bool)
+        self.power_timer = np.zeros(n)
+        self.score = np.zeros(n, dtype=np.int64)
+        self.lives = np.zeros(n, dtype=np.int8)
+        self.level = np.zeros(n, dtype=np.int32)
+
+        self.ghost_x = np.empty((n, 4))
+        self.ghost_y = np.empty((n, 4))
+        self.ghost_dx = np.zeros((n, 4), dtype=np.int8)
+        self.ghost_dy = np.zeros((n, 4), dtype=np.int8)
+        self.ghost_state = np.zeros((n, 4), dtype=np.int8)
+        self.ghost_speed = np.empty((n, 4))
+        self.mode_timer = np.zeros((n, 4))
+        self.frightened_timer = np.zeros((n, 4))
+        self.mode_duration = np.empty(n)
+
+        self.tick = np.zeros(n, dtype=np.int64)
+        self.death_timer = np.zeros(n)
+        self.game_over = np.zeros(n, dtype=bool)
+        self.truncated = np.zeros(n, dtype=bool)  # cleared level 1; see the class docstring
+
+        self.reset()
+
+    # ------------------------------------------------------------------
+    # Resets
+
+    def reset(self, mask=None):
+        """Start fresh games (all of them, or only where mask is True)"""
+        if mask is None:
+            mask = np.ones(self.n, dtype=bool)
+        else:
+            # A copy: the mask may be a view of game_over or truncated, cleared below
+            mask = np.array(mask, dtype=bool)
+        self.score[mask] = 0
+        self.lives[mask] = 3
+        self.level[mask] = 1
+        self.tick[mask] = 0
+        self.death_timer[mask] = 0
+        self.game_over[mask] = False
+        self.truncated[mask] = False
+        self._reset_level(mask)
+        return self.get_state()
+
+    def _reset_level(self, mask):
+        """Fresh maze, player at the start tile, new ghosts for current level"""
+        self.pellets[mask] = self.initial_pellets
+        self.pellets_remaining[mask] = self.total_pellets
+        self._reset_player(mask)
+
+        self.ghost_x[mask] = GHOST_START_X
+        self.ghost_y[mask] = GHOST_HOUSE_Y
+        self.ghost_dx[mask] = 0
+        self.ghost_dy[mask] = 0
+        self.ghost_state[mask] = SCATTER
+        self.mode_timer[mask] = 0
+        self.frightened_timer[mask] = 0
+
+        # LevelManager.adjust_ghost_difficulty
+        level = self.level[mask]
+        self.ghost_speed[mask] = (GHOST_SPEED * (1.0 + (level - 1) * 0.1))[:, None]
+        self.mode_duration[mask] = np.maximum(3000, 7000 - (level - 1) * 500)
+
+    def _reset_player(self, mask):
+        """Move players back to the start tile"""
+        self.player_x[mask] = PLAYER_START[0]
+        self.player_y[mask] = PLAYER_START[1]
+        self.player_dir[mask] = 0
+        self.player_next_dir[mask] = 0
+        self.powered_up[mask] = False
+        self.power_timer[mask] = 0
+
+    def _respawn(self, mask):
+        """Respawn players after death (Ghost.reset_position for all ghosts)"""
+        self._reset_player(mask)
+        self.ghost_x[mask] = GHOST_START_X
+        self.ghost_y[mask] = GHOST_HOUSE_Y
+        self.ghost_dx[mask] = 0
+        self.ghost_dy[mask] = 0
+        self.ghost_state[mask] = SCATTER
+        self.ghost_speed[mask] = GHOST_SPEED
+        self.mode_timer[mask] = 0
+
+    # ------------------------------------------------------------------
+    # Stepping
+
+    def step(self, actions=None):
+        """Advance every running game one tick and return the new state
+
+        actions is an (N,) array of indices into ACTIONS, or None to keep
+        each player's current next_direction.
+        """
+        dt_ms = self.dt * 1000
+        running = ~(self.game_over | self.truncated)
+        if actions is not None:
+            actions = np.asarray(actions)
+            self.player_next_dir[running, 0] = ACTION_DX[actions[running]]
+            self.player_next_dir[running, 1] = ACTION_DY[actions[running]]
+        self.tick[running] += 1
+
+        # Handle death timers
+        dying = running & (self.death_timer > 0)
+        if dying.any():
+            self.death_timer[dying] -= dt_ms
+            self._respawn(dying & (self.death_timer <= 0))
+        active = running & ~dying
+        if not active.any():
+            return self.get_state()
+
+        ate_pellet = self._update_players(active, dt_ms)
+        self._update_ghosts(active, dt_ms)
+
+        # Check if player collected power pellet
+        fright = active[:, None] & self.powered_up[:, None] & (self.ghost_state < FRIGHTENED)
+        if fright.any():
+            self.ghost_state[fright] = FRIGHTENED
+            self.frightened_timer[fright] = np.broadcast_to(self.power_timer[:, None], fright.shape)[fright]
+            self.ghost_speed[fright] = GHOST_FRIGHTENED_SPEED
+            self.ghost_dx[fright] = -self.ghost_dx[fright]
+            self.ghost_dy[fright] = -self.ghost_dy[fright]
+
+        self._check_collisions(active)
+
+        # Level completion: the bonus, then the game ends here (see the class docstring)
+        cleared = ate_pellet & (self.pellets_remaining == 0)
+        if cleared.any():
+            self.score[cleared] += 1000
+            self.truncated |= cleared
+
+        return self.get_state()
+
+    def _can_move(self, x, y, dx, dy, reach):
+        """Vectorized Player/Ghost.can_move: probe `reach` pixels ahead"""
+        gx = np.floor((x + dx * reach) / TILE_SIZE).astype(np.int64)
+        gy = np.floor((y + dy * reach) / TILE_SIZE).astype(np.int64)
+        np.clip(gx, -1, self.width, out=gx)
+        np.clip(gy, -1, self.height, out=gy)
+        return self.walkable[(gy + 1) * self.stride + gx + 1] & ((dx != 0) | (dy != 0))
+
+    def _update_players(self, active, dt_ms):
+        """Player.update for every active game; returns games that ate a pellet"""
+        reach = PLAYER_RADIUS + 2
+        x, y = self.player_x, self.player_y
+        ndx, ndy = self.player_next_dir[:, 0], self.player_next_dir[:, 1]
+
+        # Try to change direction
+        turn = active & self._can_move(x, y, ndx, ndy, reach)
+        self.player_dir[turn] = self.player_next_dir[turn]
+
+        # Move in current direction
+        dx, dy = self.player_dir[:, 0], self.player_dir[:, 1]
+        move = active & self._can_move(x, y, dx, dy, reach)
+        x[move] += dx[move] * PLAYER_SPEED
+        y[move] += dy[move] * PLAYER_SPEED
+        x[active] %= self.world_width
+
+        # Check for pellet collection
+        idx = np.flatnonzero(active)
+        gx = (x[idx] / TILE_SIZE).astype(np.int64)
+        gy = (y[idx] / TILE_SIZE).astype(np.int64)
+        tiles = self.pellets[idx, gy, gx]
+        eaten = (tiles == 1) | (tiles == 2)
+        ate_pellet = np.zeros(self.n, dtype=bool)
+        if eaten.any():
+            idx, gx, gy, tiles = idx[eaten], gx[eaten], gy[eaten], tiles[eaten]
+            self.pellets[idx, gy, gx] = 3
+            self.pellets_remaining[idx] -= 1
+            self.score[idx] += np.where(tiles == 1, 10, 50)
+            power = idx[tiles == 2]
+            self.powered_up[power] = True
+            self.power_timer[power] = POWER_PELLET_DURATION
+            ate_pellet[idx] = True
+
+        # Update power-up timer
+        powered = active & self.powered_up
+        self.power_timer[powered] -= dt_ms
+        self.powered_up[powered & (self.power_timer <= 0)] = False
+        return ate_pellet
+
+    def _update_ghosts(self, active, dt_ms):
+        """Ghost.update for every ghost in active games"""
+        act = np.broadcast_to(active[:, None], self.ghost_state.shape)
+        state = self.ghost_state
+
+        # Switch between scatter and chase
+        timed = act & (state < FRIGHTENED)
+        self.mode_timer[timed] += dt_ms
+        switch = timed & (self.mode_timer >= self.mode_duration[:, None])
+        self.mode_timer[switch] = 0
+        state[switch] = CHASE - state[switch]
+
+        # Frightened timer
+        scared = act & (state == FRIGHTENED)
+        self.frightened_timer[scared] -= dt_ms
+        calm = scared & (self.frightened_timer <= 0)
+        state[calm] = SCATTER
+        self.ghost_speed[calm] = GHOST_SPEED
+
+        self._move_ghosts(act, self._ghost_targets())
+
+    def _ghost_targets(self):
+        """Blinky/Pinky/Inky/Clyde update_ai targets as (N, 4) arrays"""
+        px, py = self.player_x[:, None], self.player_y[:, None]
+        pdx, pdy = self.player_dir[:, 0:1], self.player_dir[:, 1:2]
+        width, height = self.width * TILE_SIZE, self.height * TILE_SIZE
+
+        # Chase targets: player, 4 tiles ahead, 2 tiles ahead, player
+        ahead = np.array([0, 4, 2, 0]) * TILE_SIZE
+        tx = px + pdx * ahead
+        ty = py + pdy * ahead
+
+        # Clyde scatters when within 8 tiles of the player
+        shy = (self.ghost_x[:, CLYDE] - self.player_x) ** 2 + \
+              (self.ghost_y[:, CLYDE] - self.player_y) ** 2 <= (TILE_SIZE * 8) ** 2
+        tx[shy, CLYDE] = 0
+        ty[shy, CLYDE] = height
+
+        scatter_x = np.array([width, 0, width, 0], dtype=np.float64)
+        scatter_y = np.array([0, 0, height, height], dtype=np.float64)
+        state = self.ghost_state
+        tx = np.where(state == SCATTER, scatter_x, tx)
+        ty = np.where(state == SCATTER, scatter_y, ty)
+        tx = np.where(state == EATEN, GHOST_START_X, tx)
+        ty = np.where(state == EATEN, GHOST_HOUSE_Y, ty)
+        return tx, ty
+
+    def _choose_directions(self, mask, targets):
+        """Vectorized Ghost.choose_direction for ghosts where mask is True"""
+        reach = GHOST_RADIUS + 2
+        x, y = self.ghost_x, self.ghost_y
+        can = self._can_move(x[..., None], y[..., None], DIRS_X, DIRS_Y, reach)
+        valid = valid_directions(can, self.ghost_dx, self.ghost_dy)
+        mask = mask & valid.any(-1)
+        if not mask.any():
+            return
+
+        # Shortest maze path from the tile ahead in each direction
+        tx, ty = targets
+        w, h = self.width, self.height
+        ahead = tiles_ahead((x // TILE_SIZE).astype(np.int64), (y // TILE_SIZE).astype(np.int64), w, h)
+        target = (np.clip(np.floor(ty / TILE_SIZE), 0, h - 1).astype(np.int64) * w +
+                  np.clip(np.floor(tx / TILE_SIZE), 0, w - 1).astype(np.int64))
+        dist = self.distances[target[..., None], ahead]
+        frightened = mask & (self.ghost_state == FRIGHTENED)
+        pick = pick_directions(valid, dist, x, y, tx, ty, frightened, self.rng.random)
+
+        self.ghost_dx[mask] = DIRS_X[pick[mask]]
+        self.ghost_dy[mask] = DIRS_Y[pick[mask]]
+
+    def _move_ghosts(self, act, targets):
+        """Vectorized Ghost.move"""
+        reach = GHOST_RADIUS + 2
+        x, y = self.ghost_x, self.ghost_y
+
+        # Allow direction change close to tile centers
+        cx = (x / TILE_SIZE).astype(np.int64) * TILE_SIZE + TILE_SIZE // 2
+        cy = (y / TILE_SIZE).astype(np.int64) * TILE_SIZE + TILE_SIZE // 2
+        self._choose_directions(act & (np.abs(x - cx) + np.abs(y - cy) < 3), targets)
+
+        dx, dy = self.ghost_dx, self.ghost_dy
+        can = self._can_move(x, y, dx, dy, reach)
+        move = act & can
+        x[move] += dx[move] * self.ghost_speed[move]
+        y[move] += dy[move] * self.ghost_speed[move]
+        # Stuck, choose new direction immediately
+        self._choose_directions(act & ~can, targets)
+        x[act] %= self.world_width
+
+    def _check_collisions(self, active):
+        """Vectorized check_ghost_collision plus its consequences"""
+        reach = (PLAYER_RADIUS + GHOST_RADIUS) ** 2
+        hit = active[:, None] & (
+            (self.ghost_x - self.player_x[:, None]) ** 2 +
+            (self.ghost_y - self.player_y[:, None]) ** 2 < reach)
+        if not hit.any():
+            return
+
+        # Ghosts are checked in order; the first catching ghost ends the scan
+        catch = hit & (self.ghost_state < FRIGHTENED)
+        caught = catch.any(-1)
+        first = np.where(caught, catch.argmax(-1), 4)
+        eat = hit & (self.ghost_state == FRIGHTENED) & (np.arange(4) < first[:, None])
+        if eat.any():
+            self.ghost_x[eat] = np.broadcast_to(GHOST_START_X, eat.shape)[eat]
+            self.ghost_y[eat] = GHOST_HOUSE_Y
+            self.ghost_dx[eat] = 0
+            self.ghost_dy[eat] = 0
+            self.ghost_state[eat] = SCATTER
+            self.ghost_speed[eat] = GHOST_SPEED
+            self.mode_timer[eat] = 0
+            self.score += 200 * eat.sum(-1)
+
+        if caught.any():
+            self.lives[caught] -= 1
+            self.death_timer[caught & (self.lives > 0)] = RESPAWN_DELAY
+            self.game_over |= caught & (self.lives <= 0)
+
+    def get_state(self):
+        """Views of the per-game state arrays (do not modify)"""
+        return {
+            "tick": self.tick,
+            "score": self.score,
+            "lives": self.lives,
+            "level": self.level,
+            "player_x": self.player_x,
+            "player_y": self.player_y,
+            "ghost_x": self.ghost_x,
+            "ghost_y": self.ghost_y,
+            "ghost_state": self.ghost_state,
+            "pellets_remaining": self.pellets_remaining,
+            "dying": self.death_timer > 0,
+            "game_over": self.game_over,
+            "truncated": self.truncated,
+        }
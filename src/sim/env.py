@@ -0,0 +1,222 @@
+"""Gym-style environments for training agents against the simulation"""
+import numpy as np
+from src.config import *
+from src.levels.maze import iter_bits
+from src.sim.simulation import ACTIONS, Simulation
+from src.sim.state import GHOST_STATES, GHOST_STATE_INDEX
+
+# Observation channels, one (height, width) tile plane each. Entity planes
+# count the entities on each tile; the ghost planes are split by state.
+CHANNELS = (("walls", "pellets", "power pellets", "player") +
+            tuple(f"{state} ghosts" for state in GHOST_STATES) + ("power-ups",))
+WALLS, PELLETS, POWER_PELLETS, PLAYER, GHOSTS, POWERUPS = 0, 1, 2, 3, 4, 8
+
+
+class PacmanEnv:
+    """reset(seed) / step(action) over a headless Simulation.
+
+    Follows the Gymnasium API without depending on it: reset returns
+    (observation, info) and step returns (observation, reward, terminated,
+    truncated, info). Actions are indices into ACTIONS; the reward is the
+    score gained during the step.
+
+    The observation is a (len(CHANNELS), height, width) float32 array
+    that the env owns and patches in place: each step only rewrites the
+    tiles whose pellets were eaten and the cells entities left or entered,
+    so step() returns the same array every time. Copy it to keep an old
+    observation. Raw tile codes are available without any copying as
+    `tiles`, a view of the maze's own buffer.
+
+    The grid has a fixed size (the classic maze by default); a smaller
+    maze sits in its top-left corner with walls around it. Later levels
+    play on bigger generated mazes, and an episode is truncated when it
+    reaches one that does not fit.
+    """
+
+    action_count = len(ACTIONS)
+
+    def __init__(self, size=(MAZE_WIDTH, MAZE_HEIGHT), max_steps=None, swarm=0, buffer=None):
+        self.width, self.height = size
+        self.max_steps = max_steps
+        self.sim = Simulation(swarm=swarm)
+        # buffer: a caller-owned (channels, height, width) float32 array to write into
+        self.observation = buffer if buffer is not None else np.zeros(
+            (len(CHANNELS), self.height, self.width), dtype=np.float32)
+        self.cells = self.observation.reshape(-1)  # flat view for scatter updates
+        self.maze = None
+        self.fits = True
+        self.pellet_bits = self.power_bits = 0
+        self.entities = np.zeros(0, dtype=np.int64)  # flat cells counted last step
+
+    @property
+    def tiles(self):
+        """Current maze's tile codes as a (height, width) view (no copy)"""
+        return self.sim.maze.as_array()
+
+    def reset(self, seed=None):
+        """Start a new episode (reseeding the game if seed is given)"""
+        self.sim.reset(seed)
+        self.sync_maze()
+        self.sync_entities()
+        return self.observation, self.info()
+
+    def step(self, action):
+        """Advance one tick with action (an index into ACTIONS)"""
+        score = self.sim.player.score
+        self.advance(action)
+        self.sync_entities()
+        return self.result(score)
+
+    def advance(self, action):
+        """Tick the simulation and update the maze planes (the entity planes
+        are left to sync_entities)"""
+        sim = self.sim
+        sim.step(action)
+        if sim.maze is not self.maze:
+            self.sync_maze()
+        else:
+            self.sync_pellets()
+
+    def result(self, score):
+        """step()'s return value, given the score before the step"""
+        sim = self.sim
+        truncated = not self.fits or (self.max_steps is not None and sim.tick >= self.max_steps)
+        return (self.observation, float(sim.player.score - score), sim.game_over,
+                truncated and not sim.game_over, self.info())
+
+    def info(self):
+        """Extra per-step data: counters and the tick's simulation events"""
+        sim = self.sim
+        return {
+            "tick": sim.tick,
+            "score": sim.player.score,
+            "lives": sim.player.lives,
+            "level": sim.level_manager.current_level,
+            "events": sim.events,
+        }
+
+    def sync_maze(self):
+        """Redraw every plane for a new maze"""
+        maze = self.maze = self.sim.maze
+        obs = self.observation
+        obs[:] = 0
+        obs[WALLS] = 1
+        self.entities = self.entities[:0]
+        self.fits = maze.width <= self.width and maze.height <= self.height
+        if not self.fits:
+            return
+        tiles = maze.as_array()
+        h, w = tiles.shape
+        obs[WALLS, :h, :w] = tiles == 0
+        obs[PELLETS, :h, :w] = tiles == 1
+        obs[POWER_PELLETS, :h, :w] = tiles == 2
+        self.pellet_bits, self.power_bits = maze.pellet_bits, maze.power_bits
+
+    def sync_pellets(self):
+        """Clear the pellets eaten since the last step (usually none or one)"""
+        maze = self.maze
+        changed = (self.pellet_bits ^ maze.pellet_bits) | (self.power_bits ^ maze.power_bits)
+        if not changed or not self.fits:
+            return
+        obs = self.observation
+        for i in iter_bits(changed):
+            y, x = divmod(i, maze.width)
+            obs[PELLETS, y, x] = maze.pellet_bits >> i & 1
+            obs[POWER_PELLETS, y, x] = maze.power_bits >> i & 1
+        self.pellet_bits, self.power_bits = maze.pellet_bits, maze.power_bits
+
+    def sync_entities(self):
+        """Move the entity counts from last step's cells to the current ones"""
+        cells = self.entity_cells()
+        np.subtract.at(self.cells, self.entities, 1)
+        np.add.at(self.cells, cells, 1)
+        self.entities = cells
+
+    def entity_cells(self):
+        """Flat observation cell of every entity, one entry per entity"""
+        if not self.fits:
+            return self.entities[:0]
+        sim = self.sim
+        plane = self.width * self.height
+        cells = [PLAYER * plane + self.cell(sim.player.x, sim.player.y)]
+        cells += [(GHOSTS + GHOST_STATE_INDEX[ghost.state]) * plane + self.cell(ghost.x, ghost.y)
+                  for ghost in sim.ghosts]
+        cells += [POWERUPS * plane + self.cell(powerup.x, powerup.y)
+                  for powerup in sim.powerup_manager.powerups]
+        cells = np.array(cells, dtype=np.int64)
+
+        swarm = sim.swarm
+        if swarm is not None:
+            gx = np.minimum((swarm.x / TILE_SIZE).astype(np.int64), self.maze.width - 1)
+            gy = np.minimum((swarm.y / TILE_SIZE).astype(np.int64), self.maze.height - 1)
+            states = swarm.state.astype(np.int64)
+            cells = np.concatenate((cells, (GHOSTS + states) * plane + gy * self.width + gx))
+        return cells
+
+    def cell(self, x, y):
+        """Grid cell index of maze pixel (x, y)"""
+        maze = self.maze
+        return (min(int(y // TILE_SIZE), maze.height - 1) * self.width +
+                min(int(x // TILE_SIZE), maze.width - 1))
+
+
+class VectorPacmanEnv:
+    """N PacmanEnvs reset and stepped together.
+
+    Observations live in one (N, channels, height, width) array that
+    reset() and step() return whole, without stacking or copying
+    anything. Each env has its own Simulation, so the games themselves
+    are ticked one env at a time, as are the pellet planes (usually one
+    tile or none); the entity planes of all envs are then moved in one
+    scatter over the whole batch. Episodes that end are reset within the
+    same step() (their final score is reported in that env's info as
+    "final_score").
+    """
+
+    action_count = len(ACTIONS)
+
+    def __init__(self, num_envs, size=(MAZE_WIDTH, MAZE_HEIGHT), max_steps=None, swarm=0):
+        width, height = size
+        self.num_envs = num_envs
+        self.observations = np.zeros((num_envs, len(CHANNELS), height, width), dtype=np.float32)
+        self.cells = self.observations.reshape(-1)  # flat view for the batched scatter
+        self.envs = [PacmanEnv(size, max_steps, swarm, buffer=self.observations[i])
+                     for i in range(num_envs)]
+        self.rewards = np.zeros(num_envs, dtype=np.float32)
+        self.terminated = np.zeros(num_envs, dtype=bool)
+        self.truncated = np.zeros(num_envs, dtype=bool)
+
+    def reset(self, seed=None):
+        """Reset every env; seed is one int (env i gets seed + i) or a sequence"""
+        if seed is None or isinstance(seed, int):
+            seeds = [None if seed is None else seed + i for i in range(self.num_envs)]
+        else:
+            seeds = seed
+        infos = [env.reset(s)[1] for env, s in zip(self.envs, seeds)]
+        return self.observations, infos
+
+    def step(self, actions):
+        """Step env i with actions[i]; returns batched arrays and a list of infos"""
+        envs = self.envs
+        scores = [env.sim.player.score for env in envs]
+        size = self.observations[0].size
+        left, entered = [], []
+        for i, (env, action) in enumerate(zip(envs, actions)):
+            env.advance(int(action))
+            left.append(env.entities + i * size)
+            env.entities = env.entity_cells()
+            entered.append(env.entities + i * size)
+        np.subtract.at(self.cells, np.concatenate(left), 1)
+        np.add.at(self.cells, np.concatenate(entered), 1)
+
+        infos = []
+        for i, env in enumerate(envs):
+            _, reward, terminated, truncated, info = env.result(scores[i])
+            if terminated or truncated:
+                info["final_score"] = info["score"]
+                env.reset()
+            self.rewards[i] = reward
+            self.terminated[i] = terminated
+            self.truncated[i] = truncated
+            infos.append(info)
+        return self.observations, self.rewards, self.terminated, self.truncated, infos
@@ -0,0 +1,55 @@
+"""Ghost rules on NumPy arrays, shared by BatchSimulation and GhostSwarm"""
+import numpy as np
+from src.config import *
+from src.levels.navigation import UNREACHABLE
+
+# Ghost states (same meaning as the strings used by Ghost.state)
+SCATTER, CHASE, FRIGHTENED, EATEN = 0, 1, 2, 3
+
+# Ghost personalities, in the order Simulation.create_ghosts builds them
+BLINKY, PINKY, INKY, CLYDE = 0, 1, 2, 3
+
+# Candidate directions in Ghost.choose_direction order: up, down, left, right
+DIRS_X = np.array([0, 0, -1, 1], dtype=np.int8)
+DIRS_Y = np.array([-1, 1, 0, 0], dtype=np.int8)
+
+
+def valid_directions(can, dx, dy):
+    """Which of DIRS a ghost heading (dx, dy) may take, given can (..., 4):
+    any open one but straight back, unless back is the only way out"""
+    valid = can & ~((DIRS_X == -dx[..., None]) & (DIRS_Y == -dy[..., None]))
+    return np.where(valid.any(-1, keepdims=True), valid, can)
+
+
+def tiles_ahead(gx, gy, width, height):
+    """Index of the tile one step along each of DIRS from tile (gx, gy), as
+    (..., 4); rows wrap around, columns stop at the maze edge"""
+    gx, gy = gx[..., None], gy[..., None]
+    return np.clip(gy + DIRS_Y, 0, height - 1) * width + (gx + DIRS_X) % width
+
+
+def pick_directions(valid, dist, x, y, tx, ty, frightened, random):
+    """Vectorized Ghost.choose_direction: an index into DIRS for every ghost
+
+    dist (..., 4) is the maze distance to the ghost's target from each
+    tile ahead. A ghost takes the valid direction with the shortest path,
+    heads straight for its target (tx, ty) when no path reaches it, and
+    turns at random while frightened; random(shape) returns the uniform
+    floats for those turns (it is only called if a ghost is frightened).
+    """
+    dist = np.where(valid, dist, UNREACHABLE + 1)
+    pick = dist.argmin(-1)
+
+    # No path from here: head straight for the target
+    lost = (np.take_along_axis(dist, pick[..., None], -1)[..., 0] >= UNREACHABLE) & ~frightened
+    if lost.any():
+        straight = (x[..., None] + DIRS_X * TILE_SIZE - tx[..., None]) ** 2 + \
+                   (y[..., None] + DIRS_Y * TILE_SIZE - ty[..., None]) ** 2
+        straight[~valid] = np.inf
+        pick = np.where(lost, straight.argmin(-1), pick)
+
+    if frightened.any():
+        roll = random(valid[frightened].shape)
+        roll[~valid[frightened]] = -1.0
+        pick[frightened] = roll.argmax(-1)
+    return pick
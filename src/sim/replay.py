@@ -0,0 +1,252 @@
+"""Deterministic input recording and headless replay"""
+import argparse
+import bisect
+import struct
+import zlib
+from src.config import *
+from src.sim.simulation import ACTIONS, Simulation
+from src.sim.state import GameState
+
+# File layout: header, run-length encoded actions, keyframes
+MAGIC = b"PMRP"
+VERSION = 5
+HEADER = struct.Struct("<4sBQIIiI")  # magic, version, seed, ticks, keyframe interval, final score, swarm size
+KEYFRAME_HEADER = struct.Struct("<II")  # tick, compressed length
+COUNT = struct.Struct("<I")
+
+ACTION_INDEX = {action: index for index, action in enumerate(ACTIONS)}
+
+
+def write_varint(out, value):
+    """Append an unsigned LEB128 integer to a bytearray"""
+    while value >= 0x80:
+        out.append(value & 0x7F | 0x80)
+        value >>= 7
+    out.append(value)
+
+
+def read_varint(data, pos):
+    """Read an unsigned LEB128 integer; returns (value, next position)"""
+    value = shift = 0
+    while True:
+        byte = data[pos]
+        pos += 1
+        value |= (byte & 0x7F) << shift
+        if byte < 0x80:
+            return value, pos
+        shift += 7
+
+
+def encode_keyframe(snapshot):
+    """Simulation.snapshot() record as compressed bytes"""
+    return zlib.compress(snapshot.to_bytes(), 6)
+
+
+def decode_keyframe(data):
+    """Inverse of encode_keyframe"""
+    return GameState.from_bytes(zlib.decompress(data))
+
+
+class InputRecorder:
+    """Captures one game's per-tick input as run-length encoded actions.
+
+    Call record() once per tick, before Simulation.step, with the player's
+    next_direction. Every keyframe_interval ticks the simulation's full
+    state is saved as well, so a replay can seek without re-simulating
+    from the start.
+    """
+
+    def __init__(self, seed, keyframe_interval=REPLAY_KEYFRAME_INTERVAL, swarm=0):
+        self.seed = seed
+        self.keyframe_interval = keyframe_interval
+        self.swarm = swarm  # Simulation swarm size the game was played with
+        self.runs = []  # [action index, run length]
+        self.ticks = 0
+        self.keyframes = {}  # tick -> encoded snapshot
+        self.final_score = 0
+
+    def record(self, sim, direction):
+        """Log the input applied during the tick that starts at sim.tick"""
+        if sim.tick % self.keyframe_interval == 0 and sim.tick not in self.keyframes:
+            self.keyframes[sim.tick] = encode_keyframe(sim.snapshot())
+
+        action = ACTION_INDEX.get(tuple(direction), 0)
+        if self.runs and self.runs[-1][0] == action:
+            self.runs[-1][1] += 1
+        else:
+            self.runs.append([action, 1])
+        self.ticks += 1
+        self.final_score = sim.player.score
+
+    def finish(self, sim):
+        """Note the final score once the game has ended"""
+        self.final_score = sim.player.score
+
+    def to_bytes(self):
+        """Serialize the recording"""
+        out = bytearray(HEADER.pack(MAGIC, VERSION, self.seed, self.ticks,
+                                    self.keyframe_interval, self.final_score, self.swarm))
+        out += COUNT.pack(len(self.runs))
+        for action, length in self.runs:
+            out.append(action)
+            write_varint(out, length)
+
+        out += COUNT.pack(len(self.keyframes))
+        for tick in sorted(self.keyframes):
+            data = self.keyframes[tick]
+            out += KEYFRAME_HEADER.pack(tick, len(data))
+            out += data
+        return bytes(out)
+
+    def save(self, path):
+        """Write the recording to a file"""
+        with open(path, "wb") as f:
+            f.write(self.to_bytes())
+
+
+class Replay:
+    """A parsed recording: seed, per-tick actions and keyframes"""
+
+    def __init__(self, seed, runs, keyframes, keyframe_interval, final_score, swarm=0):
+        self.seed = seed
+        self.swarm = swarm
+        self.keyframe_interval = keyframe_interval
+        self.final_score = final_score
+        self.keyframes = keyframes  # tick -> encoded snapshot
+        self.keyframe_ticks = sorted(keyframes)
+
+        # Run start ticks, for looking up the action of any tick
+        self.run_actions = []
+        self.run_starts = []
+        tick = 0
+        for action, length in runs:
+            self.run_actions.append(action)
+            self.run_starts.append(tick)
+            tick += length
+        self.ticks = tick
+
+    @classmethod
+    def from_bytes(cls, data):
+        """Parse bytes produced by InputRecorder.to_bytes"""
+        magic, version, seed, ticks, interval, final_score, swarm = HEADER.unpack_from(data)
+        if magic != MAGIC or version != VERSION:
+            raise ValueError("not a replay file (or unsupported version)")
+        pos = HEADER.size
+
+        (run_count,) = COUNT.unpack_from(data, pos)
+        pos += COUNT.size
+        runs = []
+        for _ in range(run_count):
+            action = data[pos]
+            length, pos = read_varint(data, pos + 1)
+            runs.append((action, length))
+
+        (keyframe_count,) = COUNT.unpack_from(data, pos)
+        pos += COUNT.size
+        keyframes = {}
+        for _ in range(keyframe_count):
+            tick, length = KEYFRAME_HEADER.unpack_from(data, pos)
+            pos += KEYFRAME_HEADER.size
+            keyframes[tick] = bytes(data[pos:pos + length])
+            pos += length
+
+        replay = cls(seed, runs, keyframes, interval, final_score, swarm)
+        if replay.ticks != ticks:
+            raise ValueError("replay file is truncated or corrupt")
+        return replay
+
+    @classmethod
+    def load(cls, path):
+        """Read a replay file"""
+        with open(path, "rb") as f:
+            return cls.from_bytes(f.read())
+
+    def action_at(self, tick):
+        """Action index applied during the tick that starts at `tick`"""
+        return self.run_actions[bisect.bisect_right(self.run_starts, tick) - 1]
+
+    def actions_from(self, tick):
+        """Yield the actions of every tick from `tick` to the end"""
+        run = bisect.bisect_right(self.run_starts, tick) - 1
+        starts = self.run_starts + [self.ticks]
+        for index in range(run, len(self.run_actions)):
+            action = self.run_actions[index]
+            for _ in range(max(starts[index], tick), starts[index + 1]):
+                yield action
+
+
+class ReplayEngine:
+    """Re-simulates a recording headlessly, as fast as the simulation runs"""
+
+    def __init__(self, replay):
+        self.replay = replay
+        self.sim = Simulation(seed=replay.seed, swarm=replay.swarm)
+
+    @property
+    def tick(self):
+        """Tick the simulation has reached"""
+        return self.sim.tick
+
+    def seek(self, tick):
+        """Jump to `tick` via the nearest keyframe at or before it"""
+        tick = min(max(tick, 0), self.replay.ticks)
+        keyframe_ticks = self.replay.keyframe_ticks
+        index = bisect.bisect_right(keyframe_ticks, tick) - 1
+        nearest = keyframe_ticks[index] if index >= 0 else 0
+        # Going backwards, or a keyframe is closer than simulating forward
+        if self.sim.tick > tick or self.sim.tick < nearest:
+            self.rewind_to_keyframe(tick)
+        self.run_until(tick)
+        return self.sim.get_state()
+
+    def rewind_to_keyframe(self, tick):
+        """Restore the latest keyframe at or before `tick`"""
+        index = bisect.bisect_right(self.replay.keyframe_ticks, tick) - 1
+        if index < 0:
+            self.sim.reset(self.replay.seed)
+            return
+        keyframe_tick = self.replay.keyframe_ticks[index]
+        self.sim.restore(decode_keyframe(self.replay.keyframes[keyframe_tick]))
+
+    def run_until(self, tick):
+        """Step recorded actions until the simulation reaches `tick`"""
+        sim = self.sim
+        actions = self.replay.actions_from(sim.tick)
+        for action in actions:
+            if sim.tick >= tick or sim.game_over:
+                break
+            sim.step(action)
+
+    def run_to_end(self):
+        """Play the rest of the recording and return the final state"""
+        return self.seek(self.replay.ticks)
+
+    def verify(self):
+        """Replay every tick from the start (ignoring keyframes); True if it
+        reproduces the recorded score"""
+        self.sim.reset(self.replay.seed)
+        self.run_until(self.replay.ticks)
+        return self.sim.player.score == self.replay.final_score
+
+
+def main():
+    """Command line entry point: python -m src.sim.replay"""
+    parser = argparse.ArgumentParser(description="Re-simulate a recorded Pac-Man game")
+    parser.add_argument("path")
+    parser.add_argument("--seek", type=int, default=None, help="stop at this tick")
+    args = parser.parse_args()
+
+    replay = Replay.load(args.path)
+    engine = ReplayEngine(replay)
+    if args.seek is None:
+        ok = engine.verify()
+        state = engine.sim.get_state()
+        print(f"seed {replay.seed}  ticks {state['tick']}  score {state['score']} "
+              f"(recorded {replay.final_score}: {'match' if ok else 'MISMATCH'})")
+    else:
+        state = engine.seek(args.seek)
+        print(state)
+
+
+if __name__ == "__main__":
+    main()
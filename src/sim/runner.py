@@ -0,0 +1,153 @@
+"""Run many headless games across worker processes"""
+import argparse
+import multiprocessing
+import random
+import time
+from src.config import *
+from src.sim.simulation import Simulation
+
+DEFAULT_MAX_TICKS = SIM_TICK_RATE * 60 * 10  # ten minutes of game time
+
+
+def game_seed(base_seed, index):
+    """Seed for game `index` of a run
+
+    Derived only from the run's base seed and the game index, so a game
+    plays out the same no matter how many workers there are or which one
+    picks it up.
+    """
+    return random.Random(f"{base_seed}:{index}").getrandbits(63)
+
+
+def random_turn_policy(state, rng):
+    """Default bot: keep going, occasionally turn in a random direction"""
+    if rng.random() < 0.1:
+        return rng.randrange(1, 5)
+    return None
+
+
+def play_game(index, seed, max_ticks=DEFAULT_MAX_TICKS, policy=random_turn_policy):
+    """Play one headless game to the end and summarize it"""
+    sim = Simulation(seed=seed)
+    policy_rng = random.Random(seed ^ 0x5DEECE66D)
+    death_causes = []
+    state = sim.get_state()
+
+    while not state["game_over"] and state["tick"] < max_ticks:
+        state = sim.step(policy(state, policy_rng))
+        for event in sim.events:
+            if event[0] == "death":
+                death_causes.append(event[3])
+
+    return {
+        "game": index,
+        "seed": seed,
+        "score": state["score"],
+        "level": sim.level_manager.get_current_level(),
+        "ticks": state["tick"],
+        "death_causes": death_causes,
+        "outcome": "game_over" if state["game_over"] else "timeout",
+    }
+
+
+def _play_game_job(job):
+    """Pool entry point (jobs are tuples so they pickle cheaply)"""
+    return play_game(*job)
+
+
+class BatchRunner:
+    """Shards headless games across a process pool and streams results back
+
+    Iterate over run() to receive each game's result as soon as its worker
+    finishes it; games_per_second() reports aggregate throughput so far.
+    """
+
+    def __init__(self, num_games, workers=None, seed=0, max_ticks=DEFAULT_MAX_TICKS,
+                 policy=random_turn_policy, chunksize=None):
+        self.num_games = num_games
+        self.workers = workers or multiprocessing.cpu_count()
+        self.seed = seed
+        self.max_ticks = max_ticks
+        self.policy = policy
+        # Small chunks keep results streaming; large ones cut IPC overhead
+        self.chunksize = chunksize or max(1, num_games // (self.workers * 8))
+        self.games_done = 0
+        self.ticks_done = 0
+        self.start_time = None
+        self.end_time = None
+
+    def jobs(self):
+        """Job tuples for every game in the run"""
+        for index in range(self.num_games):
+            yield (index, game_seed(self.seed, index), self.max_ticks, self.policy)
+
+    def run(self):
+        """Yield game results in completion order"""
+        self.games_done = 0
+        self.ticks_done = 0
+        self.start_time = time.perf_counter()
+        self.end_time = None
+
+        if self.workers == 1:
+            results = map(_play_game_job, self.jobs())
+            for result in results:
+                yield self._record(result)
+        else:
+            # Spawned, not forked: a fork taken while another thread holds a
+            # lock (SDL's timer thread, once pygame has run) can hang the worker
+            with multiprocessing.get_context("spawn").Pool(self.workers) as pool:
+                results = pool.imap_unordered(_play_game_job, self.jobs(), self.chunksize)
+                for result in results:
+                    yield self._record(result)
+
+        self.end_time = time.perf_counter()
+
+    def _record(self, result):
+        """Update aggregate counters for a finished game"""
+        self.games_done += 1
+        self.ticks_done += result["ticks"]
+        return result
+
+    def elapsed(self):
+        """Seconds since the run started"""
+        if self.start_time is None:
+            return 0.0
+        return (self.end_time or time.perf_counter()) - self.start_time
+
+    def games_per_second(self):
+        """Aggregate throughput across all workers"""
+        elapsed = self.elapsed()
+        return self.games_done / elapsed if elapsed > 0 else 0.0
+
+    def ticks_per_second(self):
+        """Aggregate simulated ticks per second across all workers"""
+        elapsed = self.elapsed()
+        return self.ticks_done / elapsed if elapsed > 0 else 0.0
+
+
+def main():
+    """Command line entry point: python -m src.sim.runner"""
+    parser = argparse.ArgumentParser(description="Run headless Pac-Man games in parallel")
+    parser.add_argument("--games", type=int, default=100)
+    parser.add_argument("--workers", type=int, default=None)
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--max-ticks", type=int, default=DEFAULT_MAX_TICKS)
+    parser.add_argument("--quiet", action="store_true", help="only print the summary")
+    args = parser.parse_args()
+
+    runner = BatchRunner(args.games, args.workers, args.seed, args.max_ticks)
+    scores = []
+    for result in runner.run():
+        scores.append(result["score"])
+        if not args.quiet:
+            print(f"game {result['game']:5d}  score {result['score']:6d}  "
+                  f"level {result['level']:2d}  ticks {result['ticks']:7d}  "
+                  f"{result['outcome']}  deaths: {', '.join(result['death_causes'])}")
+
+    print(f"{runner.games_done} games on {runner.workers} workers in {runner.elapsed():.2f}s: "
+          f"{runner.games_per_second():.1f} games/s, {runner.ticks_per_second():.0f} ticks/s, "
+          f"mean score {sum(scores) / max(1, len(scores)):.1f}")
+
+
+if __name__ == "__main__":
+    main()
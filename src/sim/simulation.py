@@ -0,0 +1,305 @@
+"""Headless game simulation (no display, fonts or event queue)"""
+from src.config import *
+from src.entities.player import Player
+from src.entities.ghost_ai import Blinky, Pinky, Inky, Clyde
+from src.utils.collision import check_ghost_collision
+from src.utils.spatial_hash import SpatialHash
+from src.levels.level_manager import LevelManager
+from src.entities.powerup import PowerUp, PowerUpManager
+from src.sim.state import (GameState, TrackedRandom, WORLD, pack_player, unpack_player, pack_ghost,
+                           unpack_ghost, pack_powerup, unpack_powerup)
+
+# Discrete actions accepted by Simulation.step (index -> direction)
+ACTIONS = [(0, 0), (0, -1), (0, 1), (-1, 0), (1, 0)]  # none, up, down, left, right
+
+# Start positions in the classic maze (other mazes find theirs, see Maze.find_spawns)
+PLAYER_START = (14 * TILE_SIZE, 23 * TILE_SIZE)
+GHOST_HOUSE_Y = 14 * TILE_SIZE
+RESPAWN_DELAY = 2000  # milliseconds
+
+class Simulation:
+    """Game world that advances one fixed tick per step() call.
+
+    Holds everything Game.update used to own (maze, player, ghosts,
+    power-ups, level progression) and never touches pygame's display,
+    fonts or event queue. Things the renderer cares about (pellets eaten,
+    deaths, level clears) are reported through self.events, which is
+    cleared at the start of every step.
+
+    All randomness (frightened ghost turns, power-up spawns) is drawn from
+    self.rng, so two simulations with the same seed and the same actions
+    play out identically.
+
+    With swarm > 0 the four ghosts are replaced by a GhostSwarm of that
+    many ghosts (self.ghosts is then empty).
+    """
+
+    def __init__(self, dt=SIM_DT, seed=None, swarm=SWARM_SIZE):
+        self.dt = dt
+        self.rng = TrackedRandom(seed)
+        self.swarm_size = swarm
+        self.profiler = None  # FrameProfiler charged with step()'s sections when set
+        self.level_manager = LevelManager()
+        self.reset()
+
+    def reset(self, seed=None):
+        """Start a fresh game at level 1 (reseeding the RNG if seed is given)"""
+        if seed is not None:
+            self.rng.seed(seed)
+        self.level_manager.reset()
+        # Drawn a level ahead so the next maze can be built before it is needed
+        self.level_manager.next_seed = self.rng.getrandbits(32)
+        self.tick = 0
+        self.time_ms = 0.0
+        self.death_timer = 0
+        self.game_over = False
+        self.events = []
+        self.maze = self.level_manager.create_maze()
+        self.player = Player(*self.maze.player_start, self.maze)
+        self.ghosts = self.create_ghosts()
+        self.ghost_grid = SpatialHash()
+        self.ghost_grid.rebuild(self.ghosts)
+        self.swarm = self.create_swarm()
+        self.powerup_manager = PowerUpManager(clock=self.clock, rng=self.rng)
+        return self.get_state()
+
+    def create_ghosts(self):
+        """Create the four ghosts in the ghost house (none in swarm mode)"""
+        if self.swarm_size:
+            return []
+        return [ghost(x, y, self.maze, self.rng)
+                for ghost, (x, y) in zip((Blinky, Pinky, Inky, Clyde), self.maze.ghost_starts)]
+
+    def create_swarm(self, spawn=True):
+        """GhostSwarm for the current maze (None unless in swarm mode)
+
+        spawn=False leaves the start positions unset (and the RNG untouched)
+        for restore() to fill in.
+        """
+        if not self.swarm_size:
+            return None
+        from src.sim.swarm import GhostSwarm
+        swarm = GhostSwarm(self.maze, self.swarm_size)
+        if spawn:
+            swarm.spawn(self.rng, self.maze.player_start)
+        return swarm
+
+    def clock(self):
+        """Simulated milliseconds since reset (replaces pygame.time.get_ticks)"""
+        return self.time_ms
+
+    def step(self, action=None):
+        """Advance one tick and return the new state
+
+        action is an index into ACTIONS, a direction tuple, or None to keep
+        the player's current next_direction.
+        """
+        self.events = []
+        if self.game_over:
+            return self.get_state()
+
+        if action is not None:
+            if isinstance(action, int):
+                action = ACTIONS[action]
+            self.player.next_direction = action
+
+        dt = self.dt
+        self.tick += 1
+        self.time_ms += dt * 1000
+
+        # Handle death timer
+        if self.death_timer > 0:
+            self.death_timer -= dt * 1000
+            if self.death_timer <= 0:
+                self.respawn_player()
+            return self.get_state()
+
+        player = self.player
+        ghosts = self.ghosts
+        profiler = self.profiler
+        if profiler:
+            profiler.mark()
+
+        prev_score = player.score
+        player.update(dt)
+        ate_pellet = player.score > prev_score
+        if ate_pellet:
+            self.events.append(("score", player.x, player.y))
+        if profiler:
+            profiler.lap("player")
+
+        # Update power-ups
+        self.powerup_manager.update(dt, self.maze, player, ghosts)
+        if profiler:
+            profiler.lap("power-ups")
+
+        # Update ghosts
+        swarm = self.swarm
+        for ghost in ghosts:
+            ghost.update(dt, player)
+        if swarm is not None:
+            swarm.update(dt, player, self.rng)
+        if profiler:
+            profiler.lap("ghosts")
+
+        # Check if player collected power pellet
+        if player.powered_up:
+            for ghost in ghosts:
+                if ghost.state not in ["frightened", "eaten"]:
+                    ghost.set_frightened(player.power_timer)
+            if swarm is not None:
+                swarm.frighten(player.power_timer)
+
+        # Check ghost collisions (only ghosts bucketed near the player)
+        self.ghost_grid.sync(ghosts)
+        collision_ghost = check_ghost_collision(player, ghosts, self.ghost_grid)
+        culprit = collision_ghost.name if collision_ghost else None
+        if swarm is not None and culprit is None:
+            culprit = swarm.collide(player)
+        if culprit:
+            if getattr(player, 'has_shield', False):
+                # Shield protects player
+                player.has_shield = False
+                self.powerup_manager.remove_powerup_effect(player, ghosts)
+                self.events.append(("shield_break", player.x, player.y))
+            else:
+                # Player takes damage
+                player.lives -= 1
+                self.events.append(("death", player.x, player.y, culprit))
+                if player.lives > 0:
+                    self.death_timer = RESPAWN_DELAY
+                else:
+                    self.game_over = True
+        if profiler:
+            profiler.lap("collisions")
+
+        # Check level completion
+        if ate_pellet and self.maze.is_cleared():
+            self.level_complete()
+        if profiler:
+            profiler.lap("level check")
+
+        return self.get_state()
+
+    def level_complete(self):
+        """Award the bonus and build the next level"""
+        self.player.score += 1000
+        levels = self.level_manager
+        levels.next_level(levels.next_seed)
+        levels.next_seed = self.rng.getrandbits(32)
+
+        self.maze = self.level_manager.create_maze()
+        self.player.maze = self.maze
+        self.reset_player()
+
+        # Reset ghosts with increased difficulty
+        self.ghosts = self.create_ghosts()
+        self.ghost_grid.rebuild(self.ghosts)
+        self.level_manager.adjust_ghost_difficulty(self.ghosts)
+        self.swarm = self.create_swarm()
+        if self.swarm is not None:
+            self.swarm.adjust_difficulty(self.level_manager)
+
+        self.powerup_manager = PowerUpManager(clock=self.clock, rng=self.rng)
+        self.events.append(("level_complete", self.player.x, self.player.y))
+
+    def respawn_player(self):
+        """Respawn player after death"""
+        self.reset_player()
+        for ghost in self.ghosts:
+            ghost.reset_position()
+        if self.swarm is not None:
+            self.swarm.reset_position()
+
+    def reset_player(self):
+        """Move the player back to the start tile"""
+        player = self.player
+        player.x, player.y = self.maze.player_start
+        player.direction = (0, 0)
+        player.next_direction = (0, 0)
+        player.powered_up = False
+        player.power_timer = 0
+
+    def snapshot(self):
+        """Immutable GameState record of the whole world
+
+        Together with the actions of later ticks this is enough to continue
+        the game exactly (replay keyframes, lookahead search).
+        """
+        powerups = self.powerup_manager
+        levels = self.level_manager
+        return GameState(
+            WORLD.pack(self.tick, self.time_ms, self.death_timer, self.game_over,
+                       levels.current_level, levels.difficulty_multiplier,
+                       -1 if levels.maze_seed is None else levels.maze_seed, levels.next_seed,
+                       powerups.spawn_timer, powerups.spawn_interval),
+            self.rng.getstate(),
+            *self.maze.snapshot(),
+            pack_player(self.player),
+            tuple(pack_ghost(ghost) for ghost in self.ghosts),
+            tuple(pack_powerup(powerup) for powerup in powerups.powerups),
+            self.swarm.to_bytes() if self.swarm is not None else b"",
+        )
+
+    def restore(self, state):
+        """Return the world to a state recorded by snapshot()
+
+        Entities are updated in place and only the pellets that differ are
+        rewritten, so restoring costs about as little as taking a snapshot.
+        """
+        powerups = self.powerup_manager
+        levels = self.level_manager
+        (self.tick, self.time_ms, self.death_timer, self.game_over,
+         levels.current_level, levels.difficulty_multiplier, maze_seed, levels.next_seed,
+         powerups.spawn_timer, powerups.spawn_interval) = WORLD.unpack(state.world)
+        levels.maze_seed = None if maze_seed < 0 else maze_seed
+        self.rng.setstate(state.rng)
+        self.events = []
+
+        self.swarm_size = 0
+        if state.swarm:
+            from src.sim.swarm import GhostSwarm
+            self.swarm_size = GhostSwarm.count_in(state.swarm)
+        if levels.maze_seed != self.maze.seed:
+            # Snapshot from another level: switch walls (cached by seed)
+            self.maze = levels.create_maze()
+            self.player.maze = self.maze
+            self.ghosts = self.create_ghosts()
+        self.maze.restore((state.pellets, state.powers))
+        unpack_player(self.player, state.player)
+
+        if len(self.ghosts) != len(state.ghosts):
+            self.ghosts = self.create_ghosts()
+        for ghost, record in zip(self.ghosts, state.ghosts):
+            unpack_ghost(ghost, record)
+        self.ghost_grid.rebuild(self.ghosts)
+
+        swarm = self.swarm
+        if swarm is None or swarm.maze is not self.maze or swarm.count != self.swarm_size:
+            self.swarm = swarm = self.create_swarm(spawn=False)
+        if swarm is not None:
+            swarm.restore(state.swarm)
+
+        if powerups.powerups or state.powerups:
+            powerups.powerups = []
+            powerups.grid.clear()
+            for record in state.powerups:
+                powerup = PowerUp(0, 0, None, self.clock)
+                unpack_powerup(powerup, record)
+                powerups.powerups.append(powerup)
+                powerups.grid.insert(powerup)
+
+    def get_state(self):
+        """Plain-data view of the current state"""
+        player = self.player
+        return {
+            "tick": self.tick,
+            "score": player.score,
+            "lives": player.lives,
+            "level": self.level_manager.current_level,
+            "player": (player.x, player.y, player.direction),
+            "ghosts": [(g.x, g.y, g.state) for g in self.ghosts],
+            "swarm": self.swarm.get_state() if self.swarm is not None else None,
+            "dying": self.death_timer > 0,
+            "game_over": self.game_over,
+        }
@@ -0,0 +1,178 @@
+"""Compact, immutable game-state records for snapshot and restore"""
+import random
+import struct
+from collections import namedtuple
+
+GHOST_STATES = ("scatter", "chase", "frightened", "eaten")
+GHOST_STATE_INDEX = {state: i for i, state in enumerate(GHOST_STATES)}
+POWERUP_TYPES = (None, "speed", "shield", "freeze")
+POWERUP_TYPE_INDEX = {kind: i for i, kind in enumerate(POWERUP_TYPES)}
+
+# Packed field layouts (little endian, no padding)
+# tick, time_ms, death_timer, game_over, level, difficulty, maze seed (-1 for the
+# classic maze), next level's maze seed, power-up spawn timer and interval
+WORLD = struct.Struct("<Idd?idqqdd")
+# x, y, speed, direction, next_direction, score, lives, powered_up, power_timer,
+# powerup_type, powerup_timer, original_speed, has_shield, freeze_active
+PLAYER = struct.Struct("<dddbbbbii?dBdd??")
+# Bytes of next_direction (fields 5 and 6) within a PLAYER record
+PLAYER_NEXT_DIRECTION = slice(struct.calcsize(PLAYER.format[:6]), struct.calcsize(PLAYER.format[:8]))
+# x, y, start_x, start_y, speed, direction, state, frightened_timer, target,
+# mode_timer, mode_duration
+GHOST = struct.Struct("<ddiidbbBddddd")
+# x, y, type, duration, collected, spawn_time, lifetime
+POWERUP = struct.Struct("<iiBi?di")
+
+RNG_STATE = struct.Struct("<i625I?d")  # random.Random.getstate(): version, state, gauss_next
+LENGTH = struct.Struct("<H")
+SWARM_LENGTH = struct.Struct("<I")
+
+
+class TrackedRandom(random.Random):
+    """random.Random that reuses its last getstate() until a number is drawn
+
+    getstate() builds a 625-int tuple, which would dominate the cost of a
+    snapshot; most ticks draw no random numbers at all.
+    """
+
+    def __init__(self, seed=None):
+        self.saved_state = None
+        super().__init__(seed)
+
+    def seed(self, *args, **kwargs):
+        self.saved_state = None
+        super().seed(*args, **kwargs)
+
+    def random(self):
+        self.saved_state = None
+        return super().random()
+
+    def getrandbits(self, k):
+        self.saved_state = None
+        return super().getrandbits(k)
+
+    def randbytes(self, n):
+        self.saved_state = None
+        return super().randbytes(n)
+
+    def getstate(self):
+        if self.saved_state is None:
+            self.saved_state = super().getstate()
+        return self.saved_state
+
+    def setstate(self, state):
+        if state is not self.saved_state:
+            super().setstate(state)
+            self.saved_state = state
+
+
+def pack_player(player):
+    """Player fields as PLAYER bytes"""
+    return PLAYER.pack(
+        player.x, player.y, player.speed, *player.direction, *player.next_direction,
+        player.score, player.lives, player.powered_up, player.power_timer,
+        POWERUP_TYPE_INDEX[player.powerup_type], player.powerup_timer,
+        player.original_speed, player.has_shield, player.freeze_active)
+
+
+def unpack_player(player, data):
+    """Set a player's fields from pack_player() bytes"""
+    (player.x, player.y, player.speed, dx, dy, nx, ny, player.score, player.lives,
+     player.powered_up, player.power_timer, powerup_type, player.powerup_timer,
+     player.original_speed, player.has_shield, player.freeze_active) = PLAYER.unpack(data)
+    player.direction = (dx, dy)
+    player.next_direction = (nx, ny)
+    player.powerup_type = POWERUP_TYPES[powerup_type]
+
+
+def pack_ghost(ghost):
+    """Ghost fields as GHOST bytes (name, color and radius come from its class)"""
+    return GHOST.pack(
+        ghost.x, ghost.y, ghost.start_x, ghost.start_y, ghost.speed, *ghost.direction,
+        GHOST_STATE_INDEX[ghost.state], ghost.frightened_timer, *ghost.target,
+        ghost.mode_timer, ghost.mode_duration)
+
+
+def unpack_ghost(ghost, data):
+    """Set a ghost's fields from pack_ghost() bytes"""
+    (ghost.x, ghost.y, ghost.start_x, ghost.start_y, ghost.speed, dx, dy, state,
+     ghost.frightened_timer, tx, ty, ghost.mode_timer, ghost.mode_duration) = GHOST.unpack(data)
+    ghost.direction = (dx, dy)
+    ghost.state = GHOST_STATES[state]
+    ghost.target = (tx, ty)
+
+
+def pack_powerup(powerup):
+    """PowerUp fields as POWERUP bytes"""
+    return POWERUP.pack(powerup.x, powerup.y, POWERUP_TYPE_INDEX[powerup.type],
+                        powerup.duration, powerup.collected, powerup.spawn_time,
+                        powerup.lifetime)
+
+
+def unpack_powerup(powerup, data):
+    """Set a PowerUp's fields from pack_powerup() bytes"""
+    (powerup.x, powerup.y, kind, powerup.duration, powerup.collected,
+     powerup.spawn_time, powerup.lifetime) = POWERUP.unpack(data)
+    powerup.type = POWERUP_TYPES[kind]
+
+
+class GameState(namedtuple("GameState", "world rng pellets powers player ghosts powerups swarm")):
+    """Immutable record of a whole game world.
+
+    Entities are packed into short byte strings and the pellet grid is
+    the maze's own (immutable) bitboards, so taking a snapshot copies
+    almost nothing and many snapshots of one game share their pellets.
+    swarm is GhostSwarm.to_bytes() in swarm mode and empty otherwise.
+    """
+
+    __slots__ = ()
+
+    def to_bytes(self):
+        """Self-contained serialization (e.g. for sending to another process)"""
+        version, internal, gauss = self.rng
+        out = bytearray(self.world)
+        out += RNG_STATE.pack(version, *internal, gauss is not None, gauss or 0.0)
+        for bits in (self.pellets, self.powers):
+            raw = bits.to_bytes((bits.bit_length() + 7) // 8, "little")
+            out += LENGTH.pack(len(raw)) + raw
+        out += self.player
+        for records in (self.ghosts, self.powerups):
+            out.append(len(records))
+            for record in records:
+                out += record
+        out += SWARM_LENGTH.pack(len(self.swarm)) + self.swarm
+        return bytes(out)
+
+    @classmethod
+    def from_bytes(cls, data):
+        """Inverse of to_bytes"""
+        pos = WORLD.size
+        world = bytes(data[:pos])
+
+        version, *internal, has_gauss, gauss = RNG_STATE.unpack_from(data, pos)
+        rng = (version, tuple(internal), gauss if has_gauss else None)
+        pos += RNG_STATE.size
+
+        bitboards = []
+        for _ in range(2):
+            (length,) = LENGTH.unpack_from(data, pos)
+            pos += LENGTH.size
+            bitboards.append(int.from_bytes(data[pos:pos + length], "little"))
+            pos += length
+
+        player = bytes(data[pos:pos + PLAYER.size])
+        pos += PLAYER.size
+
+        groups = []
+        for layout in (GHOST, POWERUP):
+            count = data[pos]
+            pos += 1
+            groups.append(tuple(bytes(data[pos + i * layout.size:pos + (i + 1) * layout.size])
+                                for i in range(count)))
+            pos += count * layout.size
+
+        (length,) = SWARM_LENGTH.unpack_from(data, pos)
+        pos += SWARM_LENGTH.size
+        swarm = bytes(data[pos:pos + length])
+
+        return cls(world, rng, bitboards[0], bitboards[1], player, groups[0], groups[1], swarm)
@@ -0,0 +1,275 @@
+"""Swarm mode: any number of ghosts advanced as arrays in one game"""
+import struct
+import weakref
+from collections import OrderedDict
+import numpy as np
+from src.config import *
+from src.levels.navigation import UNREACHABLE
+from src.sim.ghost_arrays import (SCATTER, CHASE, FRIGHTENED, CLYDE, DIRS_X, DIRS_Y,
+                                  pick_directions, tiles_ahead, valid_directions)
+
+GHOST_NAMES = ("Blinky", "Pinky", "Inky", "Clyde")
+
+# Chase targets by personality: tiles ahead of the player (Clyde also shies away)
+CHASE_AHEAD = np.array([0, 4, 2, 0]) * TILE_SIZE
+SHY_DISTANCE = TILE_SIZE * 8  # Clyde heads for his corner when this close
+# Scatter corners as fractions of the maze size: top right, top left,
+# bottom right, bottom left
+SCATTER_X = np.array([1.0, 0.0, 1.0, 0.0])
+SCATTER_Y = np.array([0.0, 0.0, 1.0, 1.0])
+FREEZE_SPEED = GHOST_SPEED * 0.3  # speed while the player's freeze power-up runs
+SPAWN_CLEARANCE = 8  # tiles between the player start and the nearest ghost start
+
+# Per-ghost arrays in snapshot order, after a count / frozen / mode duration header
+HEADER = struct.Struct("<I?d")
+FIELDS = (("x", np.float64), ("y", np.float64), ("start_x", np.float64),
+          ("start_y", np.float64), ("dx", np.int8), ("dy", np.int8), ("state", np.int8),
+          ("speed", np.float64), ("mode_timer", np.float64), ("frightened_timer", np.float64))
+
+# Per wall layout (keyed by its NavGraph): (walkable, anchors, LRU of distance arrays)
+_nav_tables = weakref.WeakKeyDictionary()
+
+
+def nav_tables(nav):
+    """NumPy copies of a NavGraph's walkable flags and target anchors, shared by layout"""
+    tables = _nav_tables.get(nav)
+    if tables is None:
+        w = nav.width
+        walkable = np.frombuffer(bytes(nav.walkable), dtype=np.uint8).astype(bool)
+        anchors = np.array([nav.anchor(i % w, i // w) for i in range(w * nav.height)],
+                           dtype=np.int64)
+        tables = _nav_tables[nav] = (walkable, anchors, OrderedDict())
+    return tables
+
+
+class GhostSwarm:
+    """Ghosts stored as arrays and updated together, one pass per step.
+
+    Ghost i has personality i % 4 (Blinky, Pinky, Inky, Clyde) and plays
+    by the rules of its Ghost subclass: the scatter/chase timer, the
+    frightened timer, its update_ai target and Ghost.move's turns at tile
+    centres (shortest maze path, no reversing, random turns while
+    frightened). Targets, turns and movement each run as one vectorized
+    pass, and direction choice only looks up the few distance fields the
+    current targets need, so thousands of ghosts cost little more than
+    four.
+
+    Ghosts start spread over the maze rather than in the ghost house. An
+    eaten ghost goes straight back to its start (as check_ghost_collision
+    does for single ghosts), so no ghost stays eaten past the tick it is
+    caught. Frightened turns draw a seed from the game's rng, which keeps
+    swarm games reproducible and covered by Simulation.snapshot.
+    """
+
+    def __init__(self, maze, count):
+        self.maze = maze
+        self.count = count
+        nav = maze.nav
+        self.width, self.height, self.stride = nav.width, nav.height, nav.stride
+        self.walkable, self.anchors, self.fields = nav_tables(nav)
+        self.field_limit = nav.field_limit
+        self.personality = np.arange(count) % 4
+
+        for name, dtype in FIELDS:
+            setattr(self, name, np.zeros(count, dtype=dtype))
+        self.mode_duration = 7000
+        self.frozen = False
+
+    def spawn(self, rng, player_start):
+        """Scatter start positions over walkable tile centres away from the player"""
+        px, py = player_start
+        tiles = np.array([(x, y) for x, y in self.maze.nav.walkable_tiles
+                          if (x * TILE_SIZE - px) ** 2 + (y * TILE_SIZE - py) ** 2 >=
+                          (SPAWN_CLEARANCE * TILE_SIZE) ** 2])
+        picks = tiles[np.random.default_rng(rng.getrandbits(64)).integers(len(tiles), size=self.count)]
+        self.start_x[:] = picks[:, 0] * TILE_SIZE + TILE_SIZE // 2
+        self.start_y[:] = picks[:, 1] * TILE_SIZE + TILE_SIZE // 2
+        self.reset_position()
+
+    def reset_position(self, index=slice(None)):
+        """Ghost.reset_position for all ghosts (or those selected by index)"""
+        self.x[index] = self.start_x[index]
+        self.y[index] = self.start_y[index]
+        self.dx[index] = 0
+        self.dy[index] = 0
+        self.state[index] = SCATTER
+        self.speed[index] = GHOST_SPEED
+        self.mode_timer[index] = 0
+
+    def adjust_difficulty(self, level_manager):
+        """LevelManager.adjust_ghost_difficulty for the whole swarm"""
+        self.speed[:] = GHOST_SPEED * level_manager.difficulty_multiplier
+        self.mode_duration = max(3000, 7000 - (level_manager.current_level - 1) * 500)
+
+    def update(self, dt, player, rng):
+        """Ghost.update for every ghost"""
+        dt_ms = dt * 1000
+        state = self.state
+
+        # Freeze power-up (PowerUpManager does this for single ghosts)
+        if player.freeze_active:
+            self.speed[:] = FREEZE_SPEED
+            self.frozen = True
+        elif self.frozen:
+            self.speed[state != FRIGHTENED] = GHOST_SPEED
+            self.frozen = False
+
+        # Switch between scatter and chase
+        timed = state < FRIGHTENED
+        self.mode_timer[timed] += dt_ms
+        switch = timed & (self.mode_timer >= self.mode_duration)
+        self.mode_timer[switch] = 0
+        state[switch] = CHASE - state[switch]
+
+        # Frightened timer
+        scared = state == FRIGHTENED
+        self.frightened_timer[scared] -= dt_ms
+        calm = scared & (self.frightened_timer <= 0)
+        state[calm] = SCATTER
+        self.speed[calm] = GHOST_SPEED
+
+        self.move(self.targets(player), rng)
+
+    def targets(self, player):
+        """Blinky/Pinky/Inky/Clyde update_ai targets: (pixel x, pixel y, tile index)"""
+        kind = self.personality
+        pdx, pdy = player.direction
+        ahead = CHASE_AHEAD[kind]
+        tx = player.x + pdx * ahead
+        ty = player.y + pdy * ahead
+
+        # Scatter corners; Clyde also retreats to his when near the player
+        shy = (kind == CLYDE) & ((self.x - player.x) ** 2 + (self.y - player.y) ** 2 <= SHY_DISTANCE ** 2)
+        corner = (self.state == SCATTER) | shy
+        tx[corner] = SCATTER_X[kind[corner]] * self.maze.pixel_width
+        ty[corner] = SCATTER_Y[kind[corner]] * self.maze.pixel_height
+
+        # Targets in walls or off the maze snap to the nearest walkable tile
+        w, h = self.width, self.height
+        gx = np.clip(np.floor(tx / TILE_SIZE), 0, w - 1).astype(np.int64)
+        gy = np.clip(np.floor(ty / TILE_SIZE), 0, h - 1).astype(np.int64)
+        return tx, ty, self.anchors[gy * w + gx]
+
+    def distance_field(self, tile):
+        """Maze distances to tile index `tile` as an array (LRU shared by layout)"""
+        field = self.fields.get(tile)
+        if field is None:
+            field = self.fields[tile] = np.array(self.maze.nav.distance_field(tile), dtype=np.int32)
+            if len(self.fields) > self.field_limit:
+                self.fields.popitem(last=False)
+        else:
+            self.fields.move_to_end(tile)
+        return field
+
+    def can_move(self, x, y, dx, dy):
+        """Vectorized Ghost.can_move: probe GHOST_RADIUS + 2 pixels ahead"""
+        reach = GHOST_RADIUS + 2
+        # Ghosts stay inside the maze, so probes land at most one tile
+        # outside it, on the walkable table's border
+        gx = np.floor((x + dx * reach) / TILE_SIZE).astype(np.int64)
+        gy = np.floor((y + dy * reach) / TILE_SIZE).astype(np.int64)
+        return self.walkable[(gy + 1) * self.stride + gx + 1] & ((dx != 0) | (dy != 0))
+
+    def move(self, targets, rng):
+        """Vectorized Ghost.move"""
+        x, y = self.x, self.y
+
+        # Allow direction change close to tile centers
+        cx = np.floor(x / TILE_SIZE) * TILE_SIZE + TILE_SIZE // 2
+        cy = np.floor(y / TILE_SIZE) * TILE_SIZE + TILE_SIZE // 2
+        self.choose_directions(np.flatnonzero(np.abs(x - cx) + np.abs(y - cy) < 3), targets, rng)
+
+        can = self.can_move(x, y, self.dx, self.dy)
+        step = can * self.speed
+        x += self.dx * step
+        y += self.dy * step
+        # Stuck, choose new direction immediately
+        self.choose_directions(np.flatnonzero(~can), targets, rng)
+        x %= self.maze.pixel_width
+
+    def choose_directions(self, index, targets, rng):
+        """Vectorized Ghost.choose_direction for the ghosts at index"""
+        if not len(index):
+            return
+        can = self.can_move(self.x[index, None], self.y[index, None], DIRS_X, DIRS_Y)
+        valid = valid_directions(can, self.dx[index], self.dy[index])
+        keep = valid.any(-1)
+        index, valid = index[keep], valid[keep]
+        if not len(index):
+            return
+
+        # Shortest maze path from the tile ahead in each direction, one
+        # distance field per distinct target tile
+        x, y = self.x[index], self.y[index]
+        ahead = tiles_ahead((x / TILE_SIZE).astype(np.int64), (y / TILE_SIZE).astype(np.int64),
+                            self.width, self.height)
+        frightened = self.state[index] == FRIGHTENED
+        tx, ty, tiles = targets[0][index], targets[1][index], targets[2][index]
+        dist = np.full(valid.shape, UNREACHABLE, dtype=np.int32)
+        for tile in np.unique(tiles[~frightened]):
+            rows = (tiles == tile) & ~frightened
+            dist[rows] = self.distance_field(int(tile))[ahead[rows]]
+        pick = pick_directions(valid, dist, x, y, tx, ty, frightened,
+                               lambda shape: np.random.default_rng(rng.getrandbits(64)).random(shape))
+
+        self.dx[index] = DIRS_X[pick]
+        self.dy[index] = DIRS_Y[pick]
+
+    def frighten(self, duration):
+        """Ghost.set_frightened for every scattering or chasing ghost"""
+        fright = self.state < FRIGHTENED
+        if fright.any():
+            self.state[fright] = FRIGHTENED
+            self.frightened_timer[fright] = duration
+            self.speed[fright] = GHOST_FRIGHTENED_SPEED
+            self.dx[fright] = -self.dx[fright]
+            self.dy[fright] = -self.dy[fright]
+
+    def collide(self, player):
+        """check_ghost_collision over the swarm: eat frightened ghosts and
+        return the name of the ghost that caught the player, if any
+
+        Ghosts are checked in index order; the first catching ghost ends the scan.
+        """
+        reach = (PLAYER_RADIUS + GHOST_RADIUS) ** 2
+        hit = np.flatnonzero((self.x - player.x) ** 2 + (self.y - player.y) ** 2 < reach)
+        if not len(hit):
+            return None
+
+        frightened = self.state[hit] == FRIGHTENED
+        catchers = hit[~frightened]
+        eaten = hit[frightened]
+        if len(catchers):
+            eaten = eaten[eaten < catchers[0]]
+        if len(eaten):
+            self.reset_position(eaten)
+            player.score += 200 * len(eaten)
+        return GHOST_NAMES[self.personality[catchers[0]]] if len(catchers) else None
+
+    def to_bytes(self):
+        """Every ghost's state as bytes (GameState.swarm)"""
+        return HEADER.pack(self.count, self.frozen, self.mode_duration) + \
+            b"".join(getattr(self, name).tobytes() for name, _ in FIELDS)
+
+    @staticmethod
+    def count_in(data):
+        """Number of ghosts recorded by to_bytes()"""
+        return HEADER.unpack_from(data)[0]
+
+    def restore(self, data):
+        """Set every ghost's state from to_bytes() of a swarm of the same size"""
+        count, self.frozen, self.mode_duration = HEADER.unpack_from(data)
+        pos = HEADER.size
+        for name, dtype in FIELDS:
+            size = count * np.dtype(dtype).itemsize
+            getattr(self, name)[:] = np.frombuffer(data, dtype=dtype, count=count, offset=pos)
+            pos += size
+
+    def get_state(self):
+        """Views of the per-ghost arrays (do not modify)"""
+        return {
+            "x": self.x,
+            "y": self.y,
+            "state": self.state,
+            "personality": self.personality,
+        }
@@ -0,0 +1,33 @@
+"""Scrolling view onto the maze"""
+import pygame
+from src.config import *
+
+
+class Camera:
+    """Maps maze pixels to screen pixels inside a viewport.
+
+    Along each axis a maze that fits in the viewport is centred in it, so
+    the classic maze never scrolls; a bigger one scrolls to keep the
+    followed point in the middle of the view, clamped so the view never
+    runs past the maze edge.
+    """
+
+    def __init__(self, view=VIEWPORT):
+        self.view = pygame.Rect(view)
+        self.offset_x = 0
+        self.offset_y = 0
+
+    def follow(self, maze, x, y):
+        """Place maze pixel (x, y) in view; return True if the offsets changed"""
+        offset_x = self.axis_offset(self.view.x, self.view.width, maze.pixel_width, x)
+        offset_y = self.axis_offset(self.view.y, self.view.height, maze.pixel_height, y)
+        moved = (offset_x, offset_y) != (self.offset_x, self.offset_y)
+        self.offset_x, self.offset_y = offset_x, offset_y
+        return moved
+
+    @staticmethod
+    def axis_offset(start, length, size, target):
+        """Screen coordinate of maze coordinate 0 along one axis"""
+        if size <= length:
+            return start + (length - size) // 2
+        return start + min(0, max(length - size, length // 2 - int(target)))
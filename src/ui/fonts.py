@@ -0,0 +1,53 @@
+"""Shared fonts and cached text surfaces"""
+from collections import OrderedDict
+import pygame
+
+TEXT_CACHE_SIZE = 256  # rendered strings kept before the least recently used is dropped
+
+_fonts = {}
+
+
+def get_font(size, name=None):
+    """Shared pygame Font for (name, size), created on first use"""
+    font = _fonts.get((name, size))
+    if font is None:
+        font = _fonts[(name, size)] = pygame.font.Font(name, size)
+    return font
+
+
+class TextCache:
+    """LRU cache of rendered text surfaces keyed by (font, text, color)
+
+    Strings that do not change between frames (labels, menu text, a score
+    that has not moved) are rasterized once and reused.
+    """
+
+    def __init__(self, max_entries=TEXT_CACHE_SIZE):
+        self.max_entries = max_entries
+        self.surfaces = OrderedDict()
+
+    def render(self, font, text, color):
+        """Rendered (antialiased) surface for text in font and color"""
+        key = (font, text, color)
+        surface = self.surfaces.get(key)
+        if surface is not None:
+            self.surfaces.move_to_end(key)
+            return surface
+
+        surface = font.render(text, True, color)
+        self.surfaces[key] = surface
+        if len(self.surfaces) > self.max_entries:
+            self.surfaces.popitem(last=False)
+        return surface
+
+    def clear(self):
+        """Drop every cached surface"""
+        self.surfaces.clear()
+
+
+text_cache = TextCache()
+
+
+def render_text(size, text, color, name=None):
+    """Cached text surface using the shared font of the given size"""
+    return text_cache.render(get_font(size, name), text, color)
@@ -1,31 +1,62 @@
 """Menu screens"""
 import pygame
 from src.config import *
+from src.ui.fonts import get_font, text_cache
 
 class MenuManager:
     def __init__(self, screen_width, screen_height):
         self.width = screen_width
         self.height = screen_height
-        self.font_title = pygame.font.Font(None, 72)
-        self.font_large = pygame.font.Font(None, 48)
-        self.font_medium = pygame.font.Font(None, 36)
+
+        # Full-screen menus are composed once and blitted every frame after that
+        self.start_menu = None
+        self.game_over_screen = None
+        self.game_over_key = None
+        self.pause_overlay = None
+
+    # Fonts are shared and loaded on first use (see get_font)
+    @property
+    def font_title(self):
+        return get_font(72)
+
+    @property
+    def font_large(self):
+        return get_font(48)
+
+    @property
+    def font_medium(self):
+        return get_font(36)
+
+    def new_screen_surface(self):
+        """Blank surface the size of the screen, in the display's format if possible"""
+        surface = pygame.Surface((self.width, self.height))
+        if pygame.display.get_surface() is not None:
+            surface = surface.convert()
+        return surface
 
     def render_start_menu(self, screen):
         """Render start menu"""
+        if self.start_menu is None:
+            self.start_menu = self.new_screen_surface()
+            self.draw_start_menu(self.start_menu)
+        screen.blit(self.start_menu, (0, 0))
+
+    def draw_start_menu(self, screen):
+        """Draw the start menu onto a surface"""
         screen.fill(BLACK)
 
         # Title
-        title = self.font_title.render("PAC-MAN", True, NEON_YELLOW)
+        title = text_cache.render(self.font_title, "PAC-MAN", NEON_YELLOW)
         title_rect = title.get_rect(center=(self.width // 2, 200))
         screen.blit(title, title_rect)
 
         # Subtitle
-        subtitle = self.font_medium.render("Retro Futuristic Edition", True, NEON_BLUE)
+        subtitle = text_cache.render(self.font_medium, "Retro Futuristic Edition", NEON_BLUE)
         subtitle_rect = subtitle.get_rect(center=(self.width // 2, 280))
         screen.blit(subtitle, subtitle_rect)
 
         # Instructions
-        play_text = self.font_large.render("Press SPACE to Start", True, WHITE)
+        play_text = text_cache.render(self.font_large, "Press SPACE to Start", WHITE)
         play_rect = play_text.get_rect(center=(self.width // 2, 400))
         screen.blit(play_text, play_rect)
 
@@ -37,7 +68,7 @@ class MenuManager:
 
         y_offset = 500
         for control in controls:
-            text = self.font_medium.render(control, True, GRAY)
+            text = text_cache.render(self.font_medium, control, GRAY)
             text_rect = text.get_rect(center=(self.width // 2, y_offset))
             screen.blit(text, text_rect)
             y_offset += 40
@@ -45,46 +76,56 @@ class MenuManager:
     def render_pause_menu(self, screen):
         """Render pause overlay"""
         # Semi-transparent overlay
-        overlay = pygame.Surface((self.width, self.height))
-        overlay.set_alpha(128)
-        overlay.fill(BLACK)
-        screen.blit(overlay, (0, 0))
+        if self.pause_overlay is None:
+            self.pause_overlay = pygame.Surface((self.width, self.height))
+            self.pause_overlay.set_alpha(128)
+            self.pause_overlay.fill(BLACK)
+        screen.blit(self.pause_overlay, (0, 0))
 
         # Pause text
-        pause_text = self.font_title.render("PAUSED", True, NEON_YELLOW)
+        pause_text = text_cache.render(self.font_title, "PAUSED", NEON_YELLOW)
         pause_rect = pause_text.get_rect(center=(self.width // 2, self.height // 2))
         screen.blit(pause_text, pause_rect)
 
         # Resume instruction
-        resume_text = self.font_medium.render("Press P to Resume", True, WHITE)
+        resume_text = text_cache.render(self.font_medium, "Press P to Resume", WHITE)
         resume_rect = resume_text.get_rect(center=(self.width // 2, self.height // 2 + 60))
         screen.blit(resume_text, resume_rect)
 
     def render_game_over(self, screen, score, level):
         """Render game over screen"""
+        if self.game_over_key != (score, level):
+            if self.game_over_screen is None:
+                self.game_over_screen = self.new_screen_surface()
+            self.draw_game_over(self.game_over_screen, score, level)
+            self.game_over_key = (score, level)
+        screen.blit(self.game_over_screen, (0, 0))
+
+    def draw_game_over(self, screen, score, level):
+        """Draw the game over screen onto a surface"""
         screen.fill(BLACK)
 
         # Game Over text
-        game_over = self.font_title.render("GAME OVER", True, NEON_PINK)
+        game_over = text_cache.render(self.font_title, "GAME OVER", NEON_PINK)
         game_over_rect = game_over.get_rect(center=(self.width // 2, 200))
         screen.blit(game_over, game_over_rect)
 
         # Final score
-        score_text = self.font_large.render(f"Final Score: {score}", True, WHITE)
+        score_text = text_cache.render(self.font_large, f"Final Score: {score}", WHITE)
         score_rect = score_text.get_rect(center=(self.width // 2, 320))
         screen.blit(score_text, score_rect)
 
         # Level reached
-        level_text = self.font_medium.render(f"Level Reached: {level}", True, NEON_BLUE)
+        level_text = text_cache.render(self.font_medium, f"Level Reached: {level}", NEON_BLUE)
         level_rect = level_text.get_rect(center=(self.width // 2, 380))
         screen.blit(level_text, level_rect)
 
         # Restart instruction
-        restart_text = self.font_medium.render("Press SPACE to Restart", True, WHITE)
+        restart_text = text_cache.render(self.font_medium, "Press SPACE to Restart", WHITE)
         restart_rect = restart_text.get_rect(center=(self.width // 2, 500))
         screen.blit(restart_text, restart_rect)
 
         # Quit instruction
-        quit_text = self.font_medium.render("Press ESC to Quit", True, GRAY)
+        quit_text = text_cache.render(self.font_medium, "Press ESC to Quit", GRAY)
         quit_rect = quit_text.get_rect(center=(self.width // 2, 550))
         screen.blit(quit_text, quit_rect)
@@ -1,53 +1,124 @@
 """Particle system for visual effects"""
+import numpy as np
 import pygame
-import random
 from src.config import *
 
-class Particle:
-    def __init__(self, x, y, color):
-        self.x = x
-        self.y = y
-        self.vx = random.uniform(-2, 2)
-        self.vy = random.uniform(-2, 2)
-        self.color = color
-        self.life = 30  # frames
-        self.size = random.randint(2, 4)
-
-    def update(self):
-        """Update particle position"""
-        self.x += self.vx
-        self.y += self.vy
-        self.life -= 1
-        self.size = max(1, self.size - 0.1)
-
-    def is_dead(self):
-        """Check if particle should be removed"""
-        return self.life <= 0
+PARTICLE_STEP = 1.0 / 60  # seconds of real time per step of particle motion
+PARTICLE_LIFE = 30  # steps
+SPRITE_COLORKEY = (0, 0, 0)
 
-    def render(self, screen):
-        """Render particle"""
-        if self.life > 0:
-            alpha = int(255 * (self.life / 30))
-            # Pygame doesn't support per-pixel alpha easily, so we'll just draw the particle
-            pygame.draw.circle(screen, self.color, (int(self.x), int(self.y)), int(self.size))
 
 class ParticleSystem:
-    def __init__(self):
-        self.particles = []
+    """Fixed pool of particles stored as parallel NumPy arrays.
+
+    Every particle lives in a preallocated slot; emit() pops slots off a
+    free list and update() advances all of them in one vectorized pass,
+    returning expired slots to the free list. Once max_particles are alive
+    further emits are dropped, so a big burst can never outgrow the pool.
+    """
+
+    def __init__(self, max_particles=MAX_PARTICLES, seed=None):
+        self.max_particles = max_particles
+        self.rng = np.random.default_rng(seed)
+
+        self.x = np.zeros(max_particles)
+        self.y = np.zeros(max_particles)
+        self.vx = np.zeros(max_particles)
+        self.vy = np.zeros(max_particles)
+        self.life = np.zeros(max_particles, dtype=np.float32)
+        self.size = np.zeros(max_particles)
+        self.color = np.zeros(max_particles, dtype=np.uint8)
+        self.alive = np.zeros(max_particles, dtype=bool)
+
+        # Free slots as a stack: free[:free_count] are available
+        self.free = np.arange(max_particles - 1, -1, -1, dtype=np.int32)
+        self.free_count = max_particles
+        self.emit_cap = None  # most particles a single emit() spawns (None: no cap)
+
+        # Color index -> RGB, and pre-drawn circles keyed by (color index, radius)
+        self.palette = []
+        self.color_index = {}
+        self.sprites = {}
+
+    def __len__(self):
+        return self.max_particles - self.free_count
 
     def emit(self, x, y, color, count=5):
         """Emit particles"""
-        for _ in range(count):
-            self.particles.append(Particle(x, y, color))
+        if self.emit_cap is not None:
+            count = min(count, self.emit_cap)
+        count = min(count, self.free_count)
+        if count <= 0:
+            return
+
+        index = self.color_index.get(color)
+        if index is None:
+            index = self.color_index[color] = len(self.palette)
+            self.palette.append(color)
 
-    def update(self):
-        """Update all particles"""
-        for particle in self.particles[:]:
-            particle.update()
-            if particle.is_dead():
-                self.particles.remove(particle)
+        self.free_count -= count
+        slots = self.free[self.free_count:self.free_count + count]
+        rng = self.rng
+        self.x[slots] = x
+        self.y[slots] = y
+        self.vx[slots] = rng.uniform(-2, 2, count)
+        self.vy[slots] = rng.uniform(-2, 2, count)
+        self.life[slots] = PARTICLE_LIFE
+        self.size[slots] = rng.integers(2, 5, count)
+        self.color[slots] = index
+        self.alive[slots] = True
+
+    def update(self, elapsed=PARTICLE_STEP):
+        """Move all particles on by elapsed seconds of real time"""
+        if self.free_count == self.max_particles:
+            return
+
+        alive = self.alive
+        steps = elapsed / PARTICLE_STEP
+        if steps == 1.0:
+            self.x += self.vx
+            self.y += self.vy
+            self.life -= alive
+        else:
+            self.x += self.vx * steps
+            self.y += self.vy * steps
+            self.life -= alive * np.float32(steps)
+        np.maximum(self.size - 0.1 * steps, 1, out=self.size)
+
+        dead = np.flatnonzero(alive & (self.life <= 0))
+        if len(dead):
+            alive[dead] = False
+            self.free[self.free_count:self.free_count + len(dead)] = dead
+            self.free_count += len(dead)
 
     def render(self, screen):
-        """Render all particles"""
-        for particle in self.particles:
-            particle.render(screen)
+        """Render all particles and return the screen rects they cover"""
+        if self.free_count == self.max_particles:
+            return []
+
+        slots = np.flatnonzero(self.alive)
+        radius = self.size[slots].astype(np.int32)
+        xs = self.x[slots].astype(np.int32) - radius
+        ys = self.y[slots].astype(np.int32) - radius
+
+        sprites = self.sprites
+        batch = []
+        for color, r, x, y in zip(self.color[slots].tolist(), radius.tolist(),
+                                  xs.tolist(), ys.tolist()):
+            sprite = sprites.get((color, r))
+            if sprite is None:
+                sprite = sprites[(color, r)] = self.build_sprite(self.palette[color], r)
+            batch.append((sprite, (x, y)))
+        return screen.blits(batch)
+
+    def build_sprite(self, color, radius):
+        """Circle of the given color and radius on a colorkeyed surface
+
+        Drawn exactly as pygame.draw.circle would draw it centered on the
+        particle, so blitting the sprite is pixel-identical.
+        """
+        sprite = pygame.Surface((radius * 2 + 1, radius * 2 + 1))
+        sprite.fill(SPRITE_COLORKEY)
+        sprite.set_colorkey(SPRITE_COLORKEY)
+        pygame.draw.circle(sprite, color, (radius, radius), radius)
+        return sprite
@@ -0,0 +1,52 @@
+"""On-screen frame profiler readout"""
+import pygame
+from src.config import *
+from src.ui.fonts import get_font
+
+PANEL_POS = (10, 110)
+PANEL_WIDTH = 260
+LINE_HEIGHT = 16
+COLUMN_RIGHT_EDGES = (150, 202, 254)
+
+
+class ProfilerOverlay:
+    """Table of per-scope p50/p95/p99 timings drawn over the game.
+
+    The panel is recomposed every PROFILER_REFRESH frames rather than every
+    frame, so the numbers stay readable and the overlay itself costs one
+    blit most of the time.
+    """
+
+    def __init__(self):
+        self.font = get_font(18)
+        self.panel = None
+        self.frames_until_refresh = 0
+
+    def render(self, screen, profiler):
+        """Draw the panel and return the screen rect it covers"""
+        self.frames_until_refresh -= 1
+        if self.panel is None or self.frames_until_refresh <= 0:
+            self.panel = self.build_panel(profiler.stats())
+            self.frames_until_refresh = PROFILER_REFRESH
+        return screen.blit(self.panel, PANEL_POS)
+
+    def build_panel(self, stats):
+        """Compose the readout surface (milliseconds; draw calls are counts)"""
+        rows = [("scope (ms)", "p50", "p95", "p99")]
+        for name, values in stats.items():
+            rows.append((name,) + tuple(f"{value:.2f}" for value in values))
+        if not stats:
+            rows.append(("collecting...", "", "", ""))
+
+        panel = pygame.Surface((PANEL_WIDTH, LINE_HEIGHT * len(rows) + 8))
+        panel.fill(BLACK)
+        pygame.draw.rect(panel, GRAY, panel.get_rect(), 1)
+        for i, row in enumerate(rows):
+            color = NEON_YELLOW if i == 0 else WHITE
+            y = 4 + i * LINE_HEIGHT
+            panel.blit(self.font.render(row[0], True, color), (6, y))
+            # Right-align the numbers in their columns
+            for right, text in zip(COLUMN_RIGHT_EDGES, row[1:]):
+                label = self.font.render(text, True, color)
+                panel.blit(label, label.get_rect(topright=(right, y)))
+        return panel
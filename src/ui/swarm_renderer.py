@@ -0,0 +1,70 @@
+"""Drawing for swarm mode's array-driven ghosts"""
+import numpy as np
+import pygame
+from src.config import *
+from src.sim.ghost_arrays import FRIGHTENED
+
+# Sprite per personality (colours as in ghost_ai), then the two frightened flash colours
+GHOST_COLORS = (NEON_PINK, NEON_PINK, NEON_BLUE, NEON_ORANGE)
+FLASH_BLUE, FLASH_WHITE = 4, 5
+TRANSPARENT_KEY = (255, 0, 255)  # sprite background colour (no ghost is magenta)
+
+
+def ghost_sprite(color, frightened):
+    """One ghost as Ghost.render draws it, on a colour-keyed square
+
+    Colour-keyed, run-length encoded sprites blit several times faster
+    than per-pixel alpha ones.
+    """
+    r = GHOST_RADIUS
+    sprite = pygame.Surface((2 * r + 1, 2 * r + 1))
+    sprite.fill(TRANSPARENT_KEY)
+    pygame.draw.circle(sprite, color, (r, r), r)
+    eye_color = BLACK if frightened else WHITE
+    eye_size = 1 if frightened else 2
+    pygame.draw.circle(sprite, eye_color, (r - 3, r - 2), eye_size)
+    pygame.draw.circle(sprite, eye_color, (r + 3, r - 2), eye_size)
+    sprite.set_colorkey(TRANSPARENT_KEY, pygame.RLEACCEL)
+    return sprite.convert()
+
+
+class SwarmRenderer:
+    """Draws a GhostSwarm with one blits() call of pre-rendered sprites.
+
+    Ghosts outside the view are culled with one array comparison before
+    any per-ghost Python work, so a big maze costs only what is on screen.
+    """
+
+    def __init__(self):
+        self.sprites = [ghost_sprite(color, False) for color in GHOST_COLORS]
+        self.sprites += [ghost_sprite(NEON_BLUE, True), ghost_sprite(WHITE, True)]
+
+    def render(self, screen, swarm, view, offset_x, offset_y, prev=None, alpha=1.0):
+        """Draw every ghost inside view; prev is (x, y) arrays from the last tick
+        for interpolation. Returns the number of ghosts drawn."""
+        x, y = swarm.x, swarm.y
+        if prev is not None and alpha < 1.0:
+            px, py = prev
+            # Tunnel wraps and respawns jump instead of sliding across the maze
+            jump = (np.abs(x - px) > TILE_SIZE) | (np.abs(y - py) > TILE_SIZE)
+            back = np.where(jump, 0.0, 1.0 - alpha)
+            x = x - (x - px) * back
+            y = y - (y - py) * back
+
+        r = GHOST_RADIUS
+        sx = offset_x + x.astype(np.int64) - r
+        sy = offset_y + y.astype(np.int64) - r
+        shown = np.flatnonzero((sx > view.left - 2 * r) & (sx < view.right) &
+                               (sy > view.top - 2 * r) & (sy < view.bottom))
+
+        # Frightened ghosts flash between blue and white, faster near the end
+        kind = swarm.personality[shown]
+        state = swarm.state[shown]
+        timer = swarm.frightened_timer[shown]
+        flash = (timer / np.where(timer < 2000, 100, 200)).astype(np.int64) % 2
+        kind = np.where(state == FRIGHTENED, np.where(flash == 1, FLASH_BLUE, FLASH_WHITE), kind)
+
+        sprites = self.sprites
+        screen.blits([(sprites[k], (left, top)) for k, left, top in
+                      zip(kind.tolist(), sx[shown].tolist(), sy[shown].tolist())], False)
+        return len(shown)
@@ -1,13 +1,21 @@
 """Collision detection utilities"""
-import math
 
 def circle_collision(x1, y1, r1, x2, y2, r2):
     """Check collision between two circles"""
-    dist = math.sqrt((x2 - x1)**2 + (y2 - y1)**2)
-    return dist < (r1 + r2)
+    dx = x2 - x1
+    dy = y2 - y1
+    reach = r1 + r2
+    return dx * dx + dy * dy < reach * reach
+
+def check_ghost_collision(player, ghosts, grid=None):
+    """Check collisions between player and ghosts
+
+    With a SpatialHash of the ghosts only those near the player are tested;
+    an eaten ghost is re-bucketed after it jumps back to the ghost house.
+    """
+    if grid is not None:
+        ghosts = grid.query(player.x, player.y, player.radius + grid.max_radius)
 
-def check_ghost_collision(player, ghosts):
-    """Check collisions between player and ghosts"""
     for ghost in ghosts:
         if circle_collision(player.x, player.y, player.radius,
                           ghost.x, ghost.y, ghost.radius):
@@ -16,6 +24,8 @@ def check_ghost_collision(player, ghosts):
                 ghost.state = "eaten"
                 ghost.reset_position()
                 player.score += 200
+                if grid is not None:
+                    grid.move(ghost)
             elif ghost.state not in ["eaten"]:
                 # Ghost catches player
                 return ghost
@@ -0,0 +1,72 @@
+"""Adaptive frame pacing: trade visual quality for frame time under load"""
+from src.config import *
+
+# Quality levels, best first; each keeps the reductions of the levels above it
+QUALITY_LEVELS = ("full", "capped particles", "static power-ups", "slow HUD", "frame skip")
+FULL, CAPPED_PARTICLES, STATIC_POWERUPS, SLOW_HUD, FRAME_SKIP = range(len(QUALITY_LEVELS))
+SMOOTHING = 0.1  # weight of the newest frame in the cost averages
+
+
+class FrameGovernor:
+    """Steps rendering quality down when frames run over budget.
+
+    The game reports each frame's update (simulation) and render time.
+    When their smoothed sum passes QUALITY_DEGRADE_LOAD of the budget the
+    governor drops one level, and when it falls below QUALITY_RESTORE_LOAD
+    it climbs back one; a level is held for QUALITY_HOLD_FRAMES frames
+    between steps so one slow frame cannot make it flicker. Render cost is
+    averaged over rendered frames only, so skipping frames does not look
+    like headroom. The simulation is never throttled: only drawing is.
+    """
+
+    def __init__(self, budget=FRAME_BUDGET):
+        self.budget = budget
+        self.level = FULL
+        self.update_cost = 0.0  # smoothed seconds of simulation per frame
+        self.render_cost = 0.0  # smoothed seconds per rendered frame
+        self.frame = 0
+        self.held = 0  # frames since the last level change
+
+    @property
+    def name(self):
+        """Current quality level's name"""
+        return QUALITY_LEVELS[self.level]
+
+    @property
+    def load(self):
+        """Smoothed update + render time as a fraction of the budget"""
+        return (self.update_cost + self.render_cost) / self.budget
+
+    def record(self, update_time, render_time=None):
+        """Add a frame's costs (render_time None if it was not drawn) and adjust the level"""
+        self.update_cost += (update_time - self.update_cost) * SMOOTHING
+        if render_time is not None:
+            self.render_cost += (render_time - self.render_cost) * SMOOTHING
+        self.frame += 1
+        self.held += 1
+        if self.held < QUALITY_HOLD_FRAMES:
+            return
+
+        load = self.load
+        if load > QUALITY_DEGRADE_LOAD and self.level < FRAME_SKIP:
+            self.level += 1
+            self.held = 0
+        elif load < QUALITY_RESTORE_LOAD and self.level > FULL:
+            self.level -= 1
+            self.held = 0
+
+    def particle_cap(self):
+        """Most particles one effect may emit (None: no cap)"""
+        return QUALITY_PARTICLE_CAP if self.level >= CAPPED_PARTICLES else None
+
+    def animate_powerups(self):
+        """Whether power-ups pulse"""
+        return self.level < STATIC_POWERUPS
+
+    def hud_due(self):
+        """Whether this frame redraws the HUD"""
+        return self.level < SLOW_HUD or self.frame % QUALITY_HUD_INTERVAL == 0
+
+    def render_due(self):
+        """Whether this frame is drawn (the simulation runs either way)"""
+        return self.level < FRAME_SKIP or self.frame % QUALITY_RENDER_SKIP == 0
@@ -0,0 +1,112 @@
+"""Per-frame subsystem timing"""
+import csv
+import json
+import time
+import numpy as np
+from src.config import *
+
+# Named scopes, in the order they run within a frame
+SCOPES = ("player", "ghosts", "power-ups", "collisions", "level check", "particles",
+          "autopilot", "maze render", "entities", "HUD", "flip", "prefetch")
+FRAME = "frame"  # whole-frame time, recorded alongside the scopes
+PERCENTILES = (50, 95, 99)
+
+
+class FrameProfiler:
+    """Ring buffer of per-frame scope timings and draw-call counts.
+
+    Instrumented code calls mark() where a section starts and lap(name)
+    where it ends; lap() charges the time since the previous mark or lap
+    to that scope, so consecutive sections need only one call each. Code
+    holding a profiler reference checks it for None first, which is all
+    profiling costs while it is switched off.
+    """
+
+    def __init__(self, capacity=PROFILER_FRAMES):
+        self.capacity = capacity
+        self.columns = SCOPES + (FRAME,)
+        self.times = np.zeros((capacity, len(self.columns)))  # seconds
+        self.draw_calls = np.zeros(capacity, dtype=np.int32)
+        self.frames = 0  # frames recorded so far (the buffer holds the last `capacity`)
+        self.current = {}
+        self.current_draws = 0
+        self.frame_start = self.last = time.perf_counter()
+
+    def begin_frame(self):
+        """Start timing a frame"""
+        self.current = {}
+        self.current_draws = 0
+        self.frame_start = self.last = time.perf_counter()
+
+    def mark(self):
+        """Start of a timed section"""
+        self.last = time.perf_counter()
+
+    def lap(self, name):
+        """Charge the time since the last mark or lap to scope name"""
+        now = time.perf_counter()
+        self.current[name] = self.current.get(name, 0.0) + now - self.last
+        self.last = now
+
+    def count_draws(self, count):
+        """Add draw calls (blits and shape draws) issued this frame"""
+        self.current_draws += count
+
+    def end_frame(self):
+        """Store the frame's timings in the ring buffer"""
+        self.current[FRAME] = time.perf_counter() - self.frame_start
+        row = self.frames % self.capacity
+        current = self.current
+        self.times[row] = [current.get(name, 0.0) for name in self.columns]
+        self.draw_calls[row] = self.current_draws
+        self.frames += 1
+
+    def recorded(self):
+        """(times, draw_calls) of the buffered frames, oldest first"""
+        if self.frames <= self.capacity:
+            return self.times[:self.frames], self.draw_calls[:self.frames]
+        split = self.frames % self.capacity
+        return (np.concatenate((self.times[split:], self.times[:split])),
+                np.concatenate((self.draw_calls[split:], self.draw_calls[:split])))
+
+    def stats(self):
+        """{scope: (p50, p95, p99) in milliseconds}, plus draw-call percentiles"""
+        times, draws = self.recorded()
+        if not len(times):
+            return {}
+        table = np.percentile(times, PERCENTILES, axis=0) * 1000
+        stats = {name: tuple(table[:, i]) for i, name in enumerate(self.columns)}
+        stats["draw calls"] = tuple(np.percentile(draws, PERCENTILES))
+        return stats
+
+    def first_frame(self):
+        """Frame number of the oldest buffered frame"""
+        return max(0, self.frames - self.capacity)
+
+    def export_json(self, path):
+        """Write the buffered frames and summary percentiles as JSON"""
+        times, draws = self.recorded()
+        first = self.first_frame()
+        data = {
+            "unit": "ms",
+            "scopes": list(self.columns),
+            "summary": {name: dict(zip(("p50", "p95", "p99"), values))
+                        for name, values in self.stats().items()},
+            "frames": [
+                {"index": first + i, "draw_calls": int(draws[i]),
+                 **{name: round(float(ms), 4) for name, ms in zip(self.columns, row * 1000)}}
+                for i, row in enumerate(times)
+            ],
+        }
+        with open(path, "w") as f:
+            json.dump(data, f, indent=1)
+
+    def export_csv(self, path):
+        """Write one row per buffered frame (milliseconds per scope)"""
+        times, draws = self.recorded()
+        first = self.first_frame()
+        with open(path, "w", newline="") as f:
+            writer = csv.writer(f)
+            writer.writerow(("index",) + self.columns + ("draw calls",))
+            for i, row in enumerate(times):
+                writer.writerow([first + i] + [f"{ms:.4f}" for ms in row * 1000] + [int(draws[i])])
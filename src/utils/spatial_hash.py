@@ -0,0 +1,106 @@
+"""Uniform-grid spatial hash for collision broadphase"""
+from src.config import *
+
+
+class SpatialHash:
+    """Entities bucketed by the tile their center is in.
+
+    Anything with x, y (and optionally radius) attributes can be stored.
+    query() only looks at the buckets overlapping the search square, so a
+    collision check against hundreds of ghosts or items touches a handful
+    of candidates instead of every entity. Results come back in insertion
+    order, which keeps order-dependent rules (e.g. check_ghost_collision
+    eating ghosts before the next one can catch the player) unchanged.
+    """
+
+    def __init__(self, cell_size=TILE_SIZE):
+        self.cell_size = cell_size
+        self.buckets = {}
+        self.cells = {}  # entity -> bucket key
+        self.order = {}  # entity -> insertion sequence number
+        self.next_order = 0
+        self.max_radius = 0
+
+    def __len__(self):
+        return len(self.cells)
+
+    def __contains__(self, entity):
+        return entity in self.cells
+
+    def cell(self, x, y):
+        """Bucket key for a pixel position"""
+        return int(x // self.cell_size), int(y // self.cell_size)
+
+    def clear(self):
+        """Remove every entity"""
+        self.buckets.clear()
+        self.cells.clear()
+        self.order.clear()
+        self.next_order = 0
+        self.max_radius = 0
+
+    def rebuild(self, entities):
+        """Replace the contents with entities (in list order)"""
+        self.clear()
+        for entity in entities:
+            self.insert(entity)
+
+    def insert(self, entity):
+        """Add an entity at its current position"""
+        key = self.cell(entity.x, entity.y)
+        self.buckets.setdefault(key, []).append(entity)
+        self.cells[entity] = key
+        self.order[entity] = self.next_order
+        self.next_order += 1
+        self.max_radius = max(self.max_radius, getattr(entity, 'radius', 0))
+
+    def remove(self, entity):
+        """Drop an entity (no-op if it is not stored)"""
+        key = self.cells.pop(entity, None)
+        if key is None:
+            return
+        del self.order[entity]
+        bucket = self.buckets[key]
+        bucket.remove(entity)
+        if not bucket:
+            del self.buckets[key]
+
+    def move(self, entity):
+        """Re-bucket an entity after it moved; cheap when it stayed in its tile"""
+        old = self.cells.get(entity)
+        if old is None:
+            self.insert(entity)
+            return
+        key = self.cell(entity.x, entity.y)
+        if key == old:
+            return
+        bucket = self.buckets[old]
+        bucket.remove(entity)
+        if not bucket:
+            del self.buckets[old]
+        self.buckets.setdefault(key, []).append(entity)
+        self.cells[entity] = key
+
+    def sync(self, entities):
+        """Incrementally update the buckets of entities that may have moved"""
+        size = self.cell_size
+        cells = self.cells
+        for entity in entities:
+            if cells.get(entity) != (int(entity.x // size), int(entity.y // size)):
+                self.move(entity)
+
+    def query(self, x, y, reach):
+        """Entities within `reach` pixels of (x, y) on each axis, in insertion order"""
+        size = self.cell_size
+        x0, x1 = int((x - reach) // size), int((x + reach) // size)
+        y0, y1 = int((y - reach) // size), int((y + reach) // size)
+        buckets = self.buckets
+        found = []
+        for cx in range(x0, x1 + 1):
+            for cy in range(y0, y1 + 1):
+                bucket = buckets.get((cx, cy))
+                if bucket:
+                    found.extend(bucket)
+        if len(found) > 1:
+            found.sort(key=self.order.__getitem__)
+        return found
@@ -0,0 +1,333 @@
+"""Hot-path micro-benchmarks with a stored baseline
+
+Run the suite and compare against the baseline with pytest
+(tests/test_benchmarks.py), or record a new baseline on the reference
+machine with:
+
+    python -m tests.benchmarks --update-baseline
+"""
+import argparse
+import json
+import os
+import platform
+import subprocess
+import sys
+import time
+
+os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+os.environ.setdefault("SDL_AUDIODRIVER", "dummy")
+
+import pygame
+from src.config import *
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+BASELINE_PATH = os.path.join(os.path.dirname(__file__), "benchmark_baseline.json")
+RESULTS_PATH = os.path.join(os.path.dirname(__file__), "benchmark_results.json")
+DEFAULT_TOLERANCE = 1.0  # fail when more than twice as slow as the baseline
+TARGET_TIME = 0.05  # seconds per timing run
+REPEATS = 5
+
+BENCHMARKS = {}
+
+
+def benchmark(name):
+    """Register a benchmark: a factory that does the setup and returns the op to time"""
+    def register(factory):
+        BENCHMARKS[name] = factory
+        return factory
+    return register
+
+
+def get_screen():
+    """Display surface on the (dummy) video driver"""
+    pygame.init()
+    screen = pygame.display.get_surface()
+    if screen is None:
+        screen = pygame.display.set_mode((SCREEN_WIDTH, SCREEN_HEIGHT))
+    return screen
+
+
+def measure(op, target_time=TARGET_TIME, repeats=REPEATS):
+    """Best-of-`repeats` microseconds per call of op"""
+    # Calibrate the number of calls per run to roughly target_time
+    number = 1
+    while True:
+        start = time.perf_counter()
+        for _ in range(number):
+            op()
+        elapsed = time.perf_counter() - start
+        if elapsed >= target_time / 10 or number >= 1 << 20:
+            break
+        number *= 2
+    number = max(1, int(number * target_time / max(elapsed, 1e-9)))
+
+    best = float("inf")
+    for _ in range(repeats):
+        start = time.perf_counter()
+        for _ in range(number):
+            op()
+        best = min(best, (time.perf_counter() - start) / number)
+    return best * 1e6
+
+
+@benchmark("ghost_move")
+def bench_ghost_move():
+    from src.sim.simulation import Simulation
+    sim = Simulation(seed=1)
+    ghosts = sim.ghosts
+    for ghost in ghosts:
+        ghost.state = "chase"
+        ghost.update_ai(sim.player)
+
+    def op():
+        for ghost in ghosts:
+            ghost.move()
+    return op, len(ghosts)
+
+
+@benchmark("ghost_choose_direction")
+def bench_ghost_choose_direction():
+    from src.sim.simulation import Simulation
+    sim = Simulation(seed=1)
+    ghost = sim.ghosts[0]
+    ghost.x, ghost.y = 6 * TILE_SIZE + TILE_SIZE // 2, 5 * TILE_SIZE + TILE_SIZE // 2
+    ghost.state = "chase"
+    ghost.target = (sim.player.x, sim.player.y)
+    return ghost.choose_direction, 1
+
+
+@benchmark("player_update")
+def bench_player_update():
+    from src.sim.simulation import Simulation
+    sim = Simulation(seed=1)
+    player = sim.player
+    turns = [(-1, 0), (0, -1), (1, 0), (0, 1)]
+    state = {"tick": 0}
+
+    def op():
+        state["tick"] += 1
+        if state["tick"] % 40 == 0:
+            player.next_direction = turns[state["tick"] // 40 % 4]
+        player.update(SIM_DT)
+    return op, 1
+
+
+@benchmark("maze_render")
+def bench_maze_render():
+    from src.levels.maze import Maze
+    screen = get_screen()
+    maze = Maze()
+    return lambda: maze.render(screen, 50, 100), 1
+
+
+def particle_update_benchmark(count):
+    from src.ui.particles import ParticleSystem
+    particles = ParticleSystem(max_particles=count, seed=1)
+    particles.emit(400, 400, NEON_GREEN, count=count)
+    particles.life[:] = 30000  # keep every particle alive for the whole run
+    return particles.update, 1
+
+
+@benchmark("maze_generate")
+def bench_maze_generate():
+    from src.levels.generator import generate_layout
+    seeds = iter(range(1 << 30))
+    return lambda: generate_layout(next(seeds)), 1
+
+
+@benchmark("particles_update_1k")
+def bench_particles_update_1k():
+    return particle_update_benchmark(1000)
+
+
+@benchmark("particles_update_10k")
+def bench_particles_update_10k():
+    return particle_update_benchmark(10000)
+
+
+@benchmark("particles_render_1k")
+def bench_particles_render_1k():
+    from src.ui.particles import ParticleSystem
+    screen = get_screen()
+    particles = ParticleSystem(max_particles=1000, seed=1)
+    for i in range(20):
+        particles.emit(200 + i * 20, 400, NEON_GREEN if i % 2 else NEON_YELLOW, count=50)
+    return lambda: particles.render(screen), 1
+
+
+@benchmark("hud_render")
+def bench_hud_render():
+    from src.ui.hud import HUD
+    from src.entities.player import Player
+    from src.levels.maze import Maze
+    screen = get_screen()
+    hud = HUD(SCREEN_WIDTH, SCREEN_HEIGHT)
+    player = Player(0, 0, Maze())
+    player.powered_up = True
+    player.power_timer = POWER_PELLET_DURATION / 2
+    state = {"frame": 0}
+
+    def op():
+        state["frame"] += 1
+        player.score = state["frame"] // 6 * 10  # score changes every few frames
+        hud.render(screen, player, 3, 2)
+    return op, 1
+
+
+@benchmark("game_frame")
+def bench_game_frame():
+    from src.game import Game
+    get_screen()
+    game = Game()
+    game.start_game()
+
+    def op():
+        if game.state != "playing":
+            game.restart_game()
+        game.update()
+        game.render()
+    return op, 1
+
+
+@benchmark("sim_tick")
+def bench_sim_tick():
+    from src.sim.simulation import Simulation
+    sim = Simulation(seed=7)
+    script = [4, 1, 3, 2]  # right, up, left, down
+
+    def op():
+        # Scripted game: turn every 40 ticks, start over on game over
+        if sim.game_over:
+            sim.reset(7)
+        sim.step(script[sim.tick // 40 % 4] if sim.tick % 40 == 0 else None)
+    return op, 1
+
+
+@benchmark("env_step")
+def bench_env_step():
+    from src.sim.env import PacmanEnv
+    env = PacmanEnv()
+    env.reset(7)
+    script = [4, 1, 3, 2]  # right, up, left, down
+
+    def op():
+        tick = env.sim.tick
+        _, _, terminated, truncated, _ = env.step(script[tick // 40 % 4] if tick % 40 == 0 else None)
+        if terminated or truncated:
+            env.reset(7)
+    return op, 1
+
+
+@benchmark("autopilot_expand")
+def bench_autopilot_expand():
+    from src.sim.simulation import Simulation
+    from src.sim.autopilot import Autopilot, MOVES
+    sim = Simulation(seed=7)
+    autopilot = Autopilot()
+    autopilot.direction(sim)
+    node = autopilot.root
+    moves = iter(MOVES * (1 << 20))
+
+    def op():
+        # One search node: a move's worth of ticks on the model, then the evaluation
+        autopilot.expand(node, next(moves))
+    return op, 1
+
+
+@benchmark("swarm_update_1k")
+def bench_swarm_update_1k():
+    from src.sim.simulation import Simulation
+    sim = Simulation(seed=7, swarm=1000)
+    swarm, player, rng = sim.swarm, sim.player, sim.rng
+    player.direction = (1, 0)
+    return lambda: swarm.update(SIM_DT, player, rng), 1
+
+
+@benchmark("swarm_render_1k")
+def bench_swarm_render_1k():
+    from src.sim.simulation import Simulation
+    from src.ui.swarm_renderer import SwarmRenderer
+    screen = get_screen()
+    sim = Simulation(seed=7, swarm=1000)
+    renderer = SwarmRenderer()
+    view = pygame.Rect(VIEWPORT)
+    return lambda: renderer.render(screen, sim.swarm, view, 50, 112), 1
+
+
+# Fresh interpreter up to the start menu's first frame
+COLD_START_SCRIPT = """
+from src.game import Game
+game = Game()
+game.render()
+"""
+
+
+@benchmark("cold_start")
+def bench_cold_start():
+    env = dict(os.environ, SDL_VIDEODRIVER="dummy", SDL_AUDIODRIVER="dummy",
+               PYGAME_HIDE_SUPPORT_PROMPT="1")
+    command = [sys.executable, "-c", COLD_START_SCRIPT]
+    return lambda: subprocess.run(command, cwd=ROOT, env=env, check=True), 1
+
+
+def run_benchmark(name):
+    """Microseconds per unit of work for one registered benchmark"""
+    op, units = BENCHMARKS[name]()
+    return measure(op) / units
+
+
+def load_baseline(path=BASELINE_PATH):
+    """Baseline results ({name: microseconds}), empty if there is none"""
+    if not os.path.exists(path):
+        return {}
+    with open(path) as f:
+        return json.load(f)["results"]
+
+
+def write_results(results, path):
+    """Write results with a description of the machine that produced them"""
+    data = {
+        "unit": "microseconds per op",
+        "machine": {
+            "python": platform.python_version(),
+            "pygame": pygame.version.ver,
+            "platform": platform.platform(),
+            "processor": platform.processor() or platform.machine(),
+        },
+        "results": {name: round(value, 3) for name, value in sorted(results.items())},
+    }
+    with open(path, "w") as f:
+        json.dump(data, f, indent=2)
+        f.write("\n")
+
+
+def tolerance():
+    """Allowed slowdown over baseline (PACMAN_BENCH_TOLERANCE, e.g. 0.5 = 50%)"""
+    return float(os.environ.get("PACMAN_BENCH_TOLERANCE", DEFAULT_TOLERANCE))
+
+
+def main():
+    """Command line entry point: python -m tests.benchmarks"""
+    parser = argparse.ArgumentParser(description="Run the hot-path benchmarks")
+    parser.add_argument("names", nargs="*", help="benchmarks to run (default: all)")
+    parser.add_argument("--update-baseline", action="store_true",
+                        help=f"write results to {os.path.relpath(BASELINE_PATH)}")
+    args = parser.parse_args()
+
+    baseline = load_baseline()
+    results = {}
+    for name in args.names or BENCHMARKS:
+        results[name] = run_benchmark(name)
+        base = baseline.get(name)
+        change = f"{(results[name] / base - 1) * 100:+6.1f}%" if base else "   new"
+        print(f"{name:24s} {results[name]:10.2f} us  {change}")
+
+    path = BASELINE_PATH if args.update_baseline else RESULTS_PATH
+    if args.update_baseline:
+        results = {**baseline, **results}
+    write_results(results, path)
+    print(f"wrote {os.path.relpath(path)}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,29 @@
+"""Shared pytest setup
+
+The benchmark regression check times code against a baseline recorded on
+one machine, so it only runs when asked for with `-m benchmark`; plain
+`pytest` runs the deterministic tests.
+
+pygame is pointed at the dummy video and audio drivers before any test
+module imports it, so the suite runs without a display or sound card.
+"""
+import os
+
+os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+os.environ.setdefault("SDL_AUDIODRIVER", "dummy")
+
+import pytest
+
+
+def pytest_configure(config):
+    config.addinivalue_line(
+        "markers", "benchmark: wall-clock check against the stored baseline (run with -m benchmark)")
+
+
+def pytest_collection_modifyitems(config, items):
+    if "benchmark" in config.getoption("markexpr"):
+        return
+    skip = pytest.mark.skip(reason="timing check against the baseline; run with -m benchmark")
+    for item in items:
+        if "benchmark" in item.keywords:
+            item.add_marker(skip)
@@ -0,0 +1,62 @@
+"""Drive Game.run_async headlessly under a local asyncio event loop"""
+import asyncio
+
+import pygame
+from src.config import FPS
+from src.game import Game
+
+TIMEOUT = 10  # seconds before a stuck loop fails the test
+RUN_TIME = 0.25  # seconds of frames in the pacing test
+
+
+def post_key(key):
+    pygame.event.post(pygame.event.Event(pygame.KEYDOWN, key=key, mod=0, unicode=""))
+
+
+async def wait_until(condition):
+    """Yield to the event loop until condition() holds"""
+    while not condition():
+        await asyncio.sleep(0.005)
+
+
+def test_async_loop_plays_and_quits():
+    game = Game()
+
+    async def drive():
+        loop = asyncio.ensure_future(game.run_async())
+
+        # The loop yields every frame, so this coroutine runs alongside it and
+        # the world is preloaded while the start menu is up
+        await wait_until(lambda: game._sim is not None and game._hud is not None)
+        assert game.state == "menu"
+
+        post_key(pygame.K_SPACE)
+        await wait_until(lambda: game.state == "playing" and game.sim.tick >= 30)
+
+        pygame.event.post(pygame.event.Event(pygame.QUIT))
+        await loop
+
+    asyncio.run(asyncio.wait_for(drive(), TIMEOUT))
+    assert not game.running
+
+
+def test_async_loop_paces_frames():
+    game = Game()
+    game.start_game()
+    frames = []
+    frame = game.frame
+
+    def counted(frame_time):
+        frames.append(frame_time)
+        frame(frame_time)
+    game.frame = counted
+
+    async def drive():
+        loop = asyncio.ensure_future(game.run_async())
+        await asyncio.sleep(RUN_TIME)
+        game.running = False
+        await loop
+
+    asyncio.run(asyncio.wait_for(drive(), TIMEOUT))
+    # About FPS frames a second: paced, not spinning and not stalled
+    assert RUN_TIME * FPS / 3 <= len(frames) <= RUN_TIME * FPS * 1.5 + 2
@@ -0,0 +1,58 @@
+"""Autopilot search: state keys and the per-call time budget"""
+import struct
+import time
+
+from src.sim.autopilot import Autopilot, outcome
+from src.sim.simulation import Simulation
+from src.sim.state import PLAYER, PLAYER_NEXT_DIRECTION, pack_player
+
+TICKS = 120  # ticks of autopilot play in the decide test
+
+
+def test_next_direction_bytes_follow_player_layout():
+    player = Simulation(seed=1).player
+    player.next_direction = (1, 0)
+    before = pack_player(player)
+    player.next_direction = (0, -1)
+    after = pack_player(player)
+
+    changed = [i for i in range(PLAYER.size) if before[i] != after[i]]
+    assert changed and all(PLAYER_NEXT_DIRECTION.start <= i < PLAYER_NEXT_DIRECTION.stop for i in changed)
+    assert struct.unpack("<bb", after[PLAYER_NEXT_DIRECTION]) == (0, -1)
+
+
+def test_outcome_ignores_only_the_buffered_turn():
+    sim = Simulation(seed=1)
+    sim.player.next_direction = (1, 0)
+    first = sim.snapshot()
+    sim.player.next_direction = (-1, 0)
+    turned = sim.snapshot()
+    sim.player.direction = (0, 1) if sim.player.direction != (0, 1) else (0, -1)
+    moved = sim.snapshot()
+
+    assert first.player != turned.player
+    assert outcome(first) == outcome(turned)
+    assert outcome(turned) != outcome(moved)
+
+
+def test_direction_never_searches():
+    sim = Simulation(seed=2)
+    autopilot = Autopilot()
+    for _ in range(TICKS):
+        nodes = autopilot.nodes
+        if sim.death_timer <= 0:
+            sim.player.next_direction = autopilot.direction(sim)
+        assert autopilot.nodes == nodes
+        sim.step()
+        autopilot.think()
+    assert autopilot.nodes > 0
+
+
+def test_think_skips_an_expansion_it_cannot_afford():
+    sim = Simulation(seed=3)
+    autopilot = Autopilot()
+    autopilot.direction(sim)
+    autopilot.expand_cost = 1.0  # as if the last expansion took a second
+    start = time.perf_counter()
+    assert autopilot.think(0.001) == 0
+    assert time.perf_counter() - start < 0.5
@@ -0,0 +1,64 @@
+"""BatchSimulation plays by the same rules as Simulation"""
+import random
+
+import numpy as np
+from src.sim.batch import BatchSimulation
+from src.sim.simulation import Simulation
+from src.sim.state import GHOST_STATE_INDEX
+
+GAMES = 4
+MAX_TICKS = 3000
+MIN_TICKS = 600  # the comparison must cover at least this many ticks
+
+
+def random_effects(sim):
+    """Whether sim has reached something BatchSimulation plays differently:
+    power-ups (not simulated) or frightened ghosts (random turns)"""
+    return (sim.powerup_manager.powerups or sim.player.powered_up or
+            any(ghost.state == "frightened" for ghost in sim.ghosts))
+
+
+def test_batch_matches_simulation_tick_for_tick():
+    batch = BatchSimulation(GAMES, seed=0)
+    sims = [Simulation(seed=i, swarm=0) for i in range(GAMES)]
+    rng = random.Random(1)
+    for tick in range(MAX_TICKS):
+        actions = [rng.randrange(5) if rng.random() < 0.1 else 0 for _ in range(GAMES)]
+        state = batch.step(np.array(actions))
+        for i, sim in enumerate(sims):
+            sim.step(actions[i])
+            assert state["player_x"][i] == sim.player.x and state["player_y"][i] == sim.player.y
+            assert state["score"][i] == sim.player.score and state["lives"][i] == sim.player.lives
+            assert np.allclose(state["ghost_x"][i], [ghost.x for ghost in sim.ghosts])
+            assert np.allclose(state["ghost_y"][i], [ghost.y for ghost in sim.ghosts])
+            assert list(state["ghost_state"][i]) == [GHOST_STATE_INDEX[ghost.state] for ghost in sim.ghosts]
+        if any(random_effects(sim) for sim in sims):
+            break
+    assert tick >= MIN_TICKS
+    assert any(sim.player.lives < 3 for sim in sims)  # deaths and respawns were covered
+
+
+def test_clearing_the_level_truncates_the_game():
+    batch = BatchSimulation(2, seed=0)
+    # One pellet left, two tiles left of the player's start
+    row = 23
+    batch.pellets[0][batch.pellets[0] != 0] = 3
+    batch.pellets[0, row, 12] = 1
+    batch.pellets_remaining[0] = 1
+
+    left = 3  # ACTIONS index
+    for _ in range(120):
+        state = batch.step(np.array([left, left]))
+        if state["truncated"][0]:
+            break
+    assert state["truncated"][0] and not state["truncated"][1]
+    assert state["score"][0] == 10 + 1000 and state["level"][0] == 1
+    assert not state["game_over"][0]
+
+    frozen = (state["tick"][0], state["player_x"][0], state["score"][0])
+    state = batch.step(np.array([left, left]))
+    assert (state["tick"][0], state["player_x"][0], state["score"][0]) == frozen
+
+    state = batch.reset(state["truncated"])
+    assert not state["truncated"][0] and state["score"][0] == 0
+    assert state["pellets_remaining"][0] == batch.total_pellets
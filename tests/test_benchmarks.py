@@ -0,0 +1,36 @@
+"""Fail when a hot path regresses beyond tolerance of the stored baseline
+
+Tolerance is PACMAN_BENCH_TOLERANCE (default 1.0, i.e. twice as slow).
+Latest numbers are written to tests/benchmark_results.json. Timings
+depend on the host, so these only run with `pytest -m benchmark`.
+"""
+import pytest
+from tests.benchmarks import (BENCHMARKS, RESULTS_PATH, load_baseline, run_benchmark,
+                              tolerance, write_results)
+
+BASELINE = load_baseline()
+
+pytestmark = pytest.mark.benchmark
+
+
+@pytest.fixture(scope="module")
+def results():
+    collected = {}
+    yield collected
+    if collected:
+        write_results(collected, RESULTS_PATH)
+
+
+@pytest.mark.parametrize("name", list(BENCHMARKS))
+def test_benchmark(name, results):
+    elapsed = run_benchmark(name)
+    results[name] = elapsed
+
+    baseline = BASELINE.get(name)
+    if baseline is None:
+        pytest.skip(f"no baseline for {name} (python -m tests.benchmarks --update-baseline)")
+
+    limit = baseline * (1 + tolerance())
+    assert elapsed <= limit, (
+        f"{name}: {elapsed:.2f} us per op, baseline {baseline:.2f} us "
+        f"(limit {limit:.2f} us at tolerance {tolerance():.0%})")
@@ -0,0 +1,40 @@
+"""Dirty-rect rendering draws the same screen as a full redraw"""
+import random
+
+import numpy as np
+import pygame
+from src.config import SIM_DT
+from src.game import Game
+
+FRAMES = 900
+CHECK_EVERY = 15  # frames between comparisons with a full redraw
+LEVEL_UP_AT = 450  # frame at which the level is cleared, for a maze change mid-run
+DIRECTIONS = [(1, 0), (-1, 0), (0, 1), (0, -1)]
+
+
+def test_dirty_rects_match_full_redraw():
+    game = Game()
+    game.governor = None  # full quality throughout, whatever the machine's speed
+    game.dirty_rendering = True
+    game.seed = 5
+    game.start_game()
+    rng = random.Random(1)
+    checked = 0
+    for frame in range(FRAMES):
+        if game.state != "playing":
+            break
+        if rng.random() < 0.05:
+            game.player.next_direction = rng.choice(DIRECTIONS)
+        if frame == LEVEL_UP_AT:
+            game.sim.level_complete()
+        game.update()
+        game.particle_time += SIM_DT
+        game.render()
+        if frame % CHECK_EVERY == 0:
+            dirty = pygame.surfarray.array3d(game.screen)
+            game.needs_full_redraw = True
+            game.render()
+            assert np.array_equal(dirty, pygame.surfarray.array3d(game.screen)), f"frame {frame}"
+            checked += 1
+    assert checked == FRAMES // CHECK_EVERY
+    assert game.player.score > 0 and game.level_manager.current_level == 2
@@ -0,0 +1,80 @@
+"""Gym-style envs: in-place observations match ones built from scratch"""
+import random
+
+import numpy as np
+import pytest
+from src.config import TILE_SIZE
+from src.sim.env import (GHOSTS, PELLETS, PLAYER, POWER_PELLETS, POWERUPS, WALLS,
+                         PacmanEnv, VectorPacmanEnv)
+from src.sim.state import GHOST_STATE_INDEX
+
+SIZE = (30, 33)  # room for the first two generated mazes; the third does not fit
+STEPS = 1500
+LEVEL_UP_EVERY = 250  # steps between forced level clears
+
+
+def rebuild(env):
+    """env's observation computed from scratch"""
+    sim, maze = env.sim, env.sim.maze
+    obs = np.zeros_like(env.observation)
+    obs[WALLS] = 1
+    if maze.width > env.width or maze.height > env.height:
+        return obs
+    tiles = maze.as_array()
+    h, w = tiles.shape
+    obs[WALLS, :h, :w] = tiles == 0
+    obs[PELLETS, :h, :w] = tiles == 1
+    obs[POWER_PELLETS, :h, :w] = tiles == 2
+
+    def add(channel, x, y):
+        obs[channel, min(int(y // TILE_SIZE), h - 1), min(int(x // TILE_SIZE), w - 1)] += 1
+
+    add(PLAYER, sim.player.x, sim.player.y)
+    for ghost in sim.ghosts:
+        add(GHOSTS + GHOST_STATE_INDEX[ghost.state], ghost.x, ghost.y)
+    for powerup in sim.powerup_manager.powerups:
+        add(POWERUPS, powerup.x, powerup.y)
+    if sim.swarm is not None:
+        for x, y, state in zip(sim.swarm.x, sim.swarm.y, sim.swarm.state):
+            add(GHOSTS + int(state), x, y)
+    return obs
+
+
+@pytest.mark.parametrize("swarm", [0, 30])
+def test_observation_matches_rebuild(swarm):
+    env = PacmanEnv(size=SIZE, swarm=swarm)
+    obs, _ = env.reset(3)
+    assert np.array_equal(obs, rebuild(env))
+    rng = random.Random(1)
+    levels = set()
+    truncated_once = False
+    for step in range(1, STEPS + 1):
+        if step % LEVEL_UP_EVERY == 0:
+            env.sim.level_complete()
+        obs, _, terminated, truncated, info = env.step(rng.randrange(5) if rng.random() < 0.1 else None)
+        assert obs is env.observation
+        assert np.array_equal(obs, rebuild(env)), f"step {step}"
+        levels.add(info["level"])
+        if terminated or truncated:
+            truncated_once = truncated_once or truncated
+            env.reset()
+    assert levels >= {1, 2, 3} and truncated_once
+
+
+def test_vector_env_matches_single_envs():
+    count = 4
+    vector = VectorPacmanEnv(count, max_steps=300, swarm=20)
+    vector.reset(seed=10)
+    singles = [PacmanEnv(max_steps=300, swarm=20) for _ in range(count)]
+    for i, env in enumerate(singles):
+        env.reset(10 + i)
+    rng = random.Random(0)
+    for _ in range(700):
+        actions = [rng.randrange(5) for _ in range(count)]
+        obs, rewards, terminated, truncated, _ = vector.step(actions)
+        for i, env in enumerate(singles):
+            single_obs, reward, single_terminated, single_truncated, _ = env.step(actions[i])
+            if single_terminated or single_truncated:
+                env.reset()
+            assert np.array_equal(obs[i], single_obs)
+            assert (rewards[i], terminated[i], truncated[i]) == (reward, single_terminated, single_truncated)
@@ -0,0 +1,55 @@
+"""Generated mazes: size, symmetry, connectivity and no dead ends"""
+import pytest
+from src.levels.generator import generate_layout
+
+SIZES = [(28, 31), (30, 33), (48, 51), (100, 77)]
+SEEDS = range(5)
+
+
+def open_neighbours(layout, x, y):
+    """Open tiles next to (x, y); rows open at both edges wrap around"""
+    height, width = len(layout), len(layout[0])
+    for dx, dy in ((0, -1), (0, 1), (-1, 0), (1, 0)):
+        nx, ny = (x + dx) % width, y + dy
+        if 0 <= ny < height and layout[ny][nx] != 0:
+            yield nx, ny
+
+
+@pytest.mark.parametrize("size", SIZES)
+@pytest.mark.parametrize("seed", SEEDS)
+def test_layout_invariants(seed, size):
+    width, height = size
+    layout = generate_layout(seed, width, height)
+    assert len(layout) == height and all(len(row) == width for row in layout)
+    assert all(list(row) == list(row)[::-1] for row in layout)
+    assert sum(row.count(2) for row in layout) == 4
+
+    # Closed border apart from tunnel mouths
+    assert not any(layout[0]) and not any(layout[-1])
+    assert all((row[0] == 0) == (row[-1] == 0) for row in layout)
+
+    tiles = {(x, y) for y, row in enumerate(layout) for x, tile in enumerate(row) if tile != 0}
+    for x, y in tiles:
+        assert len(list(open_neighbours(layout, x, y))) >= 2, f"dead end at {(x, y)}"
+
+    start = next(iter(tiles))
+    seen = {start}
+    frontier = [start]
+    while frontier:
+        x, y = frontier.pop()
+        for tile in open_neighbours(layout, x, y):
+            if tile not in seen:
+                seen.add(tile)
+                frontier.append(tile)
+    assert seen == tiles
+
+
+def test_same_seed_same_maze():
+    assert generate_layout(3, 40, 43) == generate_layout(3, 40, 43)
+    assert generate_layout(3, 40, 43) != generate_layout(4, 40, 43)
+
+
+@pytest.mark.parametrize("size", [(29, 31), (26, 31), (28, 30)])
+def test_bad_sizes_are_rejected(size):
+    with pytest.raises(ValueError):
+        generate_layout(0, *size)
@@ -0,0 +1,77 @@
+"""FrameGovernor: quality steps down under load and back up with headroom"""
+from src.config import (QUALITY_DEGRADE_LOAD, QUALITY_HOLD_FRAMES, QUALITY_PARTICLE_CAP,
+                        QUALITY_RESTORE_LOAD)
+from src.utils.governor import (CAPPED_PARTICLES, FRAME_SKIP, FULL, QUALITY_LEVELS, SLOW_HUD,
+                                STATIC_POWERUPS, FrameGovernor)
+
+BUDGET = 1 / 60
+HEAVY = BUDGET * 2  # a frame far over budget
+LIGHT = BUDGET * QUALITY_RESTORE_LOAD / 4  # a frame with plenty of headroom
+SETTLE = 200  # frames for the smoothed cost to settle on a new value
+
+
+def run(governor, frames, update_time, render_time=0.0):
+    """Record frames of the given costs; returns the levels seen after each"""
+    levels = []
+    for _ in range(frames):
+        governor.record(update_time, render_time if governor.render_due() else None)
+        levels.append(governor.level)
+    return levels
+
+
+def test_steps_down_one_level_per_hold():
+    governor = FrameGovernor(BUDGET)
+    levels = run(governor, QUALITY_HOLD_FRAMES * len(QUALITY_LEVELS) * 2, HEAVY / 2, HEAVY / 2)
+    assert levels[-1] == FRAME_SKIP
+    steps = [i for i in range(1, len(levels)) if levels[i] != levels[i - 1]]
+    assert all(levels[i] == levels[i - 1] + 1 for i in steps)
+    assert all(b - a >= QUALITY_HOLD_FRAMES for a, b in zip(steps, steps[1:]))
+
+
+def test_steps_back_up_with_headroom():
+    governor = FrameGovernor(BUDGET)
+    run(governor, SETTLE, HEAVY / 2, HEAVY / 2)
+    assert governor.level == FRAME_SKIP
+    levels = run(governor, SETTLE, LIGHT / 2, LIGHT / 2)
+    assert levels[-1] == FULL
+    assert all(b in (a, a - 1) for a, b in zip(levels, levels[1:]))
+
+
+def test_holds_between_thresholds():
+    middle = BUDGET * (QUALITY_DEGRADE_LOAD + QUALITY_RESTORE_LOAD) / 2
+    governor = FrameGovernor(BUDGET)
+    governor.level = STATIC_POWERUPS
+    governor.update_cost = governor.render_cost = middle / 2
+    assert set(run(governor, SETTLE, middle / 2, middle / 2)) == {STATIC_POWERUPS}
+
+
+def test_skipped_frames_are_not_headroom():
+    governor = FrameGovernor(BUDGET)
+    run(governor, SETTLE, BUDGET * 0.1, HEAVY)
+    assert governor.level == FRAME_SKIP
+    assert set(run(governor, SETTLE, BUDGET * 0.1, HEAVY)) == {FRAME_SKIP}
+
+
+def test_reductions_by_level():
+    governor = FrameGovernor(BUDGET)
+    expected = {
+        FULL: (None, True, True),
+        CAPPED_PARTICLES: (QUALITY_PARTICLE_CAP, True, True),
+        STATIC_POWERUPS: (QUALITY_PARTICLE_CAP, False, True),
+        SLOW_HUD: (QUALITY_PARTICLE_CAP, False, False),
+        FRAME_SKIP: (QUALITY_PARTICLE_CAP, False, False),
+    }
+    for level, (cap, animate, every_hud) in expected.items():
+        governor.level = level
+        huds = []
+        for frame in range(1, 61):
+            governor.frame = frame
+            huds.append(governor.hud_due())
+        assert governor.particle_cap() == cap
+        assert governor.animate_powerups() == animate
+        assert all(huds) == every_hud and any(huds)
+        renders = []
+        for frame in range(1, 61):
+            governor.frame = frame
+            renders.append(governor.render_due())
+        assert all(renders) == (level < FRAME_SKIP) and any(renders)
@@ -0,0 +1,22 @@
+"""Frame profiler: every instrumented section has a column"""
+import pathlib
+import re
+
+from src.utils.profiler import SCOPES, FrameProfiler
+
+SRC = pathlib.Path(__file__).resolve().parent.parent / "src"
+
+
+def test_every_lap_is_a_scope():
+    laps = {name for path in SRC.rglob("*.py")
+            for name in re.findall(r'\.lap\("([^"]+)"\)', path.read_text())}
+    assert laps and laps <= set(SCOPES)
+
+
+def test_prefetch_time_is_reported():
+    profiler = FrameProfiler(capacity=4)
+    profiler.begin_frame()
+    profiler.mark()
+    profiler.lap("prefetch")
+    profiler.end_frame()
+    assert "prefetch" in profiler.stats()
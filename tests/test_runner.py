@@ -0,0 +1,22 @@
+"""BatchRunner: per-game seeds and results do not depend on the worker count"""
+import random
+
+from src.sim.runner import BatchRunner
+
+GAMES = 6
+SEED = 42
+MAX_TICKS = 600
+
+
+def run(workers):
+    runner = BatchRunner(GAMES, workers=workers, seed=SEED, max_ticks=MAX_TICKS, chunksize=1)
+    return sorted(runner.run(), key=lambda result: result["game"])
+
+
+def test_results_match_for_any_worker_count():
+    single = run(1)
+    assert [result["game"] for result in single] == list(range(GAMES))
+    assert [result["seed"] for result in single] == [
+        random.Random(f"{SEED}:{index}").getrandbits(63) for index in range(GAMES)]
+    assert len({result["score"] for result in single}) > 1  # the seeds do differ
+    assert run(2) == single
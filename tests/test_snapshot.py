@@ -0,0 +1,56 @@
+"""Snapshots: restoring one carries on exactly as the original game did"""
+import random
+
+import pytest
+from src.sim.simulation import Simulation
+from src.sim.state import GameState
+
+WARMUP = 400  # ticks played before the snapshot
+FOLLOW = 400  # ticks both games play after it
+SWARM = 200
+
+
+def play(sim, ticks, seed):
+    """Step sim with ticks of seeded random actions"""
+    rng = random.Random(seed)
+    for _ in range(ticks):
+        sim.step(rng.randrange(5) if rng.random() < 0.1 else None)
+
+
+@pytest.mark.parametrize("swarm", [0, SWARM])
+def test_restore_continues_identically(swarm):
+    sim = Simulation(seed=7, swarm=swarm)
+    play(sim, WARMUP, seed=1)
+    state = sim.snapshot()
+
+    copy = Simulation(seed=99, swarm=swarm)
+    play(copy, 50, seed=2)
+    copy.restore(state)
+    assert copy.snapshot() == state
+
+    play(sim, FOLLOW, seed=3)
+    play(copy, FOLLOW, seed=3)
+    assert copy.snapshot() == sim.snapshot()
+    if swarm:
+        assert (copy.swarm.x == sim.swarm.x).all() and (copy.swarm.state == sim.swarm.state).all()
+
+
+@pytest.mark.parametrize("swarm", [0, SWARM])
+def test_bytes_round_trip(swarm):
+    sim = Simulation(seed=8, swarm=swarm)
+    play(sim, WARMUP, seed=1)
+    state = sim.snapshot()
+    assert GameState.from_bytes(state.to_bytes()) == state
+
+
+def test_restore_across_a_level_change():
+    sim = Simulation(seed=5, swarm=SWARM)
+    play(sim, WARMUP, seed=1)
+    state = sim.snapshot()
+    sim.level_complete()
+    next_level = sim.snapshot()
+
+    sim.restore(state)
+    assert sim.snapshot() == state
+    sim.level_complete()
+    assert sim.snapshot() == next_level